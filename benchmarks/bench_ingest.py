@@ -0,0 +1,60 @@
+import random
+
+from benchmarks.harness import bench
+from utils.codec import encode_binary, encode_json
+from utils.ingest import POLICIES, IngestQueue, MqttIngestService
+
+BATCH = 1000
+
+
+def _payloads(encode):
+    return [encode({"id": f"Pod-{random.randint(1, 6)}", "speed": random.randint(600, 1200),
+                    "battery": random.randint(20, 100),
+                    "status": random.choice(["Operational", "Maintenance", "Docked"])})
+            for _ in range(BATCH)]
+
+
+@bench("ingest.on_message_to_drain", params=["json", "binary"], items=BATCH)
+def on_message_to_drain(fmt):
+    # Network-thread decode + ring append, then one session draining its cursor
+    service  = MqttIngestService(capacity=BATCH)
+    payloads = _payloads(encode_binary if fmt == "binary" else encode_json)
+    cursor   = service.ring.head
+
+    def call():
+        nonlocal cursor
+        for payload in payloads:
+            service.handle_payload(payload)
+        _, cursor, _ = service.read_since(cursor)
+    return call
+
+
+@bench("ingest.fan_out_sessions", params=[1, 10, 50], items=BATCH)
+def fan_out_sessions(sessions):
+    # Decode cost is paid once; each extra viewer only walks its cursor
+    service  = MqttIngestService(capacity=BATCH)
+    payloads = _payloads(encode_json)
+    cursors  = [service.ring.head] * sessions
+
+    def call():
+        for payload in payloads:
+            service.handle_payload(payload)
+        for i in range(sessions):
+            _, cursors[i], _ = service.read_since(cursors[i])
+    return call
+
+
+@bench("ingest.queue_policy", params=list(POLICIES), items=BATCH)
+def queue_policy(policy):
+    # Network-thread put + consumer drain of one burst through a queue a
+    # tenth its size (block never fills here: it is drained in between)
+    queue   = IngestQueue(BATCH // 10, policy)
+    records = [(f"Pod-{i % 50}", i) for i in range(BATCH)]
+
+    def call():
+        for pod_id, record in records:
+            queue.put(record, pod_id)
+            if policy == "block" and len(queue) == queue.capacity:
+                queue.get_batch()
+        queue.get_batch(BATCH, timeout=0)
+    return call
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import bench
+from utils.logger import BatchWriter, CsvSink
+from utils.store import RollupStore
+
+ROW = {"id": "Pod-1", "speed": 845, "battery": 81, "status": "Docked", "received_at": "13:00:47"}
+
+
+def log_to_csv(file, data):
+    # The original logger, before BatchWriter: one DataFrame build and file
+    # open per row
+    df = pd.DataFrame([data])
+    if os.path.exists(file):
+        df.to_csv(file, mode="a", header=False, index=False)
+    else:
+        df.to_csv(file, index=False)
+
+
+@bench("logging.log_to_csv", items=100)
+def legacy_log_to_csv(_):
+    tmp  = tempfile.mkdtemp()
+    path = os.path.join(tmp, "hyperloop_logs.csv")
+
+    def call():
+        for _ in range(100):
+            log_to_csv(path, ROW)
+
+    call.teardown = lambda: shutil.rmtree(tmp)
+    return call
+
+
+@bench("logging.batch_writer", items=10_000)
+def batch_writer(_):
+    tmp    = tempfile.mkdtemp()
+    writer = BatchWriter(CsvSink(os.path.join(tmp, "log.csv")), max_batch=1000)
+
+    def call():
+        for _ in range(10_000):
+            writer.write(ROW)
+        writer.flush()
+
+    def teardown():
+        writer.close()
+        shutil.rmtree(tmp)
+    call.teardown = teardown
+    return call
+
+
+@bench("logging.day_view", params=["raw_csv", "rollup_uncompacted", "rollup_store"], repeat=3,
+       min_time=0.0)
+def day_view(source):
+    # One pod's day at 1 min resolution from a day of 1 Hz logs for 6 pods:
+    # re-aggregating the raw CSV vs reading the persisted 1 min rollups as
+    # the 10 s rollup writer leaves them, with today's partition never
+    # merged or merged every 10 min of data like the live store does
+    tmp   = tempfile.mkdtemp()
+    start = datetime(2026, 3, 1)
+    ts    = pd.date_range(start, periods=86_400, freq="s")
+    raw   = pd.concat([pd.DataFrame({"id": f"Pod-{i}", "speed": np.full(len(ts), 800.0),
+                                     "battery": np.linspace(100, 0, len(ts)), "received_at": ts})
+                       for i in range(1, 7)])
+    if source == "raw_csv":
+        path = os.path.join(tmp, "mqtt_logs.csv")
+        raw.to_csv(path, index=False)
+
+        def call():
+            frame = pd.read_csv(path, parse_dates=["received_at"])
+            frame = frame[frame["id"] == "Pod-1"].set_index("received_at")
+            return frame[["speed", "battery"]].resample("1min").agg(["mean", "min", "max", "last"])
+    else:
+        store  = RollupStore(tmp, [60], compact_interval=None)
+        minute = raw.groupby(["id", pd.Grouper(key="received_at", freq="1min")])
+        agg    = minute[["speed", "battery"]].agg(["mean", "min", "max", "last"])
+        agg.columns = [f if s == "mean" else f"{f}_{s}" for f, s in agg.columns]
+        agg = agg.reset_index().rename(columns={"id": "pod_id", "received_at": "ts"})
+        agg["resolution"] = 60
+        # A minute bucket closes with the first sample of the next minute and
+        # goes out with the writer's next 10 s flush
+        flush = (agg["ts"] + pd.Timedelta(minutes=1, seconds=10)).dt.floor("10s")
+        for i, (_, rows) in enumerate(agg.groupby(flush)):
+            store.append(rows.to_dict("records"))
+            if source == "rollup_store" and i % 10 == 9:
+                store.stores[60].compact(before=start + timedelta(days=1))
+
+        def call():
+            return store.query(60, ["Pod-1"], start, start + timedelta(days=1),
+                               ["speed", "battery"])
+
+    call.teardown = lambda: shutil.rmtree(tmp)
+    return call
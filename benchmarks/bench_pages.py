@@ -0,0 +1,71 @@
+import os
+import time
+
+from benchmarks.harness import bench
+
+# Rerun cost of each page under Streamlit's AppTest, logged in as Controller.
+# The broker connection is stubbed and HTTP calls go to scripts/stub_api.py,
+# so runs are offline and comparable between machines.
+
+APP   = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PAGES = ["Overview", "Pod Tracker", "Performance Metrics", "Weather Monitoring",
+         "Pod Comparison", "Live Track Map", "System Alerts", "Maintenance Logs",
+         "Did You Know", "MQTT Live Data", "System Performance"]
+
+
+_stub = None
+
+
+def _offline():
+    # External APIs point at the local stub server; the broker is never dialled
+    global _stub
+    from scripts.stub_api import serve
+    from utils.ingest import MqttIngestService
+    MqttIngestService.start = lambda self: self
+    if _stub is None:
+        _stub = serve()
+        os.environ["OPENWEATHER_URL"] = os.environ["FACTS_URL"] = f"http://127.0.0.1:{_stub.server_port}"
+
+
+def _app_test(**state):
+    from streamlit.testing.v1 import AppTest
+    _offline()
+    at = AppTest.from_file(APP, default_timeout=60)
+    for key, value in (state or {"booted": True, "logged_in": True,
+                                 "role": "Controller", "username": "controller"}).items():
+        at.session_state[key] = value
+    at.run()
+    return at
+
+
+@bench("pages.rerun", params=PAGES, repeat=3, min_time=0.0)
+def page_rerun(page):
+    at = _app_test()
+    at.radio[0].set_value(page).run()
+
+    def call():
+        at.run()
+    return call
+
+
+@bench("pages.cold_start", repeat=3, min_time=0.0)
+def cold_start(_):
+    # First script run of a fresh session (boot and login already done)
+    def call():
+        start = time.perf_counter()
+        _app_test()
+        return time.perf_counter() - start
+    return call
+
+
+@bench("pages.boot", repeat=3, min_time=0.0)
+def boot(_):
+    # Landing page of a new session, up to the "Enter Control Center" button
+    # (process warm-up already done by an earlier session)
+    _app_test(booted=False)
+
+    def call():
+        start = time.perf_counter()
+        _app_test(booted=False)
+        return time.perf_counter() - start
+    return call
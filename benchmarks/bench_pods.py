@@ -0,0 +1,108 @@
+from streamlit_folium import _get_feature_group_string
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import bench
+from utils.comparison import compare_pods
+from utils.fleet import FleetState
+from utils.pods import generate_pods
+from utils.trackmap import build_base_map, build_pod_layer, build_pod_map
+
+CENTER = [12.6819, 79.9888]
+
+
+@bench("pods.generate_pods", params=[5, 1_000, 10_000], items=lambda n: n)
+def pods_generate(n_pods):
+    return lambda: generate_pods(*CENTER, n_pods=n_pods)
+
+
+@bench("trackmap.build_and_render", params=[5, 100, 1_000, 10_000], repeat=3, min_time=0.0,
+       items=lambda n: n)
+def map_build(n_pods):
+    # Full map HTML render, what a rebuild-everything rerun would serialise
+    pods = generate_pods(*CENTER, n_pods=n_pods)
+    return lambda: build_pod_map(CENTER, pods).get_root().render()
+
+
+@bench("trackmap.pod_layer_update", params=[5, 1_000, 10_000], repeat=3, min_time=0.0,
+       items=lambda n: n)
+def layer_update(n_pods):
+    # Per-rerun cost on the Live Track Map page: fresh base map (unchanged
+    # hash, not re-sent) plus the pod layer script st_folium ships
+    pods = generate_pods(*CENTER, n_pods=n_pods)
+
+    def run():
+        m = build_base_map(CENTER)
+        m.get_root().render()
+        return _get_feature_group_string(build_pod_layer(pods), m)
+    return run
+
+
+def _fleet(n_pods):
+    rng   = np.random.default_rng(0)
+    fleet = FleetState()
+    ids   = [f"SIM-{i:06d}" for i in range(n_pods)]
+    fleet.upsert(ids, status=rng.integers(0, 3, n_pods).astype(np.int8),
+                 speed=rng.uniform(0, 1200, n_pods), battery=rng.uniform(0, 100, n_pods))
+    return fleet, ids, rng
+
+
+@bench("fleet.tracker_page", params=[1_000, 10_000, 100_000])
+def fleet_tracker_page(n_pods):
+    # Pod Tracker rerun on a live fleet: 1% of the pods report (a third of
+    # them changing status) since the last rerun, then one status filter,
+    # sorted by battery, 50-row page on the fresh snapshot
+    fleet, ids, rng = _fleet(n_pods)
+    moving  = ids[::100]
+    codes   = rng.integers(0, 3, len(moving)).astype(np.int8)
+    battery = rng.uniform(0, 100, len(moving))
+
+    def call():
+        codes[:] = (codes + (rng.random(len(moving)) < 0.33)) % 3
+        battery[:] += 0.01
+        fleet.upsert(moving, status=codes, battery=battery)
+        return fleet.query("Docked", sort="battery", offset=50, limit=50)
+    return call
+
+
+@bench("fleet.upsert", params=[1_000, 10_000, 100_000], items=lambda n: n)
+def fleet_upsert(n_pods):
+    # Whole simulated fleet pushed into the shared state, ~1% changing status
+    fleet, ids, rng = _fleet(n_pods)
+    status = fleet.query(limit=n_pods)[0]["status"]
+    codes  = np.array([fleet.statuses.index(s) for s in status], dtype=np.int8)
+    speed  = rng.uniform(0, 1200, n_pods)
+
+    def call():
+        flip = rng.random(n_pods) < 0.01
+        codes[flip] = (codes[flip] + 1) % 3
+        speed[:] += 1
+        fleet.upsert(ids, status=codes, speed=speed)
+    return call
+
+
+@bench("fleet.snapshot", params=[1_000, 10_000, 100_000])
+def fleet_snapshot(n_pods):
+    # One MQTT reading lands, then a page reads the fleet: the snapshot is
+    # re-taken once and the latest row of a pod is a dict lookup
+    fleet, ids, rng = _fleet(n_pods)
+    battery = rng.uniform(0, 100, 1)
+
+    def call():
+        fleet.upsert(ids[:1], battery=battery)
+        return fleet.snapshot().get(ids[-1])
+    return call
+
+
+@bench("comparison.compare_pods", params=[2, 6, 50], items=100_000)
+def comparison_stats(n_pods):
+    # 100k recorded rows split across the compared pods, all stats in one call
+    rng   = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "pod_id":  rng.choice([f"Pod-{i}" for i in range(1, n_pods + 1)], 100_000),
+        "ts":      pd.Timestamp("2026-03-01") + pd.to_timedelta(rng.uniform(0, 86_400, 100_000), unit="s"),
+        "speed":   rng.uniform(0, 1200, 100_000),
+        "battery": rng.uniform(0, 100, 100_000),
+    })
+    return lambda: compare_pods(frame)
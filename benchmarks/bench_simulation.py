@@ -0,0 +1,128 @@
+import numpy as np
+import streamlit as st
+
+from benchmarks.harness import bench
+from utils.alerts import AlertEngine
+from utils.forecast import Forecaster
+from utils.history import FleetHistory
+from utils.simulation import (AMBIENT, COOL_RATE, COOL_SPEED, DRAIN_ACC, DRAIN_SPEED, HEAT_ACC,
+                              HEAT_SPEED, TICK_SCALE, PodFleetSimulator)
+from utils.track import TrackGeometry, TrackIndex
+from utils.weather_grid import SpeedProfile
+
+
+def compute_values():
+    # The original single-pod tick on session state, before PodFleetSimulator
+    speed = st.session_state.speed
+    acc = st.session_state.acceleration
+    pressure = st.session_state.pressure
+
+    temp = HEAT_SPEED * speed + HEAT_ACC * acc
+    st.session_state.temperature = round(
+        st.session_state.temperature + temp * TICK_SCALE,
+        2
+    )
+
+    if speed < COOL_SPEED:
+        st.session_state.temperature = max(
+            AMBIENT,
+            st.session_state.temperature - COOL_RATE
+        )
+
+    if "battery" not in st.session_state:
+        st.session_state.battery = 100.0
+    drain = DRAIN_SPEED * speed + DRAIN_ACC * acc
+    st.session_state.battery = max(
+        round(st.session_state.battery - drain * TICK_SCALE, 2),
+        0
+    )
+    battery = st.session_state.battery
+
+    return speed, acc, pressure, st.session_state.temperature, st.session_state.battery
+
+
+@bench("simulation.compute_values")
+def scalar_compute_values(_):
+    for key, value in {"speed": 800, "acceleration": 3.0, "pressure": 101325,
+                       "temperature": 25.0, "battery": 100.0}.items():
+        st.session_state[key] = value
+    return compute_values
+
+
+@bench("simulation.fleet_step", params=[1, 1_000, 10_000])
+def fleet_step(n_pods):
+    # One call = one tick for the whole fleet; items/sec is ticks/sec
+    sim = PodFleetSimulator(n_pods, seed=0)
+    sim.randomize_inputs()
+    return sim.step
+
+
+@bench("simulation.alert_evaluate", params=[1_000, 10_000])
+def alert_evaluate(n_pods):
+    sim    = PodFleetSimulator(n_pods, seed=0)
+    engine = AlertEngine()
+    sim.randomize_inputs()
+    now    = [0.0]
+
+    def call():
+        now[0] += 0.1
+        engine.evaluate(sim.ids, {f: getattr(sim, f) for f in sim.FIELDS}, now[0])
+    return call
+
+
+@bench("simulation.headway_check", params=[1_000, 10_000, 100_000])
+def headway_check(n_pods):
+    # Per-tick fleet-wide check: re-index chainages, braking margin for every pod
+    track = TrackGeometry.loop((12.6819, 79.9888))
+    sim   = PodFleetSimulator(n_pods, track_length=track.length, seed=0)
+    index = TrackIndex(track)
+    sim.randomize_inputs()
+    sim.step()
+    return lambda: index.update(sim.chainage).margins(sim.speed)
+
+
+@bench("simulation.speed_limit_lookup", params=[1_000, 10_000, 100_000])
+def speed_limit_lookup(n_pods):
+    # Per-tick limit for every pod from the precomputed chainage profile
+    track   = TrackGeometry.loop((12.6819, 79.9888))
+    profile = SpeedProfile(track)
+    profile.update([0.0, track.length / 2], [900, 700])
+    sim     = PodFleetSimulator(n_pods, track_length=track.length, seed=0)
+    return lambda: profile.limits_for(sim.chainage)
+
+
+@bench("history.fleet_append", params=[1, 1_000, 10_000])
+def history_append(n_pods):
+    # One tick of the simulated fleet into raw rings + 1 s / 1 min rollups
+    sim     = PodFleetSimulator(n_pods, seed=0)
+    history = FleetHistory(sim.FIELDS, capacity=100)
+    values  = {f: getattr(sim, f) for f in sim.FIELDS}
+    now     = [0.0]
+
+    def call():
+        now[0] += 0.5
+        history.append(sim.ids, now[0], values)
+    return call
+
+
+@bench("history.pod_window", params=[None, 1, 60])
+def history_pod_window(resolution):
+    # Last 10 minutes of one pod out of a full 20k-sample ring at 2 Hz
+    history = FleetHistory(["speed", "battery"], capacity=20_000, rollup_capacity=2_000)
+    for t in np.arange(20_000) * 0.5:
+        history.append(["SIM-0001"], t, {"speed": [1.0], "battery": [2.0]})
+    end = 20_000 * 0.5
+    return lambda: history.pod("SIM-0001", seconds=600, resolution=resolution, now=end)
+
+
+@bench("forecast.update", params=[1, 1_000, 10_000])
+def forecast_update(n_pods):
+    # Once-a-second battery / thermal fit over 30 s of 1 s buckets, whole fleet
+    sim     = PodFleetSimulator(n_pods, seed=0)
+    history = FleetHistory(sim.FIELDS, capacity=100, rollup_capacity=30)
+    for i in range(80):
+        sim.randomize_inputs()
+        sim.step()
+        history.append(sim.ids, i * 0.5, {f: getattr(sim, f) for f in sim.FIELDS})
+    forecaster = Forecaster(history, window=30)
+    return lambda: forecaster.update(sim.ids, sim.battery, sim.temperature, 40.0)
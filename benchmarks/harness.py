@@ -0,0 +1,59 @@
+import gc
+import statistics
+import time
+
+# Minimal asv-style harness: benchmarks register themselves with @bench, the
+# runner times each one and results are written as JSON by benchmarks/run.py.
+#
+# A benchmark is a function that receives the parameter value and returns a
+# zero-argument callable to time (setup happens outside the timed region).
+# `items` is how many units of work one call does (messages, rows, ticks...),
+# so results can be reported as throughput.
+
+REGISTRY = []
+
+
+def bench(name, params=(None,), items=1, repeat=5, min_time=0.2):
+    def register(fn):
+        REGISTRY.append({"name": name, "fn": fn, "params": params, "items": items,
+                         "repeat": repeat, "min_time": min_time})
+        return fn
+    return register
+
+
+def measure(call, repeat=5, min_time=0.2):
+    # Calibrate how many calls fill `min_time`, then take `repeat` samples
+    number = 1
+    while True:
+        t = _time(call, number)
+        if t >= min_time or number >= 1_000_000:
+            break
+        number *= max(2, int(min_time / max(t, 1e-9)))
+    samples = [_time(call, number) / number for _ in range(repeat)]
+    return {"number": number, "min": min(samples), "median": statistics.median(samples),
+            "stdev": statistics.pstdev(samples)}
+
+
+def _time(call, number):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def run_one(entry, param):
+    call   = entry["fn"](param)
+    result = measure(call, entry["repeat"], entry["min_time"])
+    items  = entry["items"](param) if callable(entry["items"]) else entry["items"]
+    result["items"]         = items
+    result["items_per_sec"] = items / result["median"] if result["median"] else None
+    teardown = getattr(call, "teardown", None)
+    if teardown:
+        teardown()
+    return result
@@ -0,0 +1,106 @@
+import argparse
+import datetime
+import glob
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.harness import REGISTRY, run_one
+
+MODULES     = ["bench_ingest", "bench_logging", "bench_simulation", "bench_pods", "bench_pages"]
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# Usage (from the repository root):
+#
+#   python -m benchmarks.run                     # everything
+#   python -m benchmarks.run -k simulation       # names containing "simulation"
+#   python -m benchmarks.run --fail-on-regression
+#
+# Each run writes benchmarks/results/<UTC time>-<commit>.json and compares
+# medians against the most recent earlier result file.
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def key(name, param):
+    return name if param is None else f"{name}[{param}]"
+
+
+def compare(results, previous_path, threshold):
+    with open(previous_path) as fh:
+        previous = json.load(fh)["benchmarks"]
+    regressions = []
+    print(f"\nCompared with {os.path.basename(previous_path)}:")
+    for name, result in results.items():
+        old = previous.get(name)
+        if not old:
+            continue
+        ratio = result["median"] / old["median"]
+        flag  = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"  {name:55s} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the dashboard benchmark suite")
+    parser.add_argument("-k", dest="filter", default="", help="only run benchmarks containing this")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    for module in MODULES:
+        importlib.import_module(f"benchmarks.{module}")
+
+    results = {}
+    for entry in REGISTRY:
+        for param in entry["params"]:
+            name = key(entry["name"], param)
+            if args.filter not in name:
+                continue
+            result = results[name] = run_one(entry, param)
+            rate = f"{result['items_per_sec']:,.0f}/s" if result["items_per_sec"] else ""
+            print(f"{name:55s} {result['median'] * 1000:10.3f} ms  {rate}", flush=True)
+
+    previous = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    regressions = compare(results, previous[-1], args.threshold) if previous else []
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path  = os.path.join(RESULTS_DIR, f"{stamp}-{git_commit()}.json")
+        with open(path, "w") as fh:
+            json.dump({
+                "commit":     git_commit(),
+                "timestamp":  stamp,
+                "machine":    {"python": platform.python_version(), "platform": platform.platform(),
+                               "processor": platform.processor(), "cpus": os.cpu_count()},
+                "benchmarks": results,
+            }, fh, indent=2)
+        print(f"\nSaved {os.path.relpath(path, ROOT)}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from views import IMPORT_BUDGET_MS, PAGES
+
+# Cold-start import budget for the dashboard, measured the way
+# `python -X importtime` reports it:
+#
+#   python scripts/import_budget.py            # shell + every page
+#   python scripts/import_budget.py --top 10   # with each page's slowest modules
+#
+# The shell (app.py's own imports: streamlit, views, utils.services) is
+# imported first in a fresh interpreter; each page module is then imported
+# in its own fresh interpreter on top of the shell, so its figure is what
+# first navigation to that page adds. Exits non-zero if anything is over
+# budget.
+
+SHELL = ["streamlit", "views", "utils.services"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check import time against the cold-start budget")
+    parser.add_argument("--shell-budget", type=float, default=1500.0,
+                        help="ms allowed for the shell's imports")
+    parser.add_argument("--page-budget", type=float, default=IMPORT_BUDGET_MS,
+                        help="ms allowed for one page module on top of the shell")
+    parser.add_argument("--top", type=int, default=0,
+                        help="list each page's N slowest modules by self time")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per module; the fastest counts")
+    return parser.parse_args()
+
+
+def importtime(shell, target):
+    # [(module, self_us, cumulative_us, depth)] for what `import target`
+    # loads after `shell` is already imported, from -X importtime's stderr
+    code = "".join(f"import {m}\n" for m in shell)
+    code += f"import sys; sys.stderr.write('--- target\\n')\nimport {target}\n"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+    if proc.returncode:
+        raise SystemExit(f"import {target} failed:\n{proc.stderr[-2000:]}")
+    _, _, tail = proc.stderr.partition("--- target\n")
+    rows = []
+    for line in tail.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative),
+                     (len(name) - len(name.lstrip()) - 1) // 2))
+    return rows
+
+
+def measure(shell, target, repeat):
+    # Fastest of `repeat` runs, in ms, and that run's rows
+    best = None
+    for _ in range(repeat):
+        rows = importtime(shell, target)
+        ms   = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+        if best is None or ms < best[0]:
+            best = (ms, rows)
+    return best
+
+
+def main():
+    args  = parse_args()
+    over  = []
+    shell = 0.0
+    for module in SHELL:
+        ms, _ = measure(SHELL[:SHELL.index(module)], module, args.repeat)
+        shell += ms
+    print(f"{'shell':<22} {shell:8.1f} ms  (budget {args.shell_budget:g})")
+    if shell > args.shell_budget:
+        over.append("shell")
+
+    for page, module in PAGES.items():
+        ms, rows = measure(SHELL, module, args.repeat)
+        flag = "  OVER" if ms > args.page_budget else ""
+        print(f"{page:<22} {ms:8.1f} ms  (budget {args.page_budget:g}){flag}")
+        if flag:
+            over.append(page)
+        for name, self_us, _, _ in sorted(rows, key=lambda r: -r[1])[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+    if over:
+        print(f"over budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,221 @@
 import paho.mqtt.client as mqtt
+import argparse
+import csv
 import json
+import os
+import sys
+import threading
 import time
 import random
 
-def on_connect(client, userdata, flags, rc):
-    if rc == 0:
-        print("✅ Connected to broker.hivemq.com successfully")
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.codec import STATUSES, encode_json, encode_binary
+from utils.ingest import BROKER_HOST, BROKER_PORT, TOPIC
+
+# Load generator for the dashboard's MQTT ingestion path.
+#
+#   python scripts/mqtt_publisher.py                       # demo: 6 pods, one message every 2 s
+#   python scripts/mqtt_publisher.py --pods 500 --hz 10 --latency --host localhost
+#   python scripts/mqtt_publisher.py --replay data/mqtt_logs.csv --speedup 50
+#   python scripts/mqtt_publisher.py --inproc --pods 1000 --hz 20 --duration 10
+#
+# --latency embeds the send time in every payload; the dashboard echoes it on
+# <topic>/echo and this script reports end-to-end latency percentiles.
+# --inproc skips the broker and feeds an in-process MqttIngestService, which
+# measures the dashboard's decode/ingest path on its own.
+
+
+def positive_float(text):
+    value = float(text)
+    if not value > 0:   # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {text}")
+    return value
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Publish Hyperloop pod telemetry")
+    parser.add_argument("--host", default=BROKER_HOST)
+    parser.add_argument("--port", type=int, default=BROKER_PORT)
+    parser.add_argument("--topic", default=TOPIC)
+    parser.add_argument("--format", choices=["json", "binary"], default="json",
+                        help="payload encoding; binary frames are ~3x smaller than JSON")
+    parser.add_argument("--pods", type=int, default=6, help="simulated fleet size")
+    parser.add_argument("--hz", type=positive_float, default=None,
+                        help="messages per second per pod (default: one message every 2 s overall)")
+    parser.add_argument("--duration", type=float, default=None, help="stop after this many seconds")
+    parser.add_argument("--replay", help="replay a recorded mqtt_logs.csv or Parquet capture")
+    parser.add_argument("--speedup", type=positive_float, default=1.0, help="replay speed, 1x-100x")
+    parser.add_argument("--latency", action="store_true",
+                        help="embed send timestamps and measure the dashboard's echo")
+    parser.add_argument("--inproc", action="store_true",
+                        help="publish into an in-process ingestion service instead of a broker")
+    parser.add_argument("--quiet", action="store_true", help="don't print every message")
+    return parser.parse_args()
+
+
+class Stats:
+    def __init__(self):
+        self.sent        = 0
+        self.latencies   = []
+        self.lock        = threading.Lock()
+        self.started     = time.perf_counter()
+        self.last_report = self.started
+        self._reported   = 0
+
+    def on_echo(self, sent_at):
+        with self.lock:
+            self.latencies.append(time.time() - sent_at)
+
+    def report(self, final=False):
+        # Interval reports cover echoes since the previous report, the final
+        # one covers the whole run
+        self.last_report = time.perf_counter()
+        elapsed = self.last_report - self.started
+        with self.lock:
+            lat = np.array(self.latencies if final else self.latencies[self._reported:])
+            self._reported = len(self.latencies)
+        line = f"sent={self.sent} rate={self.sent / max(elapsed, 1e-9):.1f} msg/s"
+        if len(lat):
+            p50, p95, p99 = np.percentile(lat, [50, 95, 99]) * 1000
+            line += f" latency p50={p50:.2f}ms p95={p95:.2f}ms p99={p99:.2f}ms (n={len(lat)})"
+        print(("TOTAL " if final else "") + line, flush=True)
+
+
+class Fleet:
+    # Correlated per-pod trajectories: speed relaxes toward a per-pod cruise
+    # speed with bounded acceleration, battery drains with speed and pods dock
+    # to recharge when low.
+
+    def __init__(self, n_pods, seed=None):
+        self.rng     = np.random.default_rng(seed)
+        self.ids     = [f"Pod-{i}" for i in range(1, n_pods + 1)]
+        self.cruise  = self.rng.uniform(600, 1200, n_pods)
+        self.speed   = self.rng.uniform(0, 1200, n_pods)
+        self.battery = self.rng.uniform(40, 100, n_pods)
+        self.docked  = np.zeros(n_pods, dtype=bool)
+
+    def step(self, dt):
+        target = np.where(self.docked, 0.0, self.cruise)
+        accel  = np.clip((target - self.speed) * 0.5 + self.rng.normal(0, 20, len(self.ids)), -150, 150)
+        self.speed   = np.clip(self.speed + accel * dt, 0, 1200)
+        self.battery = np.clip(self.battery - (0.0005 * self.speed) * dt
+                               + np.where(self.docked, 5.0 * dt, 0.0), 0, 100)
+        self.docked  = np.where(self.docked, self.battery < 95, self.battery < 20)
+
+    def messages(self, idx):
+        for i in idx:
+            status = "Docked" if self.docked[i] else ("Maintenance" if self.battery[i] < 25 else "Operational")
+            yield {"id": self.ids[i], "speed": int(self.speed[i]),
+                   "battery": round(float(self.battery[i]), 1), "status": status}
+
+
+def load_replay(path):
+    # Yields (offset seconds, pod dict) from a CSV log or Parquet capture
+    if path.endswith(".csv"):
+        rows, day = [], 0.0
+        with open(path, newline="") as fh:
+            for row in csv.DictReader(fh):
+                h, m, s = (int(x) for x in row["received_at"].split(":"))
+                t = h * 3600 + m * 60 + s + day
+                if rows and t < rows[-1][0]:  # crossed midnight
+                    day += 86400
+                    t += 86400
+                rows.append((t, {"id": row["id"], "speed": float(row["speed"]),
+                                 "battery": float(row["battery"]), "status": row["status"]}))
     else:
-        print(f"❌ Connection failed with code {rc}")
-        
-client = mqtt.Client()
-client.on_connect = on_connect
-client.connect("broker.hivemq.com", 1883, 60)
-client.loop_start()
-print("Publishing Hyperloop Pod Data...\n")
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=["pod_id", "ts", "speed", "battery", "status"]).sort_by("ts")
+        rows  = [(r["ts"].timestamp(), {"id": r["pod_id"], "speed": r["speed"],
+                                         "battery": r["battery"], "status": r["status"]})
+                 for r in table.to_pylist()]
+    rows = [r for r in rows if r[1]["status"] in STATUSES]
+    start = rows[0][0] if rows else 0
+    return [(t - start, pod) for t, pod in rows]
+
+
+def connect(args, stats):
+    if args.inproc:
+        from utils.ingest import MqttIngestService
+        service      = MqttIngestService(topic=args.topic)
+        service.echo = lambda record: stats.on_echo(record.sent)
+        return lambda payload: service.handle_payload(payload), lambda: None
+
+    def on_connect(client, userdata, flags, rc):
+        if rc == 0:
+            print(f"✅ Connected to {args.host}:{args.port} successfully")
+            if args.latency:
+                client.subscribe(f"{args.topic}/echo")
+        else:
+            print(f"❌ Connection failed with code {rc}")
+
+    def on_message(client, userdata, msg):
+        # Echoes are {"id": ..., "sent": ...}, not full pod records
+        try:
+            stats.on_echo(float(json.loads(msg.payload)["sent"]))
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    client = mqtt.Client()
+    client.on_connect = on_connect
+    client.on_message = on_message
+    client.connect(args.host, args.port, 60)
+    client.loop_start()
+    return lambda payload: client.publish(args.topic, payload), client.loop_stop
+
 
-while True:
-    pod_data = {
-        "id": f"Pod-{random.randint(1,6)}",
-        "speed": random.randint(600, 1200),
-        "battery": random.randint(20, 100),
-        "status": random.choice(["Operational", "Maintenance", "Docked"])
-    }
-    client.publish("hyperloop/pods/demo", json.dumps(pod_data))
-    print("Published:", pod_data)
-    time.sleep(2)
+def main():
+    args    = parse_args()
+    encode  = encode_binary if args.format == "binary" else encode_json
+    stats   = Stats()
+    publish, close = connect(args, stats)
+    verbose = not args.quiet and (args.replay or args.hz is None)
 
+    def send(pod):
+        publish(encode(pod, sent=time.time() if args.latency else None))
+        stats.sent += 1
+        if verbose:
+            print("Published:", pod)
+        elif time.perf_counter() - stats.last_report >= 1.0:
+            stats.report()
 
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    print(f"Publishing Hyperloop Pod Data ({args.format})...\n")
+    try:
+        if args.replay:
+            start = time.perf_counter()
+            for offset, pod in load_replay(args.replay):
+                delay = start + offset / args.speedup - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                send(pod)
+                if deadline and time.perf_counter() >= deadline:
+                    break
+        else:
+            fleet = Fleet(args.pods)
+            if args.hz is None:
+                # Demo mode: one random pod every 2 seconds
+                period, batch = 2.0, 1
+            else:
+                period, batch = 1.0 / args.hz, args.pods
+            next_tick = time.perf_counter()
+            while not deadline or time.perf_counter() < deadline:
+                fleet.step(period)
+                idx = range(batch) if batch == args.pods else [random.randrange(args.pods)]
+                for pod in fleet.messages(idx):
+                    send(pod)
+                next_tick += period
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    if args.latency and not args.inproc:
+        time.sleep(1.0)  # let the last echoes arrive
+    close()
+    stats.report(final=True)
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local stand-in for the external APIs the dashboard calls, for offline
+# development, benchmarks and slow-upstream experiments:
+#
+#   python scripts/stub_api.py --port 8081 --delay 2
+#   OPENWEATHER_URL=http://localhost:8081 FACTS_URL=http://localhost:8081 streamlit run app.py
+#
+# /data/2.5/weather?q=<city>  weather + coordinates ("nowhere" returns 404),
+#                   ?lat=&lon=  or by position
+# /random.json                a random fact
+
+FACTS = [
+    "A hyperloop pod travels in a near-vacuum tube to cut aerodynamic drag.",
+    "Magnetic levitation removes rolling resistance entirely.",
+    "Low tube pressure is roughly what an airliner sees at 60 km altitude.",
+]
+CONDITIONS = ["clear sky", "few clouds", "overcast clouds", "light rain", "haze"]
+
+
+def _handler(delay):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            url   = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/data/2.5/weather":
+                city = query.get("q", [""])[0]
+                if "lat" in query and "lon" in query:
+                    city = f"{float(query['lat'][0]):.2f},{float(query['lon'][0]):.2f}"
+                if not city or city.lower() == "nowhere":
+                    return self._send(404, {"cod": "404", "message": "city not found"})
+                rng = random.Random(city.lower())
+                return self._send(200, {
+                    "name":    city,
+                    "coord":   {"lat": round(rng.uniform(8, 28), 4), "lon": round(rng.uniform(72, 88), 4)},
+                    "main":    {"temp": round(rng.uniform(22, 38) + random.uniform(-1, 1), 1)},
+                    "weather": [{"description": random.choice(CONDITIONS)}],
+                    "wind":    {"speed": round(random.uniform(0, 15), 1)},
+                })
+            if url.path == "/random.json":
+                return self._send(200, {"text": random.choice(FACTS)})
+            self._send(404, {"message": "not found"})
+
+        def _send(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients that time out on a --delay response hang up before it is
+        # written; that is the point of the delay, not an error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def serve(port=0, delay=0.0):
+    # Starts the stub on a daemon thread; returns the server (server_port is the bound port)
+    server = _Server(("127.0.0.1", port), _handler(delay))
+    threading.Thread(target=server.serve_forever, name="stub-api", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub weather/facts API")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before every response")
+    args   = parser.parse_args()
+    server = serve(args.port, args.delay)
+    print(f"Stub API on http://127.0.0.1:{server.server_port} (delay {args.delay}s)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
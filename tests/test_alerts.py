@@ -0,0 +1,79 @@
+from utils.alerts import AlertEngine
+
+BATTERY = {"name": "battery_low", "metric": "battery", "kind": "threshold", "op": "<",
+           "threshold": 20, "clear": 25, "level": "CRITICAL", "message": "Battery at {value:.1f}%"}
+PRESSURE = {"name": "pressure_high", "metric": "pressure", "kind": "threshold", "op": ">",
+            "threshold": 108000, "clear": 107500, "for": 2, "level": "WARNING",
+            "message": "Pressure {value:.0f} Pa"}
+DRAIN = {"name": "drain", "metric": "battery", "kind": "rate", "op": "<",
+         "threshold": -2.0, "clear": -1.0, "level": "WARNING", "message": "{value:.2f}%/s"}
+
+
+def _active(engine):
+    return {(a["Rule"], a["Pod"]) for a in engine.active_alerts()}
+
+
+def test_threshold_raises_and_clears_with_hysteresis():
+    engine = AlertEngine([BATTERY])
+    engine.evaluate(["P1", "P2"], {"battery": [19, 50]}, now=0)
+    assert _active(engine) == {("battery_low", "P1")}
+
+    # Back above the threshold but not past the clear level: still active
+    engine.evaluate(["P1", "P2"], {"battery": [22, 50]}, now=1)
+    assert _active(engine) == {("battery_low", "P1")}
+    assert engine.resolved_alerts() == []
+
+    engine.evaluate(["P1", "P2"], {"battery": [25, 50]}, now=2)
+    assert _active(engine) == set()
+    resolved = engine.resolved_alerts()
+    assert [(a["Rule"], a["Pod"]) for a in resolved] == [("battery_low", "P1")]
+    assert resolved[0]["Resolved"] is not None
+
+
+def test_active_alert_is_not_raised_twice():
+    engine = AlertEngine([BATTERY])
+    for now in range(3):
+        engine.evaluate(["P1"], {"battery": [10]}, now=now)
+    assert len(engine.active_alerts()) == 1
+
+
+def test_sustained_for_needs_condition_to_hold_continuously():
+    engine = AlertEngine([PRESSURE])
+    engine.evaluate(["P1"], {"pressure": [109000]}, now=0)
+    engine.evaluate(["P1"], {"pressure": [109000]}, now=1)
+    assert _active(engine) == set()
+
+    # A dip back into range restarts the clock
+    engine.evaluate(["P1"], {"pressure": [101000]}, now=1.5)
+    engine.evaluate(["P1"], {"pressure": [109000]}, now=2)
+    engine.evaluate(["P1"], {"pressure": [109000]}, now=3.5)
+    assert _active(engine) == set()
+
+    engine.evaluate(["P1"], {"pressure": [109000]}, now=4)
+    assert _active(engine) == {("pressure_high", "P1")}
+
+
+def test_rate_rule_uses_change_per_second():
+    engine = AlertEngine([DRAIN])
+    engine.evaluate(["P1"], {"battery": [100]}, now=0)
+    assert _active(engine) == set()   # no previous reading, no rate yet
+    engine.evaluate(["P1"], {"battery": [94]}, now=2)    # -3 %/s
+    assert _active(engine) == {("drain", "P1")}
+    engine.evaluate(["P1"], {"battery": [91]}, now=4)    # -1.5 %/s, inside hysteresis
+    assert _active(engine) == {("drain", "P1")}
+    engine.evaluate(["P1"], {"battery": [90]}, now=6)    # -0.5 %/s
+    assert _active(engine) == set()
+
+
+def test_missing_metric_and_nan_do_not_fire_or_clear():
+    engine = AlertEngine([BATTERY, PRESSURE])
+    engine.evaluate(["P1"], {"battery": [10]}, now=0)
+    engine.evaluate(["P1"], {"battery": [float("nan")]}, now=1)
+    assert _active(engine) == {("battery_low", "P1")}
+
+
+def test_pods_are_tracked_independently():
+    engine = AlertEngine([BATTERY])
+    engine.evaluate(["P1"], {"battery": [10]}, now=0)
+    engine.evaluate(["P2", "P1"], {"battery": [10, 30]}, now=1)
+    assert _active(engine) == {("battery_low", "P2")}
@@ -0,0 +1,74 @@
+import json
+import math
+
+import pytest
+
+from utils.codec import MAX_SPEED, PodRecord, decode, encode_binary, encode_json
+
+POD = {"id": "Pod-3", "speed": 845, "battery": 81, "status": "Docked"}
+
+
+@pytest.mark.parametrize("encode", [encode_json, encode_binary])
+def test_round_trip(encode):
+    record = decode(encode(POD))
+    assert isinstance(record, PodRecord)
+    assert record.as_dict() == POD
+    assert record.sent is None
+
+
+@pytest.mark.parametrize("encode", [encode_json, encode_binary])
+def test_round_trip_with_send_time(encode):
+    assert decode(encode(POD, sent=1234.5)).sent == 1234.5
+
+
+def test_binary_fractional_readings_keep_two_decimals():
+    record = decode(encode_binary({**POD, "speed": 812.37, "battery": 55.5}))
+    assert (record.speed, record.battery) == (812.37, 55.5)
+
+
+@pytest.mark.parametrize("payload", [
+    b"",
+    b"not json",
+    b"\xff\xfe",
+    b"[1, 2, 3]",
+    json.dumps({**POD, "id": ""}).encode(),
+    json.dumps({**POD, "id": 7}).encode(),
+    json.dumps({k: v for k, v in POD.items() if k != "speed"}).encode(),
+    json.dumps({**POD, "speed": "fast"}).encode(),
+    json.dumps({**POD, "speed": True}).encode(),
+    json.dumps({**POD, "speed": -1}).encode(),
+    json.dumps({**POD, "speed": MAX_SPEED + 1}).encode(),
+    json.dumps({**POD, "speed": 10 ** 400}).encode(),
+    json.dumps({**POD, "battery": 101}).encode(),
+    json.dumps({**POD, "status": "Flying"}).encode(),
+    # json.dumps writes NaN / Infinity literals, which json.loads accepts
+    json.dumps({**POD, "speed": math.nan}).encode(),
+    json.dumps({**POD, "speed": math.inf}).encode(),
+    json.dumps({**POD, "battery": math.nan}).encode(),
+    json.dumps({**POD, "battery": -math.inf}).encode(),
+])
+def test_json_rejects_malformed(payload):
+    with pytest.raises(ValueError):
+        decode(payload)
+
+
+@pytest.mark.parametrize("pod", [
+    {**POD, "speed": math.nan},
+    {**POD, "speed": math.inf},
+    {**POD, "battery": math.nan},
+    {**POD, "battery": 150},
+])
+def test_binary_rejects_bad_readings(pod):
+    with pytest.raises(ValueError):
+        decode(encode_binary(pod))
+
+
+def test_binary_rejects_malformed_frames():
+    frame = encode_binary(POD)
+    for bad in (frame[:5],                              # truncated header
+                frame[:-2],                             # id shorter than its length byte
+                frame[:2] + b"\x09" + frame[3:],        # unknown version
+                frame[:4] + b"\x07" + frame[5:],        # unknown status code
+                frame[:-1] + b"\xff"):                  # id not UTF-8
+        with pytest.raises(ValueError):
+            decode(bad)
@@ -0,0 +1,112 @@
+import numpy as np
+
+from utils.history import FleetHistory
+
+
+def _history(**kwargs):
+    return FleetHistory(("speed", "battery"), capacity=kwargs.pop("capacity", 100),
+                        resolutions=kwargs.pop("resolutions", (1, 10)), **kwargs)
+
+
+def _append(history, pod_ids, t, speed, battery=None):
+    speed = np.atleast_1d(np.asarray(speed, dtype=np.float64))
+    history.append(pod_ids, t, {"speed": speed,
+                                "battery": speed if battery is None else np.atleast_1d(battery)})
+
+
+def test_raw_ring_wraps_oldest_first():
+    history = _history(capacity=4)
+    for t in range(6):
+        _append(history, ["P1"], float(t), t * 10)
+    raw = history.pod("P1")
+    assert raw["time"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert raw["speed"].tolist() == [20.0, 30.0, 40.0, 50.0]
+    assert history.pod("P1", seconds=1.5, now=5.0)["time"].tolist() == [4.0, 5.0]
+
+
+def test_bucket_boundaries():
+    # [0, 1) is one bucket; a sample exactly at 1.0 opens the next
+    history = _history()
+    for t, v in ((0.0, 10), (0.5, 30), (0.999, 20), (1.0, 50)):
+        _append(history, ["P1"], t, v)
+    buckets = history.pod("P1", resolution=1)
+    assert buckets["time"].tolist() == [0.0, 1.0]
+    assert buckets["count"].tolist() == [3.0, 1.0]
+    assert buckets["speed"].tolist() == [20.0, 50.0]
+    assert buckets["speed_min"].tolist() == [10.0, 50.0]
+    assert buckets["speed_max"].tolist() == [30.0, 50.0]
+    assert buckets["speed_last"].tolist() == [20.0, 50.0]
+
+
+def test_cascade_into_coarser_rollup():
+    # The 10 s bucket is fed by closed 1 s buckets, so it trails by the
+    # 1 s bucket still open and closes once a later 1 s bucket does
+    history = _history()
+    for t in range(11):
+        _append(history, ["P1"], float(t), t)
+    buckets = history.pod("P1", resolution=10)
+    assert buckets["time"].tolist() == [0.0]
+    assert buckets["count"].tolist() == [10.0]
+
+    _append(history, ["P1"], 11.0, 11)
+    buckets = history.pod("P1", resolution=10)
+    assert buckets["time"].tolist() == [0.0, 10.0]
+    assert buckets["count"].tolist() == [10.0, 1.0]
+    assert buckets["speed"][0] == np.mean(range(10))
+    assert buckets["speed_min"][0] == 0.0 and buckets["speed_max"][0] == 9.0
+    assert buckets["speed_last"][0] == 9.0
+
+
+def test_late_samples_are_dropped_and_counted():
+    history = _history()
+    _append(history, ["P1"], 5.0, 10)
+    _append(history, ["P1"], 6.0, 20)
+    _append(history, ["P1"], 4.0, 99)   # bucket 4 is older than the open one
+    buckets = history.pod("P1", resolution=1)
+    assert buckets["time"].tolist() == [5.0, 6.0]
+    assert 99.0 not in buckets["speed_max"]
+    assert history._rollups[1].late == 1
+
+
+def test_fleet_rollup_spans_all_pods():
+    history = _history()
+    _append(history, ["P1", "P2"], 0.0, [10, 30])
+    _append(history, ["P1", "P2"], 0.5, [20, 40])
+    fleet = history.fleet(1)
+    assert fleet["count"].tolist() == [4.0]
+    assert fleet["speed"].tolist() == [25.0]
+    assert fleet["speed_min"].tolist() == [10.0]
+    assert fleet["speed_max"].tolist() == [40.0]
+
+
+def test_on_close_sees_each_closed_bucket():
+    closed = []
+    history = _history(on_close=lambda resolution, buckets: closed.append((resolution, buckets)))
+    _append(history, ["P1", "P2"], 0.2, [10, 20])
+    assert closed == []
+    _append(history, ["P1", "P2"], 1.2, [30, 40])
+    assert [res for res, _ in closed] == [1]
+    buckets = closed[0][1]
+    assert buckets["pod_id"] == ["P1", "P2"]
+    assert buckets["time"].tolist() == [0.0, 0.0]
+    assert buckets["speed"].tolist() == [10.0, 20.0]
+
+
+def test_recent_pads_missing_buckets_with_nan():
+    history = _history()
+    for t in range(3):
+        _append(history, ["P1", "P2"], float(t), [t, t * 2])
+    _append(history, ["P3"], 2.0, 7)
+    times, means = history.recent(["P1", "P2", "P3"], ["speed"], 1, 3)
+    # P1/P2 have closed buckets 0 and 1 (2 is still open); P3 has none
+    assert np.isnan(times[0, 0]) and times[0, 1:].tolist() == [0.0, 1.0]
+    assert means["speed"][1, 1:].tolist() == [0.0, 2.0]
+    assert np.isnan(means["speed"][2]).all()
+
+
+def test_window_relative_to_explicit_now_zero():
+    history = _history()
+    _append(history, ["P1"], -2.0, 1)
+    _append(history, ["P1"], 0.0, 2)
+    assert history.pod("P1", seconds=1, now=0.0)["time"].tolist() == [0.0]
+    assert history.fleet(1, seconds=1, now=0.0)["time"].tolist() == [0.0]
@@ -0,0 +1,161 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from scripts.stub_api import serve
+from utils.http_client import HttpClient
+
+
+@pytest.fixture(scope="module")
+def stub():
+    server = serve()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def slow_stub():
+    server = serve(delay=1.0)
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HttpClient()
+    yield client
+    client.close()
+
+
+def _counted(client, base, city):
+    # A fetch for one city that numbers its calls: returns (call number, body)
+    calls = []
+
+    def fetch():
+        calls.append(city)
+        return len(calls), client.get_json(f"{base}/data/2.5/weather", {"q": city})
+    return fetch, calls
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_cold_key_waits_for_the_network(client, stub):
+    fetch, calls = _counted(client, stub, "Chennai")
+    n, body = client.swr("chennai", fetch, max_age=60)
+    assert n == 1 and body["name"] == "Chennai" and "lat" in body["coord"]
+    assert calls == ["Chennai"]
+
+
+def test_fresh_value_is_served_without_a_fetch(client, stub):
+    fetch, calls = _counted(client, stub, "Chennai")
+    first = client.swr("chennai", fetch, max_age=60)
+    assert client.swr("chennai", fetch, max_age=60) == first
+    assert len(calls) == 1
+
+
+def test_stale_value_is_served_while_refreshing(client, stub):
+    fetch, calls = _counted(client, stub, "Chennai")
+    client.swr("chennai", fetch, max_age=60)
+    client.invalidate("chennai")
+    # Stale: the old value comes back at once, the refresh runs behind it
+    assert client.swr("chennai", fetch, max_age=60)[0] == 1
+    _wait_until(lambda: client.swr("chennai", fetch, max_age=60)[0] == 2)
+    assert len(calls) == 2
+
+
+def test_one_refresh_in_flight_per_key(client, slow_stub):
+    fetch, calls = _counted(client, slow_stub, "Chennai")
+    client.swr("chennai", fetch, max_age=60)
+    client.invalidate("chennai")
+    for _ in range(5):
+        assert client.swr("chennai", fetch, max_age=60)[0] == 1
+    _wait_until(lambda: client.swr("chennai", fetch, max_age=60)[0] == 2)
+    assert len(calls) == 2
+
+
+def test_concurrent_cold_readers_share_one_fetch(client, slow_stub):
+    fetch, calls = _counted(client, slow_stub, "Chennai")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.swr("chennai", fetch, 60)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [n for n, _ in results] == [1, 1, 1, 1]
+    assert len(calls) == 1
+
+
+def test_failed_cold_fetch_returns_none(client, stub):
+    fetch, calls = _counted(client, stub, "nowhere")   # the stub answers 404
+    assert client.swr("nowhere", fetch, max_age=60) is None
+    assert client.swr("nowhere", fetch, max_age=60) is None
+    assert len(calls) == 2                              # failures aren't cached
+
+
+def test_failed_refresh_keeps_stale_value_and_retries(client, stub):
+    fetch, _ = _counted(client, stub, "Chennai")
+    failing, failures = [False], []
+
+    def flaky():
+        if failing[0]:
+            failures.append(time.time())
+            raise requests.ConnectionError("upstream down")
+        return fetch()
+
+    client.swr("chennai", flaky, max_age=60)
+    failing[0] = True
+    client.invalidate("chennai")
+    assert client.swr("chennai", flaky, max_age=60)[0] == 1
+    _wait_until(lambda: failures and client._cache["chennai"]["refresh"] is None)
+    # The stale value survives the failure and the next read retries
+    failing[0] = False
+    assert client.swr("chennai", flaky, max_age=60)[0] == 1
+    _wait_until(lambda: client.swr("chennai", flaky, max_age=60)[0] == 2)
+
+
+def test_lru_evicts_least_recently_used_key(stub):
+    client = HttpClient(max_entries=2)
+    try:
+        fetches = {city: _counted(client, stub, city) for city in ("A", "B", "C")}
+        client.swr("a", fetches["A"][0], max_age=60)
+        client.swr("b", fetches["B"][0], max_age=60)
+        client.swr("a", fetches["A"][0], max_age=60)     # a is now the most recent
+        client.swr("c", fetches["C"][0], max_age=60)     # evicts b
+        assert list(client._cache) == ["a", "c"]
+        client.swr("a", fetches["A"][0], max_age=60)
+        client.swr("b", fetches["B"][0], max_age=60)
+        assert len(fetches["A"][1]) == 1 and len(fetches["B"][1]) == 2
+    finally:
+        client.close()
+
+
+def test_cold_wait_is_bounded_by_wait_for(client, slow_stub):
+    fetch, _ = _counted(client, slow_stub, "Chennai")
+    start = time.monotonic()
+    assert client.swr("chennai", fetch, max_age=60, wait_for=0.2) is None
+    assert time.monotonic() - start < 0.8
+    # The fetch carries on in the background and fills the cache
+    _wait_until(lambda: client.swr("chennai", fetch, max_age=60, wait_for=0.2) is not None)
+
+
+def test_request_timeout_bounds_a_slow_upstream(slow_stub):
+    client = HttpClient(timeout=(1.0, 0.2))
+    try:
+        start = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            client.get_json(f"{slow_stub}/data/2.5/weather", {"q": "Chennai"})
+        assert time.monotonic() - start < 0.8
+        assert client.errors == 1
+        assert client.fetch_many([(f"{slow_stub}/data/2.5/weather", {"q": "Chennai"})]) == [None]
+    finally:
+        client.close()
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from utils.ingest import IngestQueue
+
+
+def _put_in_thread(queue, item):
+    thread = threading.Thread(target=queue.put, args=(item,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_blocked(queue, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not queue.blocked:
+        assert time.monotonic() < deadline, "put() never blocked"
+        time.sleep(0.005)
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        IngestQueue(4, "drop-newest")
+
+
+def test_drop_oldest_discards_the_front():
+    queue = IngestQueue(3, "drop-oldest")
+    for i in range(5):
+        queue.put(i)
+    assert queue.get_batch() == [2, 3, 4]
+    assert (queue.dropped, queue.high_water) == (2, 3)
+
+
+def test_coalesce_replaces_in_place_and_keeps_the_pods_turn():
+    queue = IngestQueue(4, "coalesce")
+    queue.put("p1-a", key="P1")
+    queue.put("p2-a", key="P2")
+    queue.put("p1-b", key="P1")
+    queue.put("p3-a", key="P3")
+    assert queue.get_batch() == ["p1-b", "p2-a", "p3-a"]
+    assert (queue.coalesced, queue.dropped) == (1, 0)
+
+
+def test_coalesce_drops_the_oldest_pod_when_a_new_pod_arrives_full():
+    queue = IngestQueue(2, "coalesce")
+    queue.put("p1-a", key="P1")
+    queue.put("p2-a", key="P2")
+    queue.put("p1-b", key="P1")      # same pod: no room needed
+    queue.put("p3-a", key="P3")      # new pod at capacity: P1 goes
+    assert queue.get_batch() == ["p2-a", "p3-a"]
+    assert (queue.coalesced, queue.dropped) == (1, 1)
+
+
+def test_get_batch_honours_max_items_and_timeout():
+    queue = IngestQueue(10, "drop-oldest")
+    for i in range(5):
+        queue.put(i)
+    assert queue.get_batch(max_items=2) == [0, 1]
+    assert queue.get_batch() == [2, 3, 4]
+    start = time.monotonic()
+    assert queue.get_batch(timeout=0.05) == []
+    assert time.monotonic() - start >= 0.04
+
+
+def test_block_waits_for_room_and_wakes_after_get_batch():
+    queue = IngestQueue(2, "block")
+    queue.put(1)
+    queue.put(2)
+    producer = _put_in_thread(queue, 3)
+    _wait_blocked(queue)
+    assert producer.is_alive()
+
+    assert queue.get_batch(max_items=1) == [1]
+    producer.join(timeout=2)
+    assert not producer.is_alive()
+    assert queue.get_batch() == [2, 3]
+    assert queue.dropped == 0 and queue.blocked == 1 and queue.blocked_s > 0
+
+
+def test_close_releases_a_blocked_put():
+    queue = IngestQueue(1, "block")
+    queue.put(1)
+    producer = _put_in_thread(queue, 2)
+    _wait_blocked(queue)
+
+    queue.close()
+    producer.join(timeout=2)
+    assert not producer.is_alive()
+    assert queue.closed and queue.dropped == 1
+    assert queue.get_batch() == [1]
+    assert queue.get_batch(timeout=5) == []      # closed: returns at once
@@ -0,0 +1,170 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+# Declarative rule table. Every rule watches one metric for every pod:
+#
+#   kind   "threshold" compares the value itself, "rate" its change per second
+#   op     "<" or ">"; the alert fires when `value <op> threshold`
+#   clear  hysteresis level: an active alert only resolves once the value is
+#          back on the safe side of `clear` (defaults to `threshold`)
+#   for    seconds the condition must hold continuously before firing
+DEFAULT_RULES = [
+    {"name": "battery_critical", "metric": "battery", "kind": "threshold", "op": "<",
+     "threshold": 20, "clear": 25, "level": "CRITICAL", "message": "Battery at {value:.1f}%"},
+    {"name": "battery_drain", "metric": "battery", "kind": "rate", "op": "<",
+     "threshold": -2.0, "clear": -1.0, "for": 5, "level": "WARNING",
+     "message": "Battery draining at {value:.2f}%/s"},
+    {"name": "temperature_high", "metric": "temperature", "kind": "threshold", "op": ">",
+     "threshold": 80, "clear": 75, "level": "WARNING", "message": "Temperature at {value:.1f}°C"},
+    {"name": "pressure_low", "metric": "pressure", "kind": "threshold", "op": "<",
+     "threshold": 92000, "clear": 92500, "for": 1, "level": "WARNING",
+     "message": "Pressure out of range: {value:.0f} Pa"},
+    {"name": "pressure_high", "metric": "pressure", "kind": "threshold", "op": ">",
+     "threshold": 108000, "clear": 107500, "for": 1, "level": "WARNING",
+     "message": "Pressure out of range: {value:.0f} Pa"},
+    {"name": "headway_margin", "metric": "margin", "kind": "threshold", "op": "<",
+     "threshold": 0, "clear": 200, "level": "CRITICAL",
+     "message": "Cannot stop before pod ahead: margin {value:.0f} m"},
+    {"name": "overspeed", "metric": "overspeed", "kind": "threshold", "op": ">",
+     "threshold": 0, "clear": -20, "for": 2, "level": "WARNING",
+     "message": "{value:.0f} km/h over the weather speed limit"},
+    {"name": "battery_forecast", "metric": "time_to_empty", "kind": "threshold", "op": "<",
+     "threshold": 300, "clear": 420, "for": 3, "level": "WARNING",
+     "message": "Battery forecast empty in {value:.0f} s"},
+    {"name": "thermal_forecast", "metric": "time_to_thermal", "kind": "threshold", "op": "<",
+     "threshold": 120, "clear": 180, "for": 3, "level": "WARNING",
+     "message": "Thermal limit forecast in {value:.0f} s"},
+]
+
+
+class AlertEngine:
+    # Evaluates the rule table over batches of pod readings. All per-pod
+    # state (active flag, pending-since time, previous value for rate rules)
+    # lives in arrays indexed by a stable pod row, so one batch is a handful
+    # of vectorized comparisons per rule; Python only runs for pods whose
+    # alert state actually changes.
+
+    def __init__(self, rules=DEFAULT_RULES, max_resolved=500):
+        self.rules       = [dict(rule) for rule in rules]
+        self.active      = {}                          # (rule, pod) -> alert
+        self.resolved    = deque(maxlen=max_resolved)
+        self.evaluations = 0
+        self._rows       = {}
+        self._pod_ids    = []
+        self._last_ids   = None
+        self._last_rows  = None
+        self._capacity   = 0
+        self._state      = {}
+        self._prev       = {}
+        self._lock       = threading.Lock()
+        self._grow(64)
+
+    def _grow(self, capacity):
+        def extend(arr, fill):
+            out = np.full(capacity, fill, dtype=arr.dtype if arr is not None else type(fill))
+            if arr is not None:
+                out[:len(arr)] = arr
+            return out
+
+        for rule in self.rules:
+            state = self._state.setdefault(rule["name"], {"active": None, "since": None})
+            state["active"] = extend(state["active"], False)
+            state["since"]  = extend(state["since"], np.nan)
+        for metric in {rule["metric"] for rule in self.rules}:
+            value, at = self._prev.get(metric, (None, None))
+            self._prev[metric] = (extend(value, np.nan), extend(at, np.nan))
+        self._capacity = capacity
+
+    def _rows_for(self, pod_ids):
+        if pod_ids is self._last_ids:
+            return self._last_rows
+        rows = np.empty(len(pod_ids), dtype=np.intp)
+        for i, pod_id in enumerate(pod_ids):
+            row = self._rows.get(pod_id)
+            if row is None:
+                row = self._rows[pod_id] = len(self._pod_ids)
+                self._pod_ids.append(pod_id)
+            rows[i] = row
+        if len(self._pod_ids) > self._capacity:
+            self._grow(max(self._capacity * 2, len(self._pod_ids)))
+        self._last_ids, self._last_rows = pod_ids, rows
+        return rows
+
+    def evaluate(self, pod_ids, metrics, now=None):
+        # pod_ids: sequence of ids; metrics: {metric: array aligned with pod_ids}
+        now = time.time() if now is None else now
+        with self._lock:
+            rows    = self._rows_for(pod_ids)
+            metrics = {k: np.asarray(v, dtype=np.float64) for k, v in metrics.items()}
+
+            for rule in self.rules:
+                values = metrics.get(rule["metric"])
+                if values is None:
+                    continue
+                if rule["kind"] == "rate":
+                    prev, at = self._prev[rule["metric"]]
+                    dt = now - at[rows]
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        values = np.where(dt > 0, (values - prev[rows]) / dt, np.nan)
+
+                state       = self._state[rule["name"]]
+                clear_level = rule.get("clear", rule["threshold"])
+                with np.errstate(invalid="ignore"):
+                    if rule["op"] == "<":
+                        firing, safe = values < rule["threshold"], values >= clear_level
+                    else:
+                        firing, safe = values > rule["threshold"], values <= clear_level
+
+                since = state["since"][rows]
+                since = np.where(firing, np.where(np.isnan(since), now, since), np.nan)
+                state["since"][rows] = since
+
+                active  = state["active"][rows]
+                opened  = firing & ~active & (now - since >= rule.get("for", 0))
+                cleared = active & safe
+
+                for i in np.flatnonzero(opened):
+                    self._open(rule, self._pod_ids[rows[i]], values[i], now)
+                for i in np.flatnonzero(cleared):
+                    self._close(rule, self._pod_ids[rows[i]], values[i], now)
+                state["active"][rows[opened]]  = True
+                state["active"][rows[cleared]] = False
+
+            for metric, values in metrics.items():
+                if metric in self._prev:
+                    prev, at = self._prev[metric]
+                    prev[rows] = values
+                    at[rows]   = now
+            self.evaluations += 1
+
+    def _open(self, rule, pod_id, value, now):
+        self.active[(rule["name"], pod_id)] = {
+            "Time":     datetime.fromtimestamp(now).strftime("%H:%M:%S"),
+            "Level":    rule["level"],
+            "Pod":      pod_id,
+            "Rule":     rule["name"],
+            "Message":  rule["message"].format(value=value),
+            "Resolved": None,
+        }
+
+    def _close(self, rule, pod_id, value, now):
+        alert = self.active.pop((rule["name"], pod_id), None)
+        if alert is not None:
+            alert["Resolved"] = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+            self.resolved.append(alert)
+
+    def active_alerts(self):
+        with self._lock:
+            return sorted(self.active.values(), key=lambda a: (a["Level"] != "CRITICAL", a["Time"]))
+
+    def resolved_alerts(self, n=50):
+        with self._lock:
+            return list(self.resolved)[-n:][::-1]
+
+    def clear_resolved(self):
+        with self._lock:
+            self.resolved.clear()
@@ -0,0 +1,120 @@
+import json
+import math
+import struct
+from datetime import datetime
+
+# Pod telemetry travels either as the original JSON object
+#
+#   {"id": "Pod-3", "speed": 845, "battery": 81, "status": "Docked"}
+#
+# or as a compact little-endian binary frame (~20 bytes instead of ~65):
+#
+#   magic "HL" | version u8 | flags u8 | status u8 | speed f32 | battery f32
+#   | [sent f64 if flags & HAS_SENT] | id length u8 | id utf-8
+#
+# Both are decoded exactly once, on ingestion, into a PodRecord.
+
+STATUSES = ("Operational", "Maintenance", "Docked")
+MAGIC    = b"HL"
+VERSION  = 1
+HAS_SENT = 0x01
+
+MAX_SPEED = 2000   # km/h; anything above is a sensor or encoding fault
+
+_HEADER = struct.Struct("<2sBBBff")
+_SENT   = struct.Struct("<d")
+
+
+class PodRecord:
+    __slots__ = ("id", "speed", "battery", "status", "sent", "received", "timestamp")
+
+    def __init__(self, id, speed, battery, status, sent=None, received=None):
+        self.id       = id
+        self.speed    = speed
+        self.battery  = battery
+        self.status   = status
+        self.sent     = sent
+        self.received = received or datetime.now()
+        self.timestamp = self.received.strftime("%H:%M:%S")
+
+    def as_dict(self):
+        return {"id": self.id, "speed": self.speed, "battery": self.battery, "status": self.status}
+
+    def __repr__(self):
+        return f"PodRecord({self.as_dict()})"
+
+
+def validate(obj, received=None):
+    if not isinstance(obj, dict):
+        raise ValueError("payload is not an object")
+    pod_id, speed, battery, status = obj.get("id"), obj.get("speed"), obj.get("battery"), obj.get("status")
+    if not isinstance(pod_id, str) or not pod_id:
+        raise ValueError("id must be a non-empty string")
+    for name, value in (("speed", speed), ("battery", battery)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number")
+        # NaN compares False against every bound, so check it first
+        if isinstance(value, float) and not math.isfinite(value):
+            raise ValueError(f"{name} must be finite")
+    if not 0 <= battery <= 100:
+        raise ValueError("battery out of range")
+    if not 0 <= speed <= MAX_SPEED:
+        raise ValueError("speed out of range")
+    if status not in STATUSES:
+        raise ValueError(f"unknown status {status!r}")
+    sent = obj.get("sent")
+    return PodRecord(pod_id, speed, battery, status,
+                     sent=float(sent) if isinstance(sent, (int, float)) else None,
+                     received=received)
+
+
+def decode(payload, received=None):
+    # Raises ValueError for anything that isn't a valid pod record
+    if payload[:2] == MAGIC:
+        return decode_binary(payload, received)
+    try:
+        obj = json.loads(payload)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"invalid JSON: {e}") from None
+    return validate(obj, received)
+
+
+def decode_binary(payload, received=None):
+    try:
+        magic, version, flags, status, speed, battery = _HEADER.unpack_from(payload)
+        offset = _HEADER.size
+        sent   = None
+        if flags & HAS_SENT:
+            (sent,) = _SENT.unpack_from(payload, offset)
+            offset += _SENT.size
+        id_len = payload[offset]
+        raw_id = payload[offset + 1:offset + 1 + id_len]
+        pod_id = raw_id.decode()
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"truncated binary frame: {e}") from None
+    if version != VERSION or status >= len(STATUSES) or len(raw_id) != id_len:
+        raise ValueError("malformed binary frame")
+    return validate({"id": pod_id, "speed": _number(speed), "battery": _number(battery),
+                     "status": STATUSES[status], "sent": sent}, received)
+
+
+def _number(value):
+    # float32 on the wire; hand integral readings back as ints like the JSON path
+    return int(value) if value.is_integer() else round(value, 2)
+
+
+def encode_json(pod, sent=None):
+    obj = dict(pod)
+    if sent is not None:
+        obj["sent"] = sent
+    return json.dumps(obj).encode()
+
+
+def encode_binary(pod, sent=None):
+    pod_id = pod["id"].encode()
+    flags  = HAS_SENT if sent is not None else 0
+    frame  = _HEADER.pack(MAGIC, VERSION, flags, STATUSES.index(pod["status"]),
+                          pod["speed"], pod["battery"])
+    if sent is not None:
+        frame += _SENT.pack(sent)
+    return frame + bytes((len(pod_id),)) + pod_id
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+# N-way pod comparison over recorded telemetry. Every statistic is computed
+# for all pods at once: rows are ordered by (pod, time) with one sort,
+# group sums come from bincount and percentiles from one sort of the values
+# within each pod, so comparing 20 pods costs about the same as comparing 2.
+
+PERCENTILES = (50, 95, 99)
+MAX_GAP     = 10.0   # s; readings further apart don't count as travel
+
+
+def _group_order(codes, values):
+    # Order by (code, value) as one float argsort: each code gets its own
+    # band wider than the value range (much faster than np.lexsort)
+    lo   = values.min()
+    band = values.max() - lo + 1.0
+    return np.argsort((values - lo) + codes * band)
+
+
+def group_percentiles(codes, values, n_groups, percentiles=PERCENTILES):
+    # {p: per-group percentile}, linear interpolation like np.percentile
+    ranked = values[_group_order(codes, values)]
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    filled = counts > 0
+    out    = {}
+    for p in percentiles:
+        pos  = (counts[filled] - 1) * (p / 100)
+        lo   = np.floor(pos).astype(np.intp)
+        frac = pos - lo
+        base = starts[filled] + lo
+        nxt  = np.minimum(base + 1, starts[filled] + counts[filled] - 1)
+        out[p] = np.full(n_groups, np.nan)
+        out[p][filled] = ranked[base] + (ranked[nxt] - ranked[base]) * frac
+    return out
+
+
+def compare_pods(frame, metrics=("speed", "battery")):
+    # frame: pod_id, ts, speed (km/h), battery (%) in any order. Returns one
+    # row per pod: samples, <metric>_mean/_p50/_p95/_p99/_var, distance_km
+    # and energy_per_km (% battery used per km travelled).
+    if not len(frame):
+        return pd.DataFrame()
+    codes, pods = pd.factorize(frame["pod_id"], sort=True)
+    t       = frame["ts"].to_numpy("datetime64[ns]").astype(np.int64) / 1e9
+    order   = _group_order(codes, t)
+    codes   = codes[order]
+    t       = t[order]
+    n       = len(pods)
+    samples = np.bincount(codes, minlength=n)
+    out     = {"samples": samples}
+    columns = {}
+    for metric in metrics:
+        v = columns[metric] = frame[metric].to_numpy(np.float64)[order]
+        mean = np.bincount(codes, v, n) / samples
+        dev  = v - mean[codes]
+        out[f"{metric}_mean"] = mean
+        for p, value in group_percentiles(codes, v, n).items():
+            out[f"{metric}_p{p}"] = value
+        out[f"{metric}_var"] = np.bincount(codes, dev * dev, n) / np.maximum(samples - 1, 1)
+
+    # Travel and battery use between consecutive readings of the same pod
+    dt   = np.diff(t)
+    step = (codes[1:] == codes[:-1]) & (dt > 0) & (dt <= MAX_GAP)
+    pod  = codes[1:][step]
+    km   = np.bincount(pod, columns["speed"][:-1][step] * dt[step] / 3600, n)
+    used = np.bincount(pod, np.maximum(-np.diff(columns["battery"]), 0)[step], n)
+    out["distance_km"] = km
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out["energy_per_km"] = np.where(km > 0, used / km, np.nan)
+    return pd.DataFrame(out, index=pd.Index(pods, name="pod_id"))
@@ -0,0 +1,287 @@
+import threading
+import time
+
+import numpy as np
+
+from utils.pods import STATUSES
+
+# Latest known state of every pod (simulated fleet and MQTT pods alike),
+# shared by all sessions. Columns are struct-of-arrays with one row per pod,
+# updated in place by the ingestion paths; next to them the store keeps
+#
+#   - an id -> row dict and id list, both append-only, and a lazily
+#     rebuilt id sort order
+#   - one sorted row array per status, plus the rows each status gained
+#     and lost since the last snapshot, recorded only for pods whose
+#     status changed
+#   - a global sequence number bumped on every upsert, and per pod the
+#     sequence of its last change (for "changed since" queries) and the
+#     time its latest reading was received
+#
+# Pages read through snapshot(): an immutable view of the fleet at one
+# sequence number, shared by every reader until the next upsert, so
+# Overview, Pod Tracker and the map all show the same fleet state and
+# get(pod_id) is a dict lookup instead of a scan. Taking a snapshot copies
+# nothing: it reads the live arrays, and the first upsert after it copies
+# just the arrays it writes (copy-on-write). A status filter on a snapshot
+# costs O(matching pods); the per-status arrays are shared by every
+# snapshot until that status gains or loses a pod, and are then patched
+# with just those rows into a new array.
+
+
+class FleetSnapshot:
+
+    def __init__(self, seq, statuses, columns, ids, rows, id_order, status, values, updated,
+                 received, groups):
+        self.seq       = seq
+        self.taken     = time.time()
+        self.statuses  = statuses
+        self.columns   = columns
+        self.status    = status
+        self.values    = values
+        self.updated   = updated
+        self.received  = received
+        self._n        = len(status)
+        self._ids      = ids        # shared with FleetState: rows past _n are newer pods
+        self._rows     = rows
+        self._id_order = id_order
+        self._groups   = groups     # ascending rows per status code
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def ids(self):
+        return self._ids[:self._n]
+
+    def _row(self, row):
+        out = {"id": self._ids[row], "status": self.statuses[self.status[row]]}
+        for column in self.columns:
+            out[column] = float(self.values[column][row])
+        out["updated"]  = int(self.updated[row])
+        out["received"] = float(self.received[row])
+        return out
+
+    def get(self, pod_id):
+        # Latest row for one pod as a dict, or None
+        row = self._rows.get(pod_id)
+        if row is None or row >= self._n:
+            return None
+        return self._row(row)
+
+    def counts(self):
+        return {status: len(rows) for status, rows in zip(self.statuses, self._groups)}
+
+    def query(self, status=None, sort="id", descending=False, offset=0, limit=50,
+              changed_since=None):
+        # Returns ({"id", "status", columns..., "updated", "received"} for one
+        # page, total matching pods). `changed_since` keeps only pods updated
+        # after that seq.
+        if status is None:
+            rows = np.arange(self._n)
+        else:
+            rows = self._groups[self.statuses.index(status)]
+        if changed_since is not None:
+            rows = rows[self.updated[rows] > changed_since]
+        total = len(rows)
+
+        if sort == "id":
+            keys = self._id_order[rows]
+        elif sort == "status":
+            keys = self.status[rows]
+        elif sort in ("updated", "received"):
+            keys = getattr(self, sort)[rows]
+        else:
+            keys = self.values[sort][rows]
+        if descending:
+            keys = -keys.astype(np.float64)
+        # Ties break on row, so pages stay consistent between calls
+        end  = min(offset + limit, total)
+        kth  = np.partition(keys, end - 1)[end - 1] if 0 < end < total // 2 else np.nan
+        if not np.isnan(kth):
+            # Only the first `end` rows need to be in order
+            cand = np.flatnonzero(keys <= kth)
+            top  = cand[np.lexsort((rows[cand], keys[cand]))]
+        else:
+            top  = np.lexsort((rows, keys))
+        page = rows[top[offset:end]]
+
+        out = {"id":     [self._ids[row] for row in page.tolist()],
+               "status": [self.statuses[code] for code in self.status[page].tolist()]}
+        for column in self.columns:
+            out[column] = self.values[column][page]
+        out["updated"]  = self.updated[page]
+        out["received"] = self.received[page]
+        return out, total
+
+    def changed_since(self, seq):
+        # Ids of pods updated after sequence `seq`
+        return [self._ids[row] for row in np.flatnonzero(self.updated > seq).tolist()]
+
+
+class FleetState:
+
+    _META = ("status", "updated", "received")
+
+    def __init__(self, columns=("speed", "battery", "temperature", "chainage"),
+                 statuses=STATUSES, capacity=1024):
+        if set(columns) & set(self._META):
+            raise ValueError(f"column names {self._META} are reserved")
+        self.columns    = tuple(columns)
+        self.statuses   = list(statuses)
+        self.seq        = 0
+        self._codes     = {status: i for i, status in enumerate(self.statuses)}
+        self._rows      = {}
+        self._ids       = []
+        self._id_order  = None
+        self._last_ids  = None
+        self._last_rows = None
+        self._groups    = [np.empty(0, dtype=np.intp) for _ in self.statuses]
+        self._gained    = [set() for _ in self.statuses]   # since the last snapshot
+        self._lost      = [set() for _ in self.statuses]
+        self._capacity  = 0
+        self._arrays    = {}       # status, updated, received and one per column
+        self._shared    = set()    # arrays the latest snapshot reads; copied on next write
+        self._snapshot  = None
+        self._lock      = threading.Lock()
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        def extend(name, fill, dtype):
+            out = np.full(capacity, fill, dtype=dtype)
+            arr = self._arrays.get(name)
+            if arr is not None:
+                out[:len(arr)] = arr
+            return out
+        arrays = {"status":   extend("status", -1, np.int8),
+                  "updated":  extend("updated", 0, np.int64),
+                  "received": extend("received", np.nan, np.float64)}
+        arrays.update({c: extend(c, np.nan, np.float64) for c in self.columns})
+        self._arrays   = arrays    # fresh arrays: nothing is shared any more
+        self._shared   = set()
+        self._capacity = capacity
+
+    def _own(self, name):
+        # Writable array: copied first if the latest snapshot still reads it
+        if name in self._shared:
+            self._shared.discard(name)
+            self._arrays[name] = self._arrays[name].copy()
+        return self._arrays[name]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _rows_for(self, pod_ids):
+        if pod_ids is self._last_ids:
+            return self._last_rows
+        rows = np.empty(len(pod_ids), dtype=np.intp)
+        for i, pod_id in enumerate(pod_ids):
+            row = self._rows.get(pod_id)
+            if row is None:
+                # Append the id before publishing its row, so a reader that
+                # finds the row always finds the id
+                self._ids.append(pod_id)
+                row = self._rows[pod_id] = len(self._ids) - 1
+                self._id_order = None
+            rows[i] = row
+        if len(self._ids) > self._capacity:
+            self._grow(max(self._capacity * 2, len(self._ids)))
+        self._last_ids, self._last_rows = pod_ids, rows
+        return rows
+
+    def upsert(self, pod_ids, status=None, received=None, **values):
+        # status: labels or codes aligned with pod_ids; values: {column: array};
+        # received: epoch seconds of the readings (default now). Columns left
+        # out keep their previous value. Returns the new sequence.
+        if not len(pod_ids):
+            return self.seq
+        if status is not None and not isinstance(status, np.ndarray):
+            status = np.array([self._codes[s] for s in status], dtype=np.int8)
+        with self._lock:
+            rows    = self._rows_for(pod_ids)
+            changed = np.zeros(len(rows), dtype=bool)
+            for column, new in values.items():
+                new = np.asarray(new, dtype=np.float64)
+                arr = self._own(column)
+                old = arr[rows]
+                changed |= (old != new) & ~(np.isnan(old) & np.isnan(new))
+                arr[rows] = new
+            if status is not None:
+                arr   = self._own("status")
+                old   = arr[rows]
+                moved = old != status
+                # Only pods whose status changed touch the status index; a
+                # pod that moves back before the next snapshot cancels out
+                for row, before, after in zip(rows[moved].tolist(), old[moved].tolist(),
+                                              status[moved].tolist()):
+                    if before >= 0:
+                        if row in self._gained[before]:
+                            self._gained[before].discard(row)
+                        else:
+                            self._lost[before].add(row)
+                    if row in self._lost[after]:
+                        self._lost[after].discard(row)
+                    else:
+                        self._gained[after].add(row)
+                arr[rows] = status
+                changed |= moved
+            self._own("received")[rows] = time.time() if received is None else received
+            self.seq += 1
+            self._own("updated")[rows[changed]] = self.seq
+            return self.seq
+
+    def _order_by_id(self):
+        if self._id_order is None:
+            rank = np.empty(len(self._ids), dtype=np.intp)
+            rank[np.argsort(np.array(self._ids), kind="stable")] = np.arange(len(self._ids))
+            self._id_order = rank
+        return self._id_order
+
+    def _patch_group(self, code):
+        # New sorted array for a status that gained or lost rows; O(group)
+        # copy plus O(changed log group), never a scan of the fleet
+        lost, gained = self._lost[code], self._gained[code]
+        if not lost and not gained:
+            return
+        group = self._groups[code]
+        if lost:
+            lost  = np.sort(np.fromiter(lost, dtype=np.intp, count=len(lost)))
+            group = np.delete(group, np.searchsorted(group, lost))
+        if gained:
+            gained = np.sort(np.fromiter(gained, dtype=np.intp, count=len(gained)))
+            group  = np.insert(group, np.searchsorted(group, gained), gained)
+        self._groups[code] = group
+        self._lost[code], self._gained[code] = set(), set()
+
+    def snapshot(self):
+        # The current snapshot; a new one is only built if an upsert happened
+        # since the last one was taken
+        snap = self._snapshot
+        if snap is not None and snap.seq == self.seq:
+            return snap
+        with self._lock:
+            snap = self._snapshot
+            if snap is None or snap.seq != self.seq:
+                n = len(self._ids)
+                for code in range(len(self.statuses)):
+                    self._patch_group(code)
+                arrays = self._arrays
+                self._shared = set(arrays)
+                snap = self._snapshot = FleetSnapshot(
+                    self.seq, self.statuses, self.columns, self._ids, self._rows,
+                    self._order_by_id(), arrays["status"][:n],
+                    {c: arrays[c][:n] for c in self.columns},
+                    arrays["updated"][:n], arrays["received"][:n], list(self._groups))
+            return snap
+
+    def get(self, pod_id):
+        return self.snapshot().get(pod_id)
+
+    def counts(self):
+        return self.snapshot().counts()
+
+    def query(self, *args, **kwargs):
+        return self.snapshot().query(*args, **kwargs)
+
+    def changed_since(self, seq):
+        return self.snapshot().changed_since(seq)
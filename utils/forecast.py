@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+
+# Battery and thermal forecasts for a whole fleet.
+#
+# For every pod the drain rate (%/s) and heating rate (°C/s) are fitted as
+# least-squares slopes over its last `window` 1 s history buckets, and
+# projected from the current reading to time-to-empty and time to the
+# thermal limit. An update is a handful of vectorized passes over one
+# (pods, window) matrix per quantity, so its cost is fixed by fleet size
+# and window; every run is timed and the next one is pushed back whenever
+# forecasting would take more than `max_share` of wall time.
+
+THERMAL_LIMIT = 80.0   # °C, the temperature_high alert threshold
+
+
+def trends(t, *ys):
+    # Least-squares slope against t for each row of every y, ignoring NaNs
+    x   = t - np.fmax.reduce(t, axis=1, keepdims=True)   # centred: keeps precision
+    out = []
+    for y in ys:
+        ok = ~np.isnan(x + y)
+        if ok.all():
+            xs, n = x, x.shape[1]
+        else:
+            xs, y, n = np.where(ok, x, 0.0), np.where(ok, y, 0.0), ok.sum(axis=1)
+        sx  = xs.sum(axis=1)
+        den = n * np.einsum("ij,ij->i", xs, xs) - sx * sx
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out.append(np.where(den > 0, (n * np.einsum("ij,ij->i", xs, y) - sx * y.sum(axis=1))
+                                / den, np.nan))
+    return out
+
+
+def time_to(level, rate, limit):
+    # Seconds until `level`, moving at `rate` per second, reaches `limit`;
+    # inf while it holds steady or moves away
+    with np.errstate(invalid="ignore", divide="ignore"):
+        left = (limit - level) / rate
+    return np.where(left > 0, left, np.inf)
+
+
+class Forecaster:
+
+    def __init__(self, history, window=30, resolution=1, interval=1.0, max_share=0.05,
+                 thermal_limit=THERMAL_LIMIT):
+        self.history       = history
+        self.window        = window
+        self.resolution    = resolution
+        self.interval      = interval
+        self.max_share     = max_share
+        self.thermal_limit = thermal_limit
+        self.latest        = {}
+        self.runs          = 0
+        self.last_ms       = 0.0
+        self.max_ms        = 0.0
+        self.next_due      = 0.0
+
+    def due(self, now):
+        return now >= self.next_due
+
+    def update(self, pod_ids, battery, temperature, now):
+        start   = time.perf_counter()
+        t, mean = self.history.recent(pod_ids, ("battery", "temperature"), self.resolution,
+                                      self.window)
+        drain, heat = trends(t, mean["battery"], mean["temperature"])
+        tte     = time_to(battery, drain, 0.0)
+        ttt     = time_to(temperature, heat, self.thermal_limit)
+        tte[battery <= 0] = 0.0
+        ttt[temperature >= self.thermal_limit] = 0.0
+        self.latest = {"drain_rate": drain, "heat_rate": heat,
+                       "time_to_empty": tte, "time_to_thermal": ttt}
+
+        cost = time.perf_counter() - start
+        self.runs    += 1
+        self.last_ms  = cost * 1000
+        self.max_ms   = max(self.max_ms, self.last_ms)
+        self.next_due = now + max(self.interval, cost / self.max_share)
+        return self.latest
+
+    def stats(self):
+        return {"runs": self.runs, "last_ms": round(self.last_ms, 3),
+                "max_ms": round(self.max_ms, 3), "interval": self.interval}
@@ -0,0 +1,129 @@
+import csv
+import os
+import sqlite3
+import threading
+import time
+
+# City name -> coordinates cache in a single SQLite file, shared by every
+# dashboard process on the host (WAL mode, so readers never block the
+# writer). Failed lookups are stored too, as negative entries that expire
+# after `negative_ttl`, so a typo doesn't reach the API on every rerun.
+# Transient failures (timeouts, auth or server errors, malformed replies)
+# are not stored, but the city isn't fetched again for `retry_after`
+# seconds, so an API outage costs one request timeout, not one per rerun.
+# Entries are evicted least-recently-used once the table exceeds
+# `max_entries`; gazetteer rows are pinned and never evicted.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    key       TEXT PRIMARY KEY,
+    name      TEXT NOT NULL,
+    latitude  REAL,
+    longitude REAL,
+    found     INTEGER NOT NULL,
+    pinned    INTEGER NOT NULL DEFAULT 0,
+    fetched   REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def _key(city):
+    return " ".join(city.split()).casefold()
+
+
+class GeocodeCache:
+
+    def __init__(self, path, max_entries=10_000, negative_ttl=3600.0, retry_after=30.0):
+        self.path         = path
+        self.max_entries  = max_entries
+        self.negative_ttl = negative_ttl
+        self.retry_after  = retry_after
+        self.hits         = 0
+        self.misses       = 0
+        self._failed      = {}     # key -> time of the last failed fetch
+        self._lock        = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def warm(self, gazetteer_path):
+        # Loads the bundled city list; existing rows are refreshed and pinned
+        now = time.time()
+        with open(gazetteer_path, newline="", encoding="utf-8") as fh:
+            rows = [(_key(row["city"]), row["city"], float(row["latitude"]),
+                     float(row["longitude"]), now, now)
+                    for row in csv.DictReader(fh)]
+        with self._lock:
+            self._db.executemany(
+                "INSERT INTO geocode VALUES (?, ?, ?, ?, 1, 1, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET name=excluded.name, latitude=excluded.latitude, "
+                "longitude=excluded.longitude, found=1, pinned=1", rows)
+        return len(rows)
+
+    def get(self, city):
+        # Returns (hit, result); result is None for a cached negative lookup
+        key = _key(city)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT name, latitude, longitude, found, fetched FROM geocode WHERE key = ?",
+                (key,)).fetchone()
+            if row is None or (not row[3] and now - row[4] > self.negative_ttl):
+                self.misses += 1
+                return False, None
+            self._db.execute("UPDATE geocode SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        name, lat, lon, found, _ = row
+        return True, ({"latitude": lat, "longitude": lon, "name": name} if found else None)
+
+    def put(self, city, result):
+        # result: {"latitude", "longitude"} or None to record a failed lookup
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?, "
+                "COALESCE((SELECT pinned FROM geocode WHERE key = ?), 0), ?, ?)",
+                (_key(city), city, result and result["latitude"], result and result["longitude"],
+                 int(result is not None), _key(city), now, now))
+            self._evict()
+
+    def _evict(self):
+        (count,) = self._db.execute("SELECT COUNT(*) FROM geocode WHERE pinned = 0").fetchone()
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM geocode WHERE key IN (SELECT key FROM geocode WHERE pinned = 0 "
+                "ORDER BY last_used LIMIT ?)", (count - self.max_entries,))
+
+    def lookup(self, city, fetch):
+        # fetch(city) -> result, or None when the city does not exist. It may
+        # raise on other failures; those are re-raised, and for `retry_after`
+        # seconds afterwards the city resolves to None without a fetch.
+        hit, result = self.get(city)
+        if hit:
+            return result
+        key    = _key(city)
+        failed = self._failed.get(key)
+        if failed is not None and time.time() - failed < self.retry_after:
+            return None
+        try:
+            result = fetch(city)
+        except Exception:
+            now = time.time()
+            self._failed = {k: t for k, t in self._failed.items() if now - t < self.retry_after}
+            self._failed[key] = now
+            raise
+        self._failed.pop(key, None)
+        self.put(city, result)
+        return result
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
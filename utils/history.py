@@ -0,0 +1,436 @@
+import threading
+import time
+
+import numpy as np
+
+
+def _ring_slots(times, total, capacity, since=None):
+    # Slots of one ring row, oldest first, holding samples with time >= since.
+    # Each half of a wrapped ring is sorted, so this is a binary search plus
+    # an index array for just the selected window.
+    n = min(total, capacity)
+    a = total % capacity if total > capacity else 0
+    if since is None:
+        return (np.arange(n) + a) % capacity
+    if total <= capacity:
+        return np.arange(np.searchsorted(times[:n], since), n)
+    k = np.searchsorted(times[a:], since)
+    if k < capacity - a:
+        return np.concatenate((np.arange(a + k, capacity), np.arange(a)))
+    return np.arange(np.searchsorted(times[:a], since), a)
+
+
+class _Rollup:
+    # count / sum / min / max / last per bucket of `resolution` seconds, one
+    # ring row per pod (or a single row for fleet-wide rollups). Samples only
+    # touch the open bucket's accumulators; when a bucket closes it is
+    # written to the ring once and merged into the next coarser rollup
+    # (`parent`), so every sample costs the same however many resolutions
+    # are kept. Each resolution must be a multiple of the previous one; a
+    # coarser rollup's open bucket trails by the finer bucket still open.
+    # `on_close(rollup, rows, times, count, stats)` sees every closed bucket.
+
+    STATS = ("sum", "min", "max", "last")
+    EMPTY = {"sum": 0.0, "min": np.inf, "max": -np.inf, "last": np.nan}
+
+    def __init__(self, fields, resolution, capacity, rows, parent=None, on_close=None):
+        self.fields     = tuple(fields)
+        self.resolution = resolution
+        self.capacity   = capacity
+        self.parent     = parent
+        self.on_close   = on_close
+        self.late       = 0
+        self.rows       = 0
+        self.grow(rows)
+
+    def grow(self, rows):
+        prev  = dict(self.__dict__) if self.rows else {}
+        ring  = (rows, self.capacity)
+        stats = (len(self.fields), rows, self.capacity)
+        open_ = (len(self.fields), rows)
+        self.time      = _extend(prev.get("time"), np.nan, ring)
+        self.count     = _extend(prev.get("count"), 0.0, ring)
+        self.stats     = {s: _extend(prev.get("stats", {}).get(s), np.nan, stats, axis=1)
+                          for s in self.STATS}
+        self.total     = _extend(prev.get("total"), 0, rows, dtype=np.int64)
+        self.current   = _extend(prev.get("current"), -np.inf, rows)
+        self.acc_count = _extend(prev.get("acc_count"), 0.0, rows)
+        self.acc       = {s: _extend(prev.get("acc", {}).get(s), self.EMPTY[s], open_, axis=1)
+                          for s in self.STATS}
+        self.rows      = rows
+
+    def clear(self):
+        self.rows = 0
+        self.grow(len(self.total))
+
+    def add(self, rows, t, count, total, lo, hi, last):
+        # rows: index array or slice; total/lo/hi/last: (fields, len(rows))
+        bucket = np.floor(t / self.resolution) * self.resolution
+        cur    = self.current[rows]
+        if (cur != bucket).any():
+            new = cur < bucket
+            if new.all():
+                self._close(rows)
+                self.current[rows] = bucket
+            else:
+                rows = _row_array(rows, self.rows)
+                if new.any():
+                    self._close(rows[new])
+                    self.current[rows[new]] = bucket
+                keep = self.current[rows] == bucket   # older buckets are final; late samples drop
+                if not keep.all():
+                    self.late += int((~keep).sum())
+                    rows  = rows[keep]
+                    count = np.asarray(count)[keep] if np.ndim(count) else count
+                    total, lo, hi, last = (v[:, keep] for v in (total, lo, hi, last))
+        acc = self.acc
+        self.acc_count[rows] += count
+        acc["sum"][:, rows]  += total
+        acc["min"][:, rows]   = np.minimum(acc["min"][:, rows], lo)
+        acc["max"][:, rows]   = np.maximum(acc["max"][:, rows], hi)
+        acc["last"][:, rows]  = last
+
+    def _close(self, rows):
+        count = self.acc_count[rows].copy()   # rows may be a slice; keep no views
+        if not (count > 0).all():
+            rows  = _row_array(rows, self.rows)[count > 0]
+            count = count[count > 0]
+            if not len(rows):
+                return
+        self.total[rows] += 1
+        slot, rows = _ring_column(self.total[rows] - 1, self.capacity, rows, self.rows)
+        closed = self.current[rows].copy()
+        done   = {s: self.acc[s][:, rows].copy() for s in self.STATS}
+        self.time[rows, slot]  = closed
+        self.count[rows, slot] = count
+        for s in self.STATS:
+            self.stats[s][:, rows, slot] = done[s]
+            self.acc[s][:, rows] = self.EMPTY[s]
+        self.acc_count[rows] = 0.0
+        if self.on_close is not None:
+            self.on_close(self, _row_array(rows, self.rows), closed, count, done)
+        if self.parent is not None:
+            # Buckets nest, so each closed bucket lands in one parent bucket
+            if (closed == closed[0]).all():
+                self.parent.add(rows, closed[0], count, *(done[s] for s in self.STATS))
+                return
+            rows = _row_array(rows, self.rows)
+            for t in np.unique(closed):
+                sel = closed == t
+                self.parent.add(rows[sel], t, count[sel], *(done[s][:, sel] for s in self.STATS))
+
+    def read(self, row, since=None):
+        slots = _ring_slots(self.time[row], int(self.total[row]), self.capacity, since)
+        time_ = self.time[row, slots]
+        count = self.count[row, slots]
+        stats = {s: self.stats[s][:, row, slots] for s in self.STATS}
+        if self.acc_count[row] > 0 and (since is None or self.current[row] >= since):
+            # include the bucket still being filled
+            time_ = np.append(time_, self.current[row])
+            count = np.append(count, self.acc_count[row])
+            stats = {s: np.column_stack((v, self.acc[s][:, row])) for s, v in stats.items()}
+        return self.columns(time_, count, stats)
+
+    def columns(self, time_, count, stats):
+        out = {"time": time_, "count": count}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for i, f in enumerate(self.fields):
+                out[f]           = stats["sum"][i] / count
+                out[f"{f}_min"]  = stats["min"][i]
+                out[f"{f}_max"]  = stats["max"][i]
+                out[f"{f}_last"] = stats["last"][i]
+        return out
+
+
+class FleetHistory:
+    # Process-wide telemetry history for a fleet. Raw samples live in one
+    # (field, pod row, ring slot) array -- each field's rings contiguous --
+    # so a batch of readings for many pods is a single indexed write. Next to
+    # the raw samples each pod keeps rollups at coarser `resolutions`
+    # (seconds), and the fleet as a whole keeps the same rollups across all
+    # pods. Reads copy only the requested window, never the whole ring.
+    #
+    # Memory is about 8 bytes per pod * (capacity * (fields + 1)
+    # + rollup_capacity * len(resolutions) * (4 * fields + 3)).
+    #
+    # `on_close(resolution, buckets)` receives each batch of per-pod buckets
+    # as they close (same columns as `pod(..., resolution)` plus "pod_id"),
+    # e.g. to persist them. It runs under the history lock on the appending
+    # thread, so it should only hand the rows off.
+
+    def __init__(self, fields, capacity=3600, resolutions=(1, 60), rollup_capacity=None,
+                 on_close=None):
+        self.fields          = tuple(fields)
+        self.capacity        = capacity
+        self.resolutions     = tuple(sorted(resolutions))
+        self.rollup_capacity = rollup_capacity or max(capacity // 10, 30)
+        self.on_close        = on_close
+        self._rows      = {}
+        self._pod_ids   = []
+        self._last_ids  = None
+        self._last_rows = None
+        self._n_rows    = 0
+        self._time      = None
+        self._data      = None
+        self._total     = None
+        self._rollups   = self._chain(0, on_close and self._closed)
+        self._fleet     = self._chain(1)
+        self._lock      = threading.Lock()
+        self._grow(8)
+
+    def _chain(self, rows, on_close=None):
+        # Finest resolution first, each feeding the next coarser one
+        chain, parent = {}, None
+        for res in reversed(self.resolutions):
+            chain[res] = parent = _Rollup(self.fields, res, self.rollup_capacity, rows, parent,
+                                          on_close)
+        return chain
+
+    def _closed(self, rollup, rows, times, count, stats):
+        buckets = rollup.columns(times, count, stats)
+        buckets["pod_id"] = [self._pod_ids[row] for row in rows]
+        self.on_close(rollup.resolution, buckets)
+
+    def _grow(self, rows):
+        self._time  = _extend(self._time, np.nan, (rows, self.capacity))
+        self._data  = _extend(self._data, np.nan, (len(self.fields), rows, self.capacity), axis=1)
+        self._total = _extend(self._total, 0, rows, dtype=np.int64)
+        for rollup in self._rollups.values():
+            rollup.grow(rows)
+        self._n_rows = rows
+
+    def _rows_for(self, pod_ids):
+        # Row index for a batch of ids; a slice when the rows are contiguous
+        # (e.g. the whole simulated fleet), which keeps every write a view
+        if pod_ids is self._last_ids:
+            return self._last_rows
+        rows = np.empty(len(pod_ids), dtype=np.intp)
+        for i, pod_id in enumerate(pod_ids):
+            row = self._rows.get(pod_id)
+            if row is None:
+                row = self._rows[pod_id] = len(self._pod_ids)
+                self._pod_ids.append(pod_id)
+            rows[i] = row
+        if len(self._pod_ids) > self._n_rows:
+            self._grow(max(self._n_rows * 2, len(self._pod_ids)))
+        if len(rows) > 1 and (np.diff(rows) == 1).all():
+            rows = slice(int(rows[0]), int(rows[-1]) + 1)
+        self._last_ids, self._last_rows = pod_ids, rows
+        return rows
+
+    @property
+    def pod_ids(self):
+        return list(self._pod_ids)
+
+    def __contains__(self, pod_id):
+        return pod_id in self._rows
+
+    def append(self, pod_ids, t, values):
+        # pod_ids: sequence of unique ids; values: {field: array aligned with pod_ids}
+        if not len(pod_ids):
+            return
+        matrix = np.array([values[f] if f in values else np.full(len(pod_ids), np.nan)
+                           for f in self.fields], dtype=np.float64)
+        if matrix.shape[1] == 1:
+            fleet = (matrix,) * 4
+        else:
+            fleet = (matrix.sum(axis=1, keepdims=True), matrix.min(axis=1, keepdims=True),
+                     matrix.max(axis=1, keepdims=True), matrix.mean(axis=1, keepdims=True))
+        with self._lock:
+            rows       = self._rows_for(pod_ids)
+            slot, rows = _ring_column(self._total[rows], self.capacity, rows, self._n_rows)
+            self._time[rows, slot]    = t
+            self._data[:, rows, slot] = matrix
+            self._total[rows] += 1
+            self._rollups[self.resolutions[0]].add(rows, t, 1.0, matrix, matrix, matrix, matrix)
+            self._fleet[self.resolutions[0]].add(_FLEET_ROW, t, float(len(pod_ids)), *fleet)
+
+    def _raw(self, row, slots):
+        out = {"time": self._time[row, slots]}
+        out.update(zip(self.fields, self._data[:, row, slots]))
+        return out
+
+    def pod(self, pod_id, seconds=None, resolution=None, now=None):
+        # Raw samples ({"time", fields...}) or rollup buckets ({"time", "count",
+        # field means, field_min/_max/_last}) of one pod, optionally only the
+        # last `seconds` before `now`
+        since = None if seconds is None else (time.time() if now is None else now) - seconds
+        with self._lock:
+            row = self._rows.get(pod_id)
+            if row is None:
+                return None
+            if resolution is not None:
+                return self._rollups[resolution].read(row, since)
+            return self._raw(row, _ring_slots(self._time[row], int(self._total[row]),
+                                              self.capacity, since))
+
+    def fleet(self, resolution, seconds=None, now=None):
+        # Fleet-wide buckets: field means are over every sample of every pod
+        since = None if seconds is None else (time.time() if now is None else now) - seconds
+        with self._lock:
+            return self._fleet[resolution].read(0, since)
+
+    def recent(self, pod_ids, fields, resolution, n):
+        # Field means of the last `n` closed buckets for a batch of pods,
+        # oldest first: (time, {field: values}), each (len(pod_ids), n) with
+        # NaN where a pod has fewer buckets. One gather per array.
+        with self._lock:
+            rollup = self._rollups[resolution]
+            rows   = self._rows_for(pod_ids)
+            total  = rollup.total[rows]
+            if isinstance(rows, slice) and (total == total[0]).all():
+                # whole batch at the same ring position: gather columns only
+                index = total[0] + np.arange(-n, 0)
+                slots = index % rollup.capacity
+                valid = index >= max(total[0] - rollup.capacity, 0)
+                take  = lambda arr: arr[rows][:, slots]
+            else:
+                rows  = _row_array(rows, self._n_rows)[:, None]
+                index = total[:, None] + np.arange(-n, 0)
+                slots = index % rollup.capacity
+                valid = index >= np.maximum(total - rollup.capacity, 0)[:, None]
+                take  = lambda arr: arr[rows, slots]
+            count = take(rollup.count)
+            out   = {}
+            with np.errstate(invalid="ignore", divide="ignore"):
+                for f in fields:
+                    out[f] = np.where(valid, take(rollup.stats["sum"][self.fields.index(f)]) / count,
+                                      np.nan)
+            return np.where(valid, take(rollup.time), np.nan), out
+
+    def view(self, pod_id):
+        return PodView(self, pod_id)
+
+    def clear(self):
+        with self._lock:
+            self._time.fill(np.nan)
+            self._data.fill(np.nan)
+            self._total.fill(0)
+            for rollup in (*self._rollups.values(), *self._fleet.values()):
+                rollup.clear()
+
+
+_FLEET_ROW = np.zeros(1, dtype=np.intp)
+
+
+def _row_array(rows, n):
+    return np.arange(n)[rows] if isinstance(rows, slice) else rows
+
+
+def _ring_column(index, capacity, rows, n):
+    # Ring slots for absolute `index` per row. A contiguous batch at the same
+    # position (the usual case for a whole fleet) gets a single column, so
+    # the write is a strided view instead of a gather/scatter.
+    if isinstance(rows, slice) and (index == index[0]).all():
+        return int(index[0] % capacity), rows
+    return index % capacity, _row_array(rows, n)
+
+
+def _extend(arr, fill, shape, dtype=np.float64, axis=0):
+    # New array of `shape` filled with `fill`, keeping `arr`'s rows along `axis`
+    out = np.full(shape, fill, dtype=dtype)
+    if arr is not None:
+        index = [slice(None)] * out.ndim
+        index[axis] = slice(0, arr.shape[axis])
+        out[tuple(index)] = arr
+    return out
+
+
+class PodView:
+    # One pod's raw samples through the absolute-index interface TrendView
+    # reads: `total` only grows, `since(index)` returns just the newer rows.
+
+    def __init__(self, history, pod_id):
+        self.history = history
+        self.pod_id  = pod_id
+
+    def _row(self):
+        return self.history._rows.get(self.pod_id)
+
+    @property
+    def total(self):
+        row = self._row()
+        return 0 if row is None else int(self.history._total[row])
+
+    def _range(self, row, start, end):
+        return self.history._raw(row, np.arange(start, end) % self.history.capacity)
+
+    def time_at(self, index):
+        h = self.history
+        with h._lock:
+            row   = self._row()
+            total = 0 if row is None else int(h._total[row])
+            if total == 0:
+                return np.nan
+            index = min(max(index, total - h.capacity, 0), total - 1)
+            return h._time[row, index % h.capacity]
+
+    def since(self, index):
+        # Returns (rows appended after `index`, new index, rows lost to overwrite)
+        h = self.history
+        with h._lock:
+            row = self._row()
+            if row is None:
+                return self._empty(), 0, 0
+            end   = int(h._total[row])
+            start = min(max(index, end - h.capacity), end)
+            return self._range(row, start, end), end, max(start - index, 0)
+
+    def window(self, n):
+        h = self.history
+        with h._lock:
+            row = self._row()
+            if row is None:
+                return self._empty(), 0
+            end = int(h._total[row])
+            return self._range(row, max(end - min(n, h.capacity), 0), end), end
+
+    def _empty(self):
+        return {f: np.empty(0) for f in ("time",) + self.history.fields}
+
+
+def minmax_downsample(t, y, n_out):
+    # Keeps the min and max of each of n_out/2 equal buckets (plus the last
+    # point), so spikes survive while the plotted series stays bounded.
+    n = len(y)
+    if n <= n_out:
+        return t, y
+    buckets = max(n_out // 2, 1)
+    size    = n // buckets
+    body    = y[:buckets * size].reshape(buckets, size)
+    offset  = np.arange(buckets) * size
+    idx     = np.concatenate((body.argmin(axis=1) + offset,
+                              body.argmax(axis=1) + offset,
+                              np.arange(buckets * size, n)[-1:]))
+    idx     = np.unique(idx)
+    return t[idx], y[idx]
+
+
+class TrendView:
+    # Per-session plotted series for one metric. Each refresh only pulls the
+    # rows appended since the previous one, trims to the window and
+    # re-downsamples once the plotted series exceeds twice the point budget.
+
+    def __init__(self, metric, window, budget=1500):
+        self.metric = metric
+        self.window = window
+        self.budget = budget
+        self.cursor = 0
+        self.t      = np.empty(0)
+        self.y      = np.empty(0)
+
+    def refresh(self, history):
+        if self.cursor > history.total:  # history was cleared
+            self.cursor = 0
+        new, cursor, missed = history.since(self.cursor)
+        if self.cursor == 0 or missed or len(new["time"]) >= self.window:
+            rows, cursor = history.window(self.window)
+            self.t, self.y = minmax_downsample(rows["time"], rows[self.metric], self.budget)
+        elif len(new["time"]):
+            keep   = self.t >= history.time_at(cursor - self.window)
+            self.t = np.concatenate((self.t[keep], new["time"]))
+            self.y = np.concatenate((self.y[keep], new[self.metric]))
+            if len(self.y) > 2 * self.budget:
+                self.t, self.y = minmax_downsample(self.t, self.y, self.budget)
+        self.cursor = cursor
+        return self.t, self.y
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.metrics import REGISTRY
+
+# Shared HTTP layer for the external APIs (weather, geocoding, facts).
+#
+#   - one pooled requests.Session, so repeat calls reuse TLS connections
+#   - every request has a (connect, read) timeout; nothing waits forever
+#   - fetch_many runs a batch of requests concurrently on a small pool
+#   - swr / swr_many serve cached values with stale-while-revalidate: a
+#     fresh value is returned as is, a stale one is returned at once while
+#     a background refresh runs, and only a cold key waits for the network
+#     (bounded by `wait_for`); the cache keeps the `max_entries` most
+#     recently used keys, so arbitrary user input (e.g. city names) can't
+#     grow it without bound
+
+TIMEOUT      = (3.05, 5.0)
+REQUEST_TIME = REGISTRY.histogram("http_request_seconds", "External API calls, by host")
+
+
+class HttpClient:
+
+    def __init__(self, timeout=TIMEOUT, pool_size=16, max_workers=8, max_entries=1024):
+        self.timeout     = timeout
+        self.max_entries = max_entries
+        self.session     = requests.Session()
+        adapter          = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.requests    = 0
+        self.errors      = 0
+        self._pool       = ThreadPoolExecutor(max_workers, thread_name_prefix="http")
+        self._cache      = OrderedDict()   # key -> {"value", "at", "refresh"}, LRU order
+        self._lock       = threading.Lock()
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def get(self, url, params=None):
+        self.requests += 1
+        try:
+            with REQUEST_TIME.time(host=urlsplit(url).netloc):
+                return self.session.get(url, params=params, timeout=self.timeout)
+        except requests.RequestException:
+            self.errors += 1
+            raise
+
+    def get_json(self, url, params=None):
+        response = self.get(url, params)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_many(self, calls, wait_for=None):
+        # calls: list of (url, params). Returns JSON bodies in the same
+        # order, None for any request that failed or didn't finish in time.
+        futures = [self._pool.submit(self.get_json, url, params) for url, params in calls]
+        wait(futures, timeout=wait_for or self.timeout[0] + self.timeout[1])
+        return [f.result() if f.done() and not f.exception() else None for f in futures]
+
+    def _refresh(self, key, fetch):
+        # Called with the lock held; at most one refresh per key in flight
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = self._cache[key] = {"value": None, "at": None, "refresh": None}
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        if entry["refresh"] is None:
+            entry["refresh"] = self._pool.submit(self._run_refresh, key, fetch)
+        return entry["refresh"]
+
+    def _run_refresh(self, key, fetch):
+        # The key may have been evicted meanwhile; the value is still returned
+        try:
+            value = fetch()
+        except Exception:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    entry["refresh"] = None
+            raise
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                entry.update(value=value, at=time.time(), refresh=None)
+        return value
+
+    def swr_many(self, fetches, max_age, wait_for=None):
+        # fetches: {key: zero-arg callable}. Returns {key: value or None}.
+        now, result, cold = time.time(), {}, {}
+        with self._lock:
+            for key, fetch in fetches.items():
+                entry = self._cache.get(key)
+                if entry is not None and entry["at"] is not None:
+                    self._cache.move_to_end(key)
+                    result[key] = entry["value"]
+                    if now - entry["at"] > max_age:
+                        self._refresh(key, fetch)
+                else:
+                    cold[key] = self._refresh(key, fetch)
+        if cold:
+            wait(cold.values(), timeout=wait_for or self.timeout[0] + self.timeout[1])
+            for key, future in cold.items():
+                result[key] = future.result() if future.done() and not future.exception() else None
+        return result
+
+    def swr(self, key, fetch, max_age, wait_for=None):
+        return self.swr_many({key: fetch}, max_age, wait_for)[key]
+
+    def invalidate(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                entry["at"] = 0.0
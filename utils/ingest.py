@@ -0,0 +1,244 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+import paho.mqtt.client as mqtt
+
+from utils.codec import decode, encode_json
+from utils.metrics import REGISTRY
+
+BROKER_HOST = os.getenv("MQTT_HOST", "broker.hivemq.com")
+BROKER_PORT = int(os.getenv("MQTT_PORT", 1883))
+TOPIC       = os.getenv("MQTT_TOPIC", "hyperloop/pods/demo")
+QUEUE_SIZE   = int(os.getenv("MQTT_QUEUE_SIZE", 10_000))
+QUEUE_POLICY = os.getenv("MQTT_QUEUE_POLICY", "drop-oldest")
+POLICIES     = ("drop-oldest", "coalesce", "block")
+
+DECODE_TIME = REGISTRY.histogram("mqtt_decode_seconds", "Payload decode and validation")
+HANDLE_TIME = REGISTRY.histogram("mqtt_handle_seconds", "Network-thread work per message")
+DRAIN_TIME  = REGISTRY.histogram("mqtt_drain_seconds", "One consumer batch through the sinks")
+
+
+class MessageRing:
+    # Fixed-size ring addressed by a monotonically increasing sequence number.
+    # Readers keep their own cursor (the next sequence they want), so any
+    # number of sessions can consume the same stream without copying it.
+
+    def __init__(self, capacity=1000):
+        self.capacity  = capacity
+        self._slots    = [None] * capacity
+        self._next_seq = 0
+        self._lock     = threading.Lock()
+
+    @property
+    def head(self):
+        return self._next_seq
+
+    def append(self, item):
+        with self._lock:
+            self._slots[self._next_seq % self.capacity] = item
+            self._next_seq += 1
+
+    def read_since(self, cursor):
+        # Returns (items, new_cursor, missed). `missed` counts messages that
+        # were overwritten before this reader got to them.
+        with self._lock:
+            end   = self._next_seq
+            start = max(cursor, end - self.capacity)
+            items = [self._slots[seq % self.capacity] for seq in range(start, end)]
+        return items, end, max(start - cursor, 0)
+
+
+class IngestQueue:
+    # Bounded hand-off from the network thread to the ingest consumer. The
+    # policy decides how it behaves:
+    #
+    #   drop-oldest  when full, the oldest queued message is discarded (`dropped`)
+    #   coalesce     at any depth, at most one entry per pod: a newer message
+    #                replaces the pod's queued one in place, keeping its turn
+    #                (`coalesced`); a new pod arriving when full drops the
+    #                oldest pod's entry
+    #   block        when full, put() waits for room, which stalls the network
+    #                thread and pushes back on the broker connection (`blocked_s`)
+
+    def __init__(self, capacity=QUEUE_SIZE, policy=QUEUE_POLICY):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown queue policy {policy!r}, expected one of {POLICIES}")
+        self.capacity   = capacity
+        self.policy     = policy
+        self.high_water = 0
+        self.dropped    = 0
+        self.coalesced  = 0
+        self.blocked    = 0
+        self.blocked_s  = 0.0
+        self._items     = OrderedDict() if policy == "coalesce" else deque()
+        self._cond      = threading.Condition()
+        self._closed    = False
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def put(self, item, key=None):
+        # key: what coalescing merges on (the pod id); ignored otherwise
+        with self._cond:
+            items = self._items
+            if self.policy == "coalesce":
+                if key in items:
+                    items[key] = item
+                    self.coalesced += 1
+                    return
+                if len(items) >= self.capacity:
+                    items.popitem(last=False)
+                    self.dropped += 1
+                items[key] = item
+            else:
+                if len(items) >= self.capacity:
+                    if self.policy == "drop-oldest":
+                        items.popleft()
+                        self.dropped += 1
+                    else:
+                        start = time.perf_counter()
+                        self.blocked += 1
+                        while len(items) >= self.capacity and not self._closed:
+                            self._cond.wait()
+                        self.blocked_s += time.perf_counter() - start
+                        if self._closed:
+                            self.dropped += 1
+                            return
+                items.append(item)
+            if len(items) > self.high_water:
+                self.high_water = len(items)
+            self._cond.notify_all()
+
+    def get_batch(self, max_items=500, timeout=None):
+        # Up to max_items, oldest first; [] if nothing arrived within timeout
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            n = min(max_items, len(self._items))
+            if self.policy == "coalesce":
+                batch = [self._items.popitem(last=False)[1] for _ in range(n)]
+            else:
+                batch = [self._items.popleft() for _ in range(n)]
+            if batch and self.policy == "block":
+                self._cond.notify_all()
+            return batch
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self):
+        return {"policy": self.policy, "capacity": self.capacity, "depth": len(self._items),
+                "high_water": self.high_water, "dropped": self.dropped,
+                "coalesced": self.coalesced, "blocked": self.blocked,
+                "blocked_s": round(self.blocked_s, 3)}
+
+
+class MqttIngestService:
+    # One broker connection per server process. The paho network thread
+    # decodes and validates each message once into a PodRecord, appends it
+    # to the shared ring that sessions read, and queues it for the sinks;
+    # payloads that fail validation are counted. A consumer thread drains
+    # the bounded queue into the sinks whether or not anyone has a page
+    # open, so slow sinks never hold up the network thread (see IngestQueue
+    # for what happens when they fall behind).
+
+    def __init__(self, host=BROKER_HOST, port=BROKER_PORT, topic=TOPIC, capacity=1000,
+                 queue_size=QUEUE_SIZE, policy=QUEUE_POLICY):
+        self.host       = host
+        self.port       = port
+        self.topic      = topic
+        self.echo_topic = f"{topic}/echo"
+        self.ring       = MessageRing(capacity)
+        self.queue      = IngestQueue(queue_size, policy)
+        self.received   = 0
+        self.processed  = 0
+        self.rejected   = 0
+        self.errors     = 0
+        self.logging    = True
+        self.echo       = self._publish_echo
+        self._sinks     = []
+
+        self.client = mqtt.Client(
+            client_id=f"avishkar-dashboard-{os.getpid()}-{uuid.uuid4().hex[:6]}",
+            protocol=mqtt.MQTTv311,
+            transport="tcp",
+        )
+        self.client.on_connect = self._on_connect
+        self.client.on_message = self._on_message
+        self._consumer = threading.Thread(target=self._consume, name="mqtt-consumer", daemon=True)
+        self._consumer.start()
+
+    def start(self):
+        # connect_async + loop_start never blocks the script thread and keeps
+        # retrying in the background if the broker is unreachable.
+        self.client.connect_async(self.host, self.port, 60)
+        self.client.loop_start()
+        return self
+
+    def stop(self):
+        self.client.loop_stop()
+        self.client.disconnect()
+        self.queue.close()
+
+    def add_sink(self, sink):
+        # Sinks run on the consumer thread, once per record in arrival order
+        self._sinks.append(sink)
+
+    def is_connected(self):
+        return self.client.is_connected()
+
+    def read_since(self, cursor):
+        return self.ring.read_since(cursor)
+
+    def handle_payload(self, payload):
+        start = time.perf_counter()
+        try:
+            record = decode(payload)
+        except ValueError:
+            self.rejected += 1
+            return
+        DECODE_TIME.observe(time.perf_counter() - start)
+        self.ring.append(record)
+        self.received += 1
+        if record.sent is not None:
+            # Load-test traffic carries its send time; hand it straight back so
+            # the publisher can measure end-to-end latency.
+            self.echo(record)
+        self.queue.put(record, record.id)
+        HANDLE_TIME.observe(time.perf_counter() - start)
+
+    def _consume(self):
+        # Runs until stop(), after draining what was already queued
+        while True:
+            batch = self.queue.get_batch(timeout=1.0)
+            if not batch:
+                if self.queue.closed:
+                    return
+                continue
+            start = time.perf_counter()
+            for record in batch:
+                for sink in self._sinks:
+                    try:
+                        sink(record)
+                    except Exception:
+                        self.errors += 1
+            self.processed += len(batch)
+            DRAIN_TIME.observe(time.perf_counter() - start)
+
+    def _publish_echo(self, record):
+        self.client.publish(self.echo_topic, encode_json({"id": record.id}, sent=record.sent))
+
+    def _on_connect(self, client, userdata, flags, rc, properties=None):
+        client.subscribe(self.topic)
+
+    def _on_message(self, client, userdata, msg):
+        self.handle_payload(msg.payload)
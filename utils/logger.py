@@ -1,20 +1,168 @@
-import streamlit as st
-import pandas as pd
+import atexit
+import csv
 import os
-from datetime import datetime
-
-def log_to_csv(data):
-    file = "data/hyperloop_logs.csv"
-    df = pd.DataFrame([data])
-    if os.path.exists(file):
-        df.to_csv(file, mode="a", header=False, index=False)
-    else:
-        df.to_csv(file, index=False)
-
-def log_metrics():
-    st.session_state.history["time"].append(datetime.now())
-    st.session_state.history["speed"].append(st.session_state.speed)
-    st.session_state.history["pressure"].append(st.session_state.pressure)
-    st.session_state.history["battery"].append(st.session_state.battery)
-    st.session_state.history["acceleration"].append(st.session_state.acceleration)
-    st.session_state.history["temperature"].append(st.session_state.temperature)
\ No newline at end of file
+import queue
+import threading
+import time
+from collections import deque
+
+from utils.metrics import REGISTRY
+
+FLUSH_TIME = REGISTRY.histogram("writer_flush_seconds", "One batch handed to a writer's sink")
+
+
+class CsvSink:
+    # Keeps the log file open between batches and writes with the stdlib csv
+    # module. Column order comes from the existing header when the file is
+    # already there, otherwise from the first row written.
+
+    def __init__(self, path, fieldnames=None):
+        self.path       = path
+        self.fieldnames = fieldnames
+        self._fh        = None
+        self._writer    = None
+        self._lock      = threading.Lock()
+
+    def _open(self, first_row):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        has_header = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if has_header and self.fieldnames is None:
+            with open(self.path, newline="") as fh:
+                self.fieldnames = next(csv.reader(fh))
+        if self.fieldnames is None:
+            self.fieldnames = list(first_row.keys())
+        self._fh     = open(self.path, "a", newline="")
+        self._writer = csv.DictWriter(self._fh, fieldnames=self.fieldnames,
+                                      quoting=csv.QUOTE_ALL, extrasaction="ignore")
+        if not has_header:
+            self._writer.writeheader()
+
+    def __call__(self, rows):
+        with self._lock:
+            if self._fh is None:
+                self._open(rows[0])
+            self._writer.writerows(rows)
+            self._fh.flush()
+
+    def append(self, row):
+        # One row, on disk when this returns: for rare writes (maintenance
+        # entries) that a page reads back straight away
+        self([row])
+
+    def clear(self):
+        with self._lock:
+            self.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+                return True
+            return False
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+        self._fh, self._writer = None, None
+
+
+class BatchWriter:
+    # Background writer: callers enqueue rows without touching the disk, a
+    # single thread hands them to `flush_fn` in batches once `max_batch` rows
+    # are pending or `flush_interval` seconds have passed.
+
+    _FLUSH = object()
+    _STOP  = object()
+
+    def __init__(self, flush_fn, max_batch=500, flush_interval=1.0, max_queue=50000,
+                 name="batch-writer"):
+        self.flush_fn       = flush_fn
+        self.name           = name
+        self.max_batch      = max_batch
+        self.flush_interval = flush_interval
+        self.rows_written   = 0
+        self.batches        = 0
+        self.dropped        = 0
+        self.errors         = 0
+        self._queue   = queue.Queue(maxsize=max_queue)
+        self._recent  = deque(maxlen=1024)  # (flush time, rows) for the rate window
+        self._closed  = False
+        self._thread  = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, row):
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=5.0):
+        # Blocks until everything enqueued before this call has been written.
+        # Returns False if that didn't happen within `timeout` seconds (the
+        # writer is backed up), True otherwise
+        done     = threading.Event()
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put((self._FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(deadline - time.monotonic(), 0))
+
+    def close(self):
+        if self._closed:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=10)
+        self._closed = True
+        close = getattr(self.flush_fn, "close", None)
+        if close:
+            close()
+
+    def stats(self, window=10.0):
+        now    = time.monotonic()
+        recent = [n for t, n in list(self._recent) if now - t <= window]
+        return {
+            "rows_written": self.rows_written,
+            "rows_per_sec": round(sum(recent) / window, 1),
+            "queue_depth":  self._queue.qsize(),
+            "batches":      self.batches,
+            "dropped":      self.dropped,
+            "errors":       self.errors,
+        }
+
+    def _write_batch(self, batch):
+        if batch:
+            try:
+                with FLUSH_TIME.time(writer=self.name):
+                    self.flush_fn(batch)
+                self.rows_written += len(batch)
+                self.batches      += 1
+                self._recent.append((time.monotonic(), len(batch)))
+            except Exception:
+                self.errors += len(batch)
+
+    def _run(self):
+        batch    = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.001))
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                self._write_batch(batch)
+                return
+            if type(item) is tuple and item[0] is self._FLUSH:
+                self._write_batch(batch)
+                item[1].set()
+            elif item is not None:
+                batch.append(item)
+                if len(batch) < self.max_batch and time.monotonic() < deadline:
+                    continue
+                self._write_batch(batch)
+            elif time.monotonic() < deadline:
+                continue
+            else:
+                self._write_batch(batch)
+
+            batch    = []
+            deadline = time.monotonic() + self.flush_interval
@@ -0,0 +1,181 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# In-process metrics for the hot paths, shared by the whole server process.
+#
+#   Histogram   timings (seconds) in fixed buckets, per label set; observe()
+#               is one bisect and three additions under a lock, cheap enough
+#               for every MQTT message
+#   gauge()     a callable read only when the metrics are collected, for
+#               values the code already keeps (queue depth, message and drop
+#               counts, exported as counters), so they cost nothing on the
+#               hot path
+#
+# REGISTRY is what the System Performance page reads and what serve()
+# exposes in the Prometheus text format:
+#
+#   curl http://127.0.0.1:9464/metrics
+
+BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _labels(key, **extra):
+    pairs = [*key, *extra.items()]
+    if not pairs:
+        return ""
+    escape = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value):
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Histogram:
+
+    def __init__(self, name, help="", buckets=BUCKETS):
+        self.name    = name
+        self.help    = help
+        self.buckets = tuple(buckets)
+        self._series = {}   # label key -> [bucket counts (+Inf last), sum, count, max]
+        self._lock   = threading.Lock()
+
+    def observe(self, value, **labels):
+        i   = bisect.bisect_left(self.buckets, value)
+        key = _key(labels) if labels else ()
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0, 0.0]
+            series[0][i] += 1
+            series[1]    += value
+            series[2]    += 1
+            if value > series[3]:
+                series[3] = value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def series(self):
+        # {label key: {"buckets", "sum", "count", "max"}}, a consistent copy
+        with self._lock:
+            return {key: {"buckets": list(s[0]), "sum": s[1], "count": s[2], "max": s[3]}
+                    for key, s in self._series.items()}
+
+    def quantile(self, counts, q, upper=float("inf")):
+        # Estimate from bucket counts, linear within the bucket (as
+        # Prometheus' histogram_quantile does), capped at `upper` (the
+        # observed max); the open top bucket reports its lower bound
+        return min(self._quantile(counts, q), upper)
+
+    def _quantile(self, counts, q):
+        total = sum(counts)
+        if not total:
+            return float("nan")
+        rank, seen = q * total, 0
+        for i, n in enumerate(counts):
+            if seen + n >= rank and n:
+                lo = self.buckets[i - 1] if i else 0.0
+                if i == len(self.buckets):
+                    return lo
+                return lo + (self.buckets[i] - lo) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class Registry:
+
+    def __init__(self):
+        self._metrics = {}
+        self._gauges  = {}   # name -> {"help", "kind", "series": {label key: fn}}
+        self._lock    = threading.Lock()
+
+    def histogram(self, name, help="", buckets=BUCKETS):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, help, buckets)
+            return metric
+
+    def gauge(self, name, fn, help="", kind="gauge", **labels):
+        # fn() is read at collection time. kind="counter" for running totals
+        # kept elsewhere. Registering the same name + labels again replaces it.
+        with self._lock:
+            family = self._gauges.setdefault(name, {"help": help, "kind": kind, "series": {}})
+            family["series"][_key(labels)] = fn
+
+    def collect(self):
+        # [(name, kind, help, {label key: value or histogram series})]
+        with self._lock:
+            metrics = list(self._metrics.values())
+            gauges  = [(name, dict(family, series=dict(family["series"])))
+                       for name, family in self._gauges.items()]
+        out = []
+        for metric in metrics:
+            out.append((metric.name, "histogram", metric.help, metric.series()))
+        for name, family in gauges:
+            values = {}
+            for key, fn in family["series"].items():
+                try:
+                    values[key] = float(fn())
+                except Exception:
+                    continue
+            out.append((name, family["kind"], family["help"], values))
+        return sorted(out)
+
+    def prometheus(self):
+        # Prometheus text exposition format, version 0.0.4
+        lines = []
+        for name, kind, help, series in self.collect():
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(series.items()):
+                if kind != "histogram":
+                    lines.append(f"{name}{_labels(key)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, n in zip((*self.histogram(name).buckets, float("inf")), value["buckets"]):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_labels(key, le=_number(bound))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(key)} {_number(value['sum'])}")
+                lines.append(f"{name}_count{_labels(key)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def serve(registry=REGISTRY, port=9464, host="127.0.0.1"):
+    # /metrics on a daemon thread; bound to localhost for a local scraper
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
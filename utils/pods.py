@@ -1,13 +1,39 @@
 import random
 
-def generate_pods():
-    pods = []
-    for i in range(1,6):
-        pod = {
-            "Pod ID": f"Pod-{i}",
-            "Speed (km/h)": random.randint(500, 1000),
-            "Battery (%)": random.randint(20,100),
-            "Status": random.choice(["Operational","Maintenance","Docked"])
+import numpy as np
+
+STATUSES = ["Operational", "Maintenance", "Docked"]
+
+def generate_pods(base_lat=None, base_lon=None, n_pods=5, track=None):
+    # With a track, pods are placed at random chainages along it and their
+    # lat/lon is derived from the track geometry
+    pods = [
+        {
+            "id":        f"Pod-{i}",
+            "speed":     random.randint(500, 1000),
+            "battery":   random.randint(20, 100),
+            "status":    random.choice(STATUSES),
+            "latitude":  base_lat + random.uniform(-0.003, 0.003) if base_lat else None,
+            "longitude": base_lon + random.uniform(-0.003, 0.003) if base_lon else None,
+            "chainage":  random.uniform(0, track.length) if track else None,
         }
-        pods.append(pod)
+        for i in range(1, n_pods + 1)
+    ]
+    if track:
+        place_pods(pods, track)
     return pods
+
+
+def place_pods(pods, track):
+    lat, lon = track.position([pod["chainage"] for pod in pods])
+    for pod, pod_lat, pod_lon in zip(pods, lat.tolist(), lon.tolist()):
+        pod["latitude"], pod["longitude"] = pod_lat, pod_lon
+
+
+def move_pods(pods, track, seconds):
+    # Advance every pod along the track by `seconds` of travel at its speed
+    chainage = np.array([pod["chainage"] for pod in pods], dtype=np.float64)
+    speed    = np.array([pod["speed"] for pod in pods], dtype=np.float64)
+    for pod, value in zip(pods, track.wrap(chainage + speed / 3.6 * seconds).tolist()):
+        pod["chainage"] = value
+    place_pods(pods, track)
@@ -0,0 +1,330 @@
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import streamlit as st
+from dotenv import load_dotenv, find_dotenv
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from utils.alerts import AlertEngine
+from utils.fleet import FleetState
+from utils.forecast import Forecaster
+from utils.geocode import GeocodeCache
+from utils.history import FleetHistory
+from utils.logger import BatchWriter, CsvSink
+from utils.metrics import REGISTRY, serve
+from utils.pods import STATUSES
+from utils.simulation import PodFleetSimulator, SimulationLoop
+from utils.track import TrackGeometry, TrackIndex
+from utils.warmup import Warmup
+from utils.weather_grid import WeatherGrid
+
+# Process-wide services shared by app.py and every page in views/: the
+# simulated fleet, MQTT ingestion, history, stores and the HTTP client, each
+# a st.cache_resource singleton. Modules with a heavy import (requests,
+# pyarrow, paho) are imported inside the getter that needs them, so they
+# load when first used rather than with the script.
+#
+# Every getter here has show_spinner=False: warm-up (get_warmup) calls
+# them, directly or through another getter, from its own threads, which
+# must not draw on the page.
+
+load_dotenv(find_dotenv())
+api_key = os.getenv("api_key")
+# Overridable so the dashboard can run against scripts/stub_api.py
+WEATHER_API    = os.getenv("OPENWEATHER_URL", "https://api.openweathermap.org")
+FACTS_API      = os.getenv("FACTS_URL", "https://uselessfacts.jsph.pl")
+ROUTE_STATIONS = os.getenv("ROUTE_STATIONS", "Chennai,Tambaram,Chengalpattu,Kanchipuram,Vellore").split(",")
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def data_path(*parts):
+    return os.path.join(BASE_DIR, "data", *parts)
+
+
+def watch_writer(writer):
+    # Queue depth and running totals, read only when metrics are collected
+    for metric, key, kind in (("writer_queue_depth", "queue_depth", "gauge"),
+                              ("writer_rows_total", "rows_written", "counter"),
+                              ("writer_dropped_total", "dropped", "counter"),
+                              ("writer_errors_total", "errors", "counter")):
+        REGISTRY.gauge(metric, lambda key=key: writer.stats()[key], kind=kind, writer=writer.name)
+    return writer
+
+
+@st.cache_resource(show_spinner=False)
+def get_alert_engine():
+    return AlertEngine()
+
+
+HISTORY_FIELDS  = ["speed", "acceleration", "pressure", "temperature", "battery"]
+HISTORY_SAMPLES = 1_000_000   # raw samples kept across the whole simulated fleet
+SIM_PODS        = int(os.getenv("SIM_PODS", 1))
+
+
+@st.cache_resource(show_spinner=False)
+def get_sim_history():
+    return FleetHistory(HISTORY_FIELDS, capacity=min(max(HISTORY_SAMPLES // SIM_PODS, 60), 100_000))
+
+
+MQTT_RESOLUTIONS = (1, 10, 60, 3600)
+HISTORY_RANGES   = {"5 min": 300, "15 min": 900, "1 h": 3600, "Shift (8 h)": 8 * 3600,
+                    "Day": 86400, "Week": 7 * 86400}
+CHART_BUCKETS    = 10_000   # most points a history chart is allowed to draw
+
+
+@st.cache_resource(show_spinner=False)
+def get_mqtt_history():
+    # Closed buckets go to the rollup store as pods report; bound here because
+    # on_close runs on the ingest thread
+    writer = get_rollup_writer()
+
+    def persist(resolution, buckets):
+        stats = [k for k in buckets if k != "pod_id"]
+        for i, pod_id in enumerate(buckets["pod_id"]):
+            row = {k: float(buckets[k][i]) for k in stats}
+            writer.write({"resolution": resolution, "pod_id": pod_id,
+                          "ts": datetime.fromtimestamp(row["time"]), **row})
+
+    return FleetHistory(["speed", "battery"], capacity=3600, resolutions=MQTT_RESOLUTIONS,
+                        on_close=persist)
+
+
+ALERT_INTERVAL = 0.1  # seconds between alert evaluations of the simulated fleet
+FLEET_INTERVAL = 0.5  # seconds between simulated-fleet updates of the shared FleetState
+FORECAST_WINDOW = 30  # 1 s buckets of history each battery / thermal forecast is fitted on
+FORECASTS       = ("time_to_empty", "time_to_thermal")
+SIM_TRACK_CENTER = (12.6819, 79.9888)  # Chengalpattu
+
+
+@st.cache_resource(show_spinner=False)
+def get_fleet_state():
+    return FleetState(columns=("speed", "battery", "temperature", "chainage", *FORECASTS))
+
+
+@st.cache_resource(show_spinner=False)
+def get_forecaster():
+    return Forecaster(get_sim_history(), window=FORECAST_WINDOW)
+
+
+def sim_statuses(sim):
+    # Simulated pods have no reported status: flat battery -> Docked,
+    # overheating -> Maintenance, otherwise Operational
+    status = np.full(sim.n_pods, STATUSES.index("Operational"), dtype=np.int8)
+    status[sim.temperature > 80] = STATUSES.index("Maintenance")
+    status[sim.battery <= 0]     = STATUSES.index("Docked")
+    return status
+
+
+@st.cache_resource(show_spinner=False)
+def get_track(center, radius_m=2000.0):
+    return TrackGeometry.loop(center, radius_m)
+
+
+@st.cache_resource(show_spinner=False)
+def get_sim_loop():
+    track   = get_track(SIM_TRACK_CENTER)
+    sim     = PodFleetSimulator(SIM_PODS, track_length=track.length)
+    loop    = SimulationLoop(sim)
+    history = get_sim_history()
+    alerts  = get_alert_engine()
+    index   = TrackIndex(track)
+    profile = get_weather_grid().profile
+    fleet   = get_fleet_state()
+    fcast   = get_forecaster()
+    sim.speed_limit = profile.limits_for
+    last_alert_eval = last_fleet_update = 0.0
+
+    def update_fleet(sim):
+        fleet.upsert(sim.ids, status=sim_statuses(sim), speed=sim.speed, battery=sim.battery,
+                     temperature=sim.temperature, chainage=sim.chainage,
+                     **{k: fcast.latest[k] for k in FORECASTS if k in fcast.latest})
+
+    def on_tick(sim):
+        nonlocal last_alert_eval, last_fleet_update
+        now = time.time()
+        history.append(sim.ids, now, {f: getattr(sim, f) for f in HISTORY_FIELDS})
+        if fcast.due(now):
+            # Whole-fleet fit + projection; pushes itself back if it gets expensive
+            fcast.update(sim.ids, sim.battery, sim.temperature, now)
+        if now - last_fleet_update >= FLEET_INTERVAL:
+            update_fleet(sim)
+            last_fleet_update = now
+        if now - last_alert_eval >= ALERT_INTERVAL:
+            # Headway / braking-margin check across the whole fleet: one
+            # argsort of the chainages, then vectorized gaps to the pod ahead
+            metrics = {f: getattr(sim, f) for f in sim.FIELDS}
+            metrics["margin"]    = index.update(sim.chainage).margins(sim.speed)
+            metrics["overspeed"] = sim.speed - profile.limits_for(sim.chainage)
+            metrics.update({k: fcast.latest[k] for k in FORECASTS if k in fcast.latest})
+            alerts.evaluate(sim.ids, metrics, now)
+            last_alert_eval = now
+
+    update_fleet(sim)
+    loop.add_listener(on_tick)
+    REGISTRY.gauge("sim_tick_rate_hz", lambda: loop.stats()["achieved_hz"], "Achieved simulation tick rate")
+    REGISTRY.gauge("sim_overruns_total", lambda: loop.overruns, "Ticks that ran past their slot",
+                   kind="counter")
+    REGISTRY.gauge("forecast_last_seconds", lambda: fcast.last_ms / 1000, "Latest fleet forecast update")
+    return loop
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_client():
+    from utils.http_client import HttpClient
+    return HttpClient()
+
+
+WEATHER_MAX_AGE = 300  # seconds before a cached reading is refreshed in the background
+
+
+def _weather_fetch(city, api_key):
+    return lambda: get_http_client().get_json(
+        f"{WEATHER_API}/data/2.5/weather", {"q": city, "appid": api_key, "units": "metric"})
+
+
+def fetch_weather(city, api_key):
+    return get_http_client().swr(("weather", city), _weather_fetch(city, api_key), WEATHER_MAX_AGE)
+
+
+def fetch_route_weather(cities, api_key, wait_for=2.0):
+    # Every station in one concurrent batch; stale readings come back at once
+    # and cold ones that miss `wait_for` show up on a later rerun
+    return get_http_client().swr_many(
+        {("weather", city): _weather_fetch(city, api_key) for city in cities},
+        WEATHER_MAX_AGE, wait_for)
+
+
+@st.cache_resource(show_spinner=False)
+def get_weather_grid():
+    # Background refresh of the simulated track's weather and speed limits
+    http = get_http_client()
+
+    def fetch_many(points):
+        return http.fetch_many([
+            (f"{WEATHER_API}/data/2.5/weather", {"lat": lat, "lon": lon, "appid": api_key, "units": "metric"})
+            for lat, lon in points])
+    return WeatherGrid(get_track(SIM_TRACK_CENTER), fetch_many, interval=WEATHER_MAX_AGE).start()
+
+
+@st.cache_resource(show_spinner=False)
+def get_geocoder():
+    cache = GeocodeCache(data_path("geocode.sqlite"))
+    cache.warm(data_path("gazetteer.csv"))
+    return cache
+
+
+@st.cache_resource(show_spinner=False)
+def get_csv_sink(filename):
+    # One sink per file, so every writer of it shares the open handle and lock
+    return CsvSink(data_path(filename))
+
+
+@st.cache_resource(show_spinner=False)
+def get_csv_writer(filename):
+    return watch_writer(BatchWriter(get_csv_sink(filename), name=f"writer-{filename}"))
+
+
+@st.cache_resource(show_spinner=False)
+def get_telemetry_store():
+    from utils.store import TelemetryStore
+    store = TelemetryStore(data_path("telemetry", "mqtt"))
+    threading.Thread(target=store.compact, name="store-compact", daemon=True).start()
+    return store
+
+
+@st.cache_resource(show_spinner=False)
+def get_store_writer():
+    return watch_writer(BatchWriter(get_telemetry_store().append, max_batch=5000,
+                                    flush_interval=10.0, name="writer-telemetry-store"))
+
+
+@st.cache_resource(show_spinner=False)
+def get_rollup_store():
+    from utils.store import RollupStore
+    store = RollupStore(data_path("telemetry"), MQTT_RESOLUTIONS)
+    threading.Thread(target=store.compact, name="rollup-compact", daemon=True).start()
+    return store
+
+
+@st.cache_resource(show_spinner=False)
+def get_rollup_writer():
+    return watch_writer(BatchWriter(get_rollup_store().append, max_batch=5000,
+                                    flush_interval=10.0, name="writer-rollups"))
+
+
+@st.cache_resource(show_spinner=False)
+def get_ingest_service():
+    from utils.ingest import MqttIngestService
+    service      = MqttIngestService()
+    csv_writer   = get_csv_writer("mqtt_logs.csv")
+    store_writer = get_store_writer()
+    alerts       = get_alert_engine()
+    history      = get_mqtt_history()
+    fleet        = get_fleet_state()
+
+    # Runs on the ingest consumer thread, once per record in arrival order:
+    # hands rows off to the writers, then updates history, fleet state and
+    # alerts inline (slow sinks back up the ingest queue, not the broker)
+    def on_message(record):
+        if service.logging:
+            csv_writer.write({**record.as_dict(), "received_at": record.timestamp})
+            store_writer.write({
+                "pod_id":  record.id,
+                "ts":      record.received,
+                "speed":   float(record.speed),
+                "battery": float(record.battery),
+                "status":  record.status,
+            })
+        readings = {"speed": [record.speed], "battery": [record.battery]}
+        history.append([record.id], record.received.timestamp(), readings)
+        fleet.upsert([record.id], status=[record.status], received=record.received.timestamp(),
+                     **readings)
+        alerts.evaluate([record.id], readings, record.received.timestamp())
+
+    service.add_sink(on_message)
+    REGISTRY.gauge("mqtt_messages_total", lambda: service.received, "Valid MQTT messages", kind="counter")
+    REGISTRY.gauge("mqtt_rejected_total", lambda: service.rejected, "Payloads that failed validation",
+                   kind="counter")
+    REGISTRY.gauge("mqtt_sink_errors_total", lambda: service.errors, "Sink exceptions", kind="counter")
+    REGISTRY.gauge("mqtt_connected", service.is_connected, "1 while the broker connection is up")
+    queue = service.queue
+    REGISTRY.gauge("mqtt_queue_depth", queue.__len__, "Messages waiting for the ingest consumer")
+    REGISTRY.gauge("mqtt_queue_dropped_total", lambda: queue.dropped, "Messages dropped by the queue policy",
+                   kind="counter", policy=queue.policy)
+    REGISTRY.gauge("mqtt_queue_coalesced_total", lambda: queue.coalesced,
+                   "Queued messages replaced by a newer one for the same pod", kind="counter")
+    REGISTRY.gauge("mqtt_queue_blocked_seconds_total", lambda: queue.blocked_s,
+                   "Time the network thread waited for queue room", kind="counter")
+    return service.start()
+
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", 9464))  # Prometheus endpoint on 127.0.0.1; 0 turns it off
+
+
+@st.cache_resource(show_spinner=False)
+def get_metrics_server():
+    # Raises OSError if the port is taken (e.g. a second dashboard process);
+    # not cached then, so the System Performance page reports it
+    return serve(REGISTRY, METRICS_PORT) if METRICS_PORT else None
+
+
+BOOT_TIMEOUT = 5.0  # seconds the landing page waits on warm-up before letting a session in
+
+
+@st.cache_resource(show_spinner=False)
+def get_warmup():
+    # Started by the first session after the server starts; its script
+    # context is attached to the workers so the getters run as in the script
+    ctx = get_script_run_ctx()
+    return Warmup({
+        "Telemetry store":  lambda: (get_store_writer(), get_rollup_writer()),
+        "MQTT ingestion":   get_ingest_service,
+        "Geocode cache":    get_geocoder,
+        "Route weather":    lambda: (get_weather_grid(), fetch_route_weather(ROUTE_STATIONS, api_key)),
+        "Simulation":       get_sim_loop,
+        "Metrics endpoint": get_metrics_server,
+    }, initializer=lambda: add_script_run_ctx(ctx=ctx))
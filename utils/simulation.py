@@ -1,29 +1,227 @@
-import streamlit as st
-
-def compute_values():
-    speed = st.session_state.speed
-    acc = st.session_state.acceleration
-    pressure = st.session_state.pressure
-
-    temp = 0.005 * speed + 0.5 * acc
-    st.session_state.temperature = round(
-        st.session_state.temperature + temp * 0.01,
-        2
-    )
-
-    if speed < 450:
-        st.session_state.temperature = max(
-            25,
-            st.session_state.temperature - 0.1
-        )
-
-    if "battery" not in st.session_state:
-        st.session_state.battery = 100.0
-    drain = 0.02 * speed + 1.5 * acc
-    st.session_state.battery = max(
-        round(st.session_state.battery - drain * 0.01, 2),
-        0
-    )
-    battery = st.session_state.battery
-
-    return speed, acc, pressure, st.session_state.temperature, st.session_state.battery
\ No newline at end of file
+import numpy as np
+import threading
+import time
+from collections import deque
+
+# Thermal / battery model, per tick:
+#   heating = 0.005 * speed + 0.5 * acc      -> temperature += heating * 0.01
+#   drain   = 0.02  * speed + 1.5 * acc      -> battery     -= drain   * 0.01
+# Below 450 km/h the pod cools by 0.1 °C per tick, never below ambient.
+HEAT_SPEED, HEAT_ACC   = 0.005, 0.5
+DRAIN_SPEED, DRAIN_ACC = 0.02, 1.5
+TICK_SCALE  = 0.01
+COOL_SPEED  = 450
+COOL_RATE   = 0.1
+AMBIENT     = 25.0
+# Pods also move along a closed track of `track_length` metres, by the
+# distance covered at their current speed since the previous tick (the
+# loop's measured tick interval; TICK_SECONDS for a manual step).
+TICK_SECONDS = 0.5
+
+
+class PodFleetSimulator:
+    # Struct-of-arrays fleet state: one float64 array per quantity, all pods
+    # advanced by a single vectorized step. Scratch buffers are allocated once
+    # so a tick does no per-pod Python work and no array allocation.
+
+    FIELDS = ("speed", "acceleration", "pressure", "temperature", "battery")
+
+    def __init__(self, n_pods, speed=800, acceleration=3.0, pressure=101325,
+                 temperature=AMBIENT, battery=100.0, track_length=10_000.0, seed=None):
+        self.n_pods       = n_pods
+        self.track_length = track_length
+        self.ids          = [f"SIM-{i:04d}" for i in range(1, n_pods + 1)]
+        self.rng          = np.random.default_rng(seed)
+        self.initial      = {"speed": speed, "acceleration": acceleration, "pressure": pressure,
+                             "temperature": temperature, "battery": battery}
+        for field in self.FIELDS:
+            setattr(self, field, np.empty(n_pods, dtype=np.float64))
+        self.chainage = np.empty(n_pods, dtype=np.float64)
+        self.speed_limit = None   # optional fn(chainage) -> km/h, caps the random drive
+        self._heat  = np.empty(n_pods, dtype=np.float64)
+        self._drain = np.empty(n_pods, dtype=np.float64)
+        self._tmp   = np.empty(n_pods, dtype=np.float64)
+        self._cool  = np.empty(n_pods, dtype=bool)
+        self.reset()
+
+    def reset(self):
+        for field, value in self.initial.items():
+            getattr(self, field).fill(value)
+        self.chainage[:] = np.arange(self.n_pods) * (self.track_length / max(self.n_pods, 1))
+        self.ticks = 0
+
+    def set_inputs(self, idx, speed=None, acceleration=None, pressure=None):
+        if speed is not None:
+            self.speed[idx] = speed
+        if acceleration is not None:
+            self.acceleration[idx] = acceleration
+        if pressure is not None:
+            self.pressure[idx] = pressure
+
+    def randomize_inputs(self):
+        # Auto-run drive: same ranges the Performance Metrics page used
+        self.speed[:]        = self.rng.integers(0, 1201, self.n_pods)
+        self.acceleration[:] = np.round(self.rng.uniform(0.0, 10.0, self.n_pods), 2)
+        self.pressure[:]     = self.rng.integers(90000, 110001, self.n_pods)
+        if self.speed_limit is not None:
+            np.minimum(self.speed, self.speed_limit(self.chainage), out=self.speed)
+
+    def step(self, dt=TICK_SECONDS):
+        heat, drain, cool, tmp = self._heat, self._drain, self._cool, self._tmp
+
+        np.multiply(self.speed, HEAT_SPEED, out=heat)
+        np.multiply(self.acceleration, HEAT_ACC, out=tmp)
+        heat += tmp
+        heat *= TICK_SCALE
+        self.temperature += heat
+
+        np.less(self.speed, COOL_SPEED, out=cool)
+        np.subtract(self.temperature, COOL_RATE, out=heat)
+        np.maximum(heat, AMBIENT, out=heat)
+        np.copyto(self.temperature, heat, where=cool)
+
+        np.multiply(self.speed, DRAIN_SPEED, out=drain)
+        np.multiply(self.acceleration, DRAIN_ACC, out=tmp)
+        drain += tmp
+        drain *= TICK_SCALE
+        self.battery -= drain
+        np.maximum(self.battery, 0.0, out=self.battery)
+
+        np.multiply(self.speed, dt / 3.6, out=tmp)
+        self.chainage += tmp
+        np.mod(self.chainage, self.track_length, out=self.chainage)
+
+        self.ticks += 1
+
+    def pod(self, idx):
+        return {field: round(float(getattr(self, field)[idx]), 2) for field in self.FIELDS}
+
+    def snapshot(self):
+        snap = {field: getattr(self, field).copy() for field in self.FIELDS}
+        snap["chainage"] = self.chainage.copy()
+        snap["ticks"] = self.ticks
+        return snap
+
+
+class SimulationLoop:
+    # Runs a PodFleetSimulator on its own fixed-rate thread. Ticks are
+    # scheduled against absolute deadlines so sleep overshoot does not
+    # accumulate; the UI only ever reads the latest published snapshot.
+
+    def __init__(self, sim, rate_hz=2.0, publish_hz=20.0, drive="random"):
+        self.sim        = sim
+        self.rate_hz    = rate_hz
+        self.publish_hz = publish_hz
+        self.drive      = drive
+        self.overruns   = 0
+        self._lock      = threading.Lock()
+        self._stop      = threading.Event()
+        self._thread    = None
+        self._intervals = deque(maxlen=2000)
+        self._last_pub  = 0.0
+        self._listeners = []
+        self._snapshot  = sim.snapshot()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.running:
+            self._stop.clear()
+            self._intervals.clear()
+            self._thread = threading.Thread(target=self._run, name="sim-loop", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        self._thread = None
+
+    def add_listener(self, fn):
+        # fn(sim) runs on the loop thread after every tick, under the loop lock
+        self._listeners.append(fn)
+
+    def set_rate(self, rate_hz):
+        self.rate_hz = rate_hz
+
+    def set_inputs(self, idx, **inputs):
+        with self._lock:
+            self.sim.set_inputs(idx, **inputs)
+
+    def reset(self):
+        with self._lock:
+            self.sim.reset()
+            self._publish(force=True)
+
+    def step_once(self):
+        with self._lock:
+            self.sim.step()
+            self._notify()
+            self._publish(force=True)
+
+    def latest(self):
+        return self._snapshot
+
+    def latest_pod(self, idx=0):
+        snap = self._snapshot
+        return {field: round(float(snap[field][idx]), 2) for field in self.sim.FIELDS}
+
+    def stats(self):
+        intervals = np.fromiter(self._intervals, dtype=np.float64)
+        if len(intervals) < 2:
+            return {"target_hz": self.rate_hz, "achieved_hz": 0.0, "jitter_ms": 0.0,
+                    "p99_late_ms": 0.0, "overruns": self.overruns}
+        late = np.abs(intervals - 1.0 / self.rate_hz)
+        return {
+            "target_hz":   self.rate_hz,
+            "achieved_hz": round(float(1.0 / intervals.mean()), 1),
+            "jitter_ms":   round(float(intervals.std()) * 1000, 3),
+            "p99_late_ms": round(float(np.percentile(late, 99)) * 1000, 3),
+            "overruns":    self.overruns,
+        }
+
+    def _notify(self):
+        for fn in self._listeners:
+            fn(self.sim)
+
+    def _publish(self, now=None, force=False):
+        # Full snapshot copies are rate limited so large fleets at high tick
+        # rates don't spend their budget on memcpy nobody reads.
+        now = now or time.perf_counter()
+        if force or now - self._last_pub >= 1.0 / self.publish_hz:
+            self._snapshot = self.sim.snapshot()
+            self._last_pub = now
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        last_tick = None
+        while not self._stop.is_set():
+            now    = time.perf_counter()
+            period = 1.0 / self.rate_hz
+            # Pods travel for the time that actually passed since the last
+            # tick, so distance stays right when the loop runs behind
+            dt = period if last_tick is None else now - last_tick
+            if last_tick is not None:
+                self._intervals.append(dt)
+            last_tick = now
+
+            with self._lock:
+                if self.drive == "random":
+                    self.sim.randomize_inputs()
+                self.sim.step(dt)
+                self._notify()
+                self._publish(now)
+
+            next_tick += period
+            delay      = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif delay < -period:
+                # Fell more than a full tick behind: resync instead of bursting
+                self.overruns += 1
+                next_tick = time.perf_counter()
+
+        with self._lock:
+            self._snapshot = self.sim.snapshot()
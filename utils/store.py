@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Telemetry is stored as Parquet files partitioned by hour:
+#
+#   <root>/date=2026-03-01/hour=13/part-<uuid>.parquet
+#
+# Every row carries a `pod_id` and a `ts` timestamp column, so a query only
+# opens the partitions overlapping its time range, only decodes the columns
+# it asks for and lets Parquet row-group statistics skip the rest. Sparse
+# data can use wider partitions (`partition_hours`, a divisor of 24).
+#
+# Each append writes one file per partition it touches. Once a partition is
+# closed (an append lands in a later one) its files are merged into one by
+# compact(), on the appending thread. Wide partitions fed by frequent
+# flushes can also have their open partition merged every
+# `compact_interval` seconds. A merged file lists the files it
+# replaces in its metadata, so a query racing a compaction never returns a
+# row twice, and re-reads a partition whose files vanished mid-read.
+
+
+class TelemetryStore:
+
+    def __init__(self, root, partition_hours=1, compact_interval=None):
+        self.root             = root
+        self.partition_hours  = partition_hours
+        self.compact_interval = compact_interval
+        self._next_compact    = time.monotonic() + (compact_interval or 0)
+        self._last_hour       = None
+        self._compacting      = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _hour(self, ts):
+        return ts.replace(hour=ts.hour - ts.hour % self.partition_hours,
+                          minute=0, second=0, microsecond=0)
+
+    def _partition_dir(self, hour):
+        return os.path.join(self.root, f"date={hour:%Y-%m-%d}", f"hour={hour:%H}")
+
+    def append(self, rows):
+        # rows: list of dicts with at least "pod_id" and "ts" (datetime)
+        by_hour = {}
+        for row in rows:
+            by_hour.setdefault(self._hour(row["ts"]), []).append(row)
+
+        for hour, part in by_hour.items():
+            path = self._partition_dir(hour)
+            os.makedirs(path, exist_ok=True)
+            self._write(pa.Table.from_pylist(part), path)
+
+        # Rows for a newer partition close the earlier ones: merge their
+        # per-flush files now rather than letting them pile up until restart
+        newest = max(by_hour, default=None)
+        if newest is None:
+            return
+        if self.compact_interval and time.monotonic() >= self._next_compact:
+            self._next_compact = time.monotonic() + self.compact_interval
+            self.compact(before=newest + timedelta(hours=self.partition_hours))
+        elif self._last_hour is not None and newest > self._last_hour:
+            self.compact(before=newest)
+        if self._last_hour is None or newest > self._last_hour:
+            self._last_hour = newest
+
+    def _write(self, table, path, **kwargs):
+        # Written aside and renamed into place, so readers never see a
+        # partial file
+        tmp = os.path.join(path, f"write-{uuid.uuid4().hex}.tmp")
+        pq.write_table(table, tmp, **kwargs)
+        os.replace(tmp, os.path.join(path, f"part-{uuid.uuid4().hex}.parquet"))
+
+    def partitions(self, start=None, end=None):
+        # Yields (hour, directory) for every partition overlapping [start, end)
+        first = self._hour(start) if start else None
+        for date_dir in sorted(os.listdir(self.root)):
+            if not date_dir.startswith("date="):
+                continue
+            day = datetime.strptime(date_dir[5:], "%Y-%m-%d")
+            if (first and day + timedelta(days=1) <= first) or (end and day >= end):
+                continue
+            for hour_dir in sorted(os.listdir(os.path.join(self.root, date_dir))):
+                hour = day.replace(hour=int(hour_dir[5:]))
+                if (first and hour < first) or (end and hour >= end):
+                    continue
+                yield hour, os.path.join(self.root, date_dir, hour_dir)
+
+    def query(self, pod_ids=None, start=None, end=None, columns=None):
+        filters = []
+        if pod_ids:
+            filters.append(("pod_id", "in", list(pod_ids)))
+        if start:
+            filters.append(("ts", ">=", start))
+        if end:
+            filters.append(("ts", "<", end))
+        if columns:
+            columns = list(dict.fromkeys(["pod_id", "ts", *columns]))
+
+        tables = []
+        for _, path in self.partitions(start, end):
+            tables.extend(self._read_partition(path, columns, filters))
+
+        if not tables:
+            return pd.DataFrame(columns=columns or ["pod_id", "ts"])
+        table = pa.concat_tables(tables, promote_options="default")
+        return table.to_pandas().sort_values("ts", ignore_index=True)
+
+    def _read_partition(self, path, columns, filters, attempts=3):
+        # A concurrent compact() replaces files under us. Files a merged file
+        # lists as replaced are skipped; a file removed between listing and
+        # reading is fine if a merged file we read covers it, otherwise the
+        # partition is listed again (the merged file is in place before any
+        # part is removed)
+        for attempt in range(attempts):
+            tables, replaced, vanished = {}, set(), set()
+            for name in sorted(os.listdir(path)):
+                if not name.endswith(".parquet"):
+                    continue
+                file_path = os.path.join(path, name)
+                try:
+                    schema = pq.read_schema(file_path)
+                    tables[name] = pq.read_table(
+                        file_path,
+                        columns=[c for c in columns if c in schema.names] if columns else None,
+                        filters=filters or None,
+                    )
+                except FileNotFoundError:
+                    vanished.add(name)
+                    continue
+                replaced.update(json.loads((schema.metadata or {}).get(b"replaces", b"[]")))
+            if vanished <= replaced or attempt == attempts - 1:
+                return [t for name, t in tables.items() if name not in replaced]
+
+    def compact(self, before=None):
+        # Merges the small per-flush files of every closed partition (default:
+        # everything older than the current hour) into a single file.
+        before = before or self._hour(datetime.now())
+        with self._compacting:
+            for _, path in self.partitions(end=before):
+                self._compact_partition(path)
+
+    def _compact_partition(self, path):
+        parts = sorted(n for n in os.listdir(path) if n.endswith(".parquet"))
+        if len(parts) < 2:
+            return
+        tables = [pq.read_table(os.path.join(path, n)) for n in parts]
+        merged = pa.concat_tables(tables, promote_options="default").sort_by("ts")
+        merged = merged.replace_schema_metadata({b"replaces": json.dumps(parts).encode()})
+        self._write(merged, path, row_group_size=64 * 1024)
+        for name in parts:
+            os.remove(os.path.join(path, name))
+
+
+class RollupStore:
+    # Closed history buckets (see FleetHistory.on_close), one TelemetryStore
+    # per resolution next to the raw telemetry:
+    #
+    #   <root>/rollup_60s/date=2026-03-01/hour=00/part-<uuid>.parquet
+    #
+    # Minute and coarser buckets are partitioned by day, so a week-long view
+    # opens seven files; today's partition is merged every `compact_interval`
+    # seconds so it stays a handful of files too. Long-range views read these
+    # instead of re-aggregating raw rows.
+
+    def __init__(self, root, resolutions, compact_interval=600):
+        self.stores = {res: TelemetryStore(os.path.join(root, f"rollup_{res}s"),
+                                           partition_hours=24 if res >= 60 else 1,
+                                           compact_interval=compact_interval if res >= 60 else None)
+                       for res in resolutions}
+
+    def append(self, rows):
+        # rows: dicts with "resolution", "pod_id", "ts" and the bucket columns
+        by_res = {}
+        for row in rows:
+            by_res.setdefault(row["resolution"], []).append(
+                {k: v for k, v in row.items() if k != "resolution"})
+        for res, part in by_res.items():
+            self.stores[res].append(part)
+
+    def query(self, resolution, pod_ids=None, start=None, end=None, columns=None):
+        return self.stores[resolution].query(pod_ids, start, end, columns)
+
+    def compact(self, before=None):
+        for store in self.stores.values():
+            store.compact(before)
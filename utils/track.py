@@ -0,0 +1,148 @@
+import numpy as np
+
+EARTH_RADIUS = 6_371_000.0  # m
+BRAKE_DECEL  = 9.81         # m/s², emergency braking assumed for collision margins
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    # Great-circle distance in metres, vectorized over array inputs
+    lat1, lon1, lat2, lon2 = (np.radians(a) for a in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+def stopping_distance(speed_kmh, decel=BRAKE_DECEL):
+    v = np.asarray(speed_kmh, dtype=np.float64) / 3.6
+    return v * v / (2 * decel)
+
+
+class TrackGeometry:
+    # A polyline track. Every vertex carries its chainage (metres from the
+    # start along the line), so a pod position is a single float and lat/lon
+    # is recovered by interpolating between vertices. Segments are the spans
+    # between consecutive vertices. Closed tracks wrap chainage at `length`.
+
+    def __init__(self, points, closed=False):
+        pts = np.asarray(points, dtype=np.float64)
+        if closed and not np.array_equal(pts[0], pts[-1]):
+            pts = np.vstack((pts, pts[:1]))
+        self.lat      = pts[:, 0]
+        self.lon      = pts[:, 1]
+        self.closed   = closed
+        self.vertices = np.concatenate(([0.0], np.cumsum(
+            haversine(self.lat[:-1], self.lon[:-1], self.lat[1:], self.lon[1:]))))
+        self.length   = float(self.vertices[-1])
+
+    @classmethod
+    def loop(cls, center, radius_m=2000.0, n_vertices=48):
+        # Circular loop around a city centre, for demo tracks
+        lat, lon = center
+        theta    = np.linspace(0, 2 * np.pi, n_vertices, endpoint=False)
+        dlat     = np.degrees(radius_m / EARTH_RADIUS)
+        dlon     = dlat / np.cos(np.radians(lat))
+        return cls(np.column_stack((lat + dlat * np.sin(theta), lon + dlon * np.cos(theta))),
+                   closed=True)
+
+    @property
+    def n_segments(self):
+        return len(self.vertices) - 1
+
+    def wrap(self, chainage):
+        chainage = np.asarray(chainage, dtype=np.float64)
+        if self.closed:
+            return np.mod(chainage, self.length)
+        return np.clip(chainage, 0.0, self.length)
+
+    def position(self, chainage):
+        # (lat, lon) arrays for an array of chainages
+        chainage = self.wrap(chainage)
+        return (np.interp(chainage, self.vertices, self.lat),
+                np.interp(chainage, self.vertices, self.lon))
+
+    def segment_of(self, chainage):
+        seg = np.searchsorted(self.vertices, self.wrap(chainage), side="right") - 1
+        return np.clip(seg, 0, self.n_segments - 1)
+
+    def segment_bounds(self, segment):
+        return float(self.vertices[segment]), float(self.vertices[segment + 1])
+
+    def coordinates(self):
+        return np.column_stack((self.lat, self.lon)).tolist()
+
+
+class TrackIndex:
+    # Pods sorted by chainage. `update` re-sorts the whole fleet once per
+    # tick (one argsort); every query after that is a binary search into the
+    # sorted array, and headways for the whole fleet are a single diff.
+    # Pods are assumed to travel in the direction of increasing chainage.
+
+    def __init__(self, track):
+        self.track    = track
+        self.chainage = np.empty(0)
+        self.order    = np.empty(0, dtype=np.intp)   # sorted position -> pod
+        self.rank     = np.empty(0, dtype=np.intp)   # pod -> sorted position
+        self.sorted   = np.empty(0)
+
+    def __len__(self):
+        return len(self.chainage)
+
+    def update(self, chainage):
+        self.chainage = self.track.wrap(chainage)
+        self.order    = np.argsort(self.chainage, kind="stable")
+        self.sorted   = self.chainage[self.order]
+        self.rank     = np.empty_like(self.order)
+        self.rank[self.order] = np.arange(len(self.order))
+        return self
+
+    def _between(self, lo, hi):
+        # Pods with lo <= chainage <= hi, splitting ranges that cross the seam
+        length = self.track.length
+        if self.track.closed:
+            if hi - lo >= length:
+                return self.order.copy()
+            if lo < 0:
+                return np.concatenate((self._between(lo + length, length), self._between(0.0, hi)))
+            if hi > length:
+                return np.concatenate((self._between(lo, length), self._between(0.0, hi - length)))
+        a = np.searchsorted(self.sorted, lo, side="left")
+        b = np.searchsorted(self.sorted, hi, side="right")
+        return self.order[a:b]
+
+    def within(self, pod, distance):
+        # Pods within `distance` metres of pod `pod` along the track (either side)
+        at   = self.chainage[pod]
+        pods = self._between(at - distance, at + distance)
+        return pods[pods != pod]
+
+    def in_segment(self, segment):
+        lo, hi = self.track.segment_bounds(segment)
+        a = np.searchsorted(self.sorted, lo, side="left")
+        b = np.searchsorted(self.sorted, hi, side="right" if segment == self.track.n_segments - 1 else "left")
+        return self.order[a:b]
+
+    def ahead(self, pod):
+        # (next pod ahead, gap in metres), or (None, inf) for the leader of an open track
+        n    = len(self.order)
+        rank = self.rank[pod] + 1
+        if n < 2 or (rank == n and not self.track.closed):
+            return None, np.inf
+        nxt = self.order[rank % n]
+        gap = self.chainage[nxt] - self.chainage[pod]
+        return int(nxt), float(gap + self.track.length if gap < 0 or nxt == pod else gap)
+
+    def headways(self):
+        # Gap to the pod ahead for every pod, aligned with the chainage array
+        n   = len(self.order)
+        out = np.empty(n)
+        if n == 0:
+            return out
+        out[self.order[:-1]] = np.diff(self.sorted)
+        out[self.order[-1]]  = (self.sorted[0] + self.track.length - self.sorted[-1]
+                                if self.track.closed else np.inf)
+        return out
+
+    def margins(self, speed_kmh, decel=BRAKE_DECEL):
+        # Headway left over after an emergency stop; negative means the pod
+        # could not stop before reaching the current position of the pod ahead
+        return self.headways() - stopping_distance(speed_kmh, decel)
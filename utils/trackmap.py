@@ -0,0 +1,70 @@
+import folium
+from folium.plugins import FastMarkerCluster
+
+from utils.pods import STATUSES
+
+STATUS_COLORS = {"Operational": "green", "Maintenance": "orange"}
+
+# The map is split in two so a rerun only re-sends what changed:
+#
+#   build_base_map   tiles, view and track line, identical on every rerun for a
+#                    city, so st_folium keeps the mounted map instead of rebuilding it
+#   build_pod_layer  one FeatureGroup holding every pod as a compact row
+#                    [lat, lon, status, id, speed, battery]; markers are created
+#                    in the browser and clustered below CLUSTER_ZOOM
+CLUSTER_ZOOM = 14
+
+_MARKER_JS = """
+    var statuses = %s;
+    var colors   = %s;
+    function callback(row) {
+        var status = statuses[row[2]];
+        var color  = colors[row[2]];
+        var marker = L.circleMarker([row[0], row[1]], {
+            radius: 9, color: color, fill: true, fillColor: color, fillOpacity: 0.8
+        });
+        marker.bindTooltip(row[3] + " | " + status);
+        marker.bindPopup("<b>" + row[3] + "</b><br>Speed: " + row[4] + " km/h<br>" +
+                         "Battery: " + row[5] + "%%<br>Status: " + status);
+        return marker;
+    }
+"""
+
+
+def build_base_map(center, track=None):
+    m = folium.Map(location=center, zoom_start=14, tiles="CartoDB dark_matter")
+    if track is not None:
+        folium.PolyLine(track.coordinates(), color="#00d4ff", weight=3, opacity=0.6).add_to(m)
+    return m
+
+
+def pod_rows(pods):
+    rows = []
+    for pod in pods:
+        if pod["latitude"] is None:
+            continue
+        rows.append([round(pod["latitude"], 6), round(pod["longitude"], 6),
+                     STATUSES.index(pod["status"]), pod["id"], pod["speed"],
+                     round(pod["battery"], 1)])
+    return rows
+
+
+def build_pod_layer(pods):
+    layer    = folium.FeatureGroup(name="Pods")
+    statuses = list(STATUSES)
+    colors   = [STATUS_COLORS.get(status, "gray") for status in statuses]
+    FastMarkerCluster(
+        pod_rows(pods),
+        callback=_MARKER_JS % (statuses, colors),
+        disableClusteringAtZoom=CLUSTER_ZOOM,
+        chunkedLoading=True,
+        showCoverageOnHover=False,
+    ).add_to(layer)
+    return layer
+
+
+def build_pod_map(center, pods, track=None):
+    # Standalone map (base + pods), e.g. for exporting to HTML
+    m = build_base_map(center, track)
+    build_pod_layer(pods).add_to(m)
+    return m
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+# Start-up work run once per server process, concurrently: every task gets
+# its own thread, so boot takes as long as the slowest task rather than
+# the sum of them. Sessions that arrive while it runs (or after) only wait
+# on the futures; nothing sleeps. A failed task is recorded and skipped,
+# and whatever it was warming is created on first use instead.
+#
+# Also keeps each session's time-to-interactive, for the p50 / max shown
+# next to the landing page.
+
+
+class Warmup:
+
+    def __init__(self, tasks, initializer=None, keep=1000):
+        # tasks: {name: zero-arg callable}; initializer runs in each worker
+        # thread before its task (e.g. to attach a Streamlit script context)
+        self.tasks    = dict(tasks)
+        self.timings  = {}    # name -> ms
+        self.errors   = {}    # name -> repr of the exception
+        self.started  = time.time()
+        self._tti     = deque(maxlen=keep)
+        self._lock    = threading.Lock()
+        pool          = ThreadPoolExecutor(max(len(self.tasks), 1), thread_name_prefix="warmup",
+                                           initializer=initializer)
+        self._futures = {pool.submit(self._run, name, fn): name for name, fn in self.tasks.items()}
+        pool.shutdown(wait=False)
+
+    def _run(self, name, fn):
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            self.errors[name] = repr(e)
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000
+
+    def done(self):
+        return all(future.done() for future in self._futures)
+
+    def pending(self):
+        return [name for future, name in self._futures.items() if not future.done()]
+
+    def wait(self, timeout=None):
+        # Yields (tasks finished so far, name) as tasks finish; stops early
+        # after `timeout` seconds, leaving the rest running in the background
+        finished = 0
+        try:
+            for future in as_completed(self._futures, timeout):
+                finished += 1
+                yield finished, self._futures[future]
+        except TimeoutError:
+            return
+
+    def record_tti(self, ms):
+        with self._lock:
+            self._tti.append(ms)
+
+    def stats(self):
+        with self._lock:
+            tti = np.array(self._tti)
+        return {"tasks":       {k: round(v, 1) for k, v in self.timings.items()},
+                "errors":      dict(self.errors),
+                "sessions":    len(tti),
+                "tti_p50_ms":  round(float(np.percentile(tti, 50)), 1) if len(tti) else None,
+                "tti_max_ms":  round(float(tti.max()), 1) if len(tti) else None}
@@ -0,0 +1,109 @@
+import math
+import threading
+import time
+
+import numpy as np
+
+# Route weather -> speed limits.
+#
+# WeatherGrid samples the track every `spacing_m` metres (waypoints) and a
+# background thread refreshes the weather at every waypoint in one
+# concurrent batch. After each refresh the SpeedProfile is rebuilt: the
+# track is cut into fixed `bin_m` chainage bins and each bin takes the limit
+# of its nearest waypoint. Looking up a limit is then an array index, so the
+# simulator and alert engine never touch the network.
+
+MAX_LIMIT = 900   # km/h, clear conditions
+
+
+def speed_limit(weather):
+    description = weather["weather"][0]["description"].lower()
+    wind        = weather.get("wind", {}).get("speed", 0)
+    if "thunderstorm" in description or wind >= 20:
+        return 500
+    if any(w in description for w in ["rain", "overcast", "haze"]):
+        return 700
+    return MAX_LIMIT
+
+
+class SpeedProfile:
+
+    def __init__(self, track, bin_m=50.0, default=MAX_LIMIT):
+        # Bins are stretched slightly so they tile the track exactly; a bin
+        # index is then floor(chainage / bin_m), wrapped or clipped
+        self.track   = track
+        self.n_bins  = max(int(np.ceil(track.length / bin_m)), 1)
+        self.bin_m   = track.length / self.n_bins
+        self.centers = (np.arange(self.n_bins) + 0.5) * self.bin_m
+        self.limits  = np.full(self.n_bins, float(default))
+        self._scale  = 1.0 / self.bin_m
+
+    def _bins(self, chainage):
+        bins = np.floor(np.asarray(chainage, dtype=np.float64) * self._scale).astype(np.intp)
+        if self.track.closed:
+            return np.mod(bins, self.n_bins, out=bins)
+        return np.clip(bins, 0, self.n_bins - 1, out=bins)
+
+    def limit_at(self, chainage):
+        i = math.floor(chainage * self._scale)
+        i = i % self.n_bins if self.track.closed else min(max(i, 0), self.n_bins - 1)
+        return float(self.limits[i])
+
+    def limits_for(self, chainage):
+        return self.limits[self._bins(chainage)]
+
+    def update(self, waypoints, limits):
+        # waypoints: chainages; limits: one per waypoint (nan = no reading,
+        # keeps that stretch's previous limits)
+        gap = np.abs(self.centers[:, None] - np.asarray(waypoints)[None, :])
+        if self.track.closed:
+            gap = np.minimum(gap, self.track.length - gap)
+        new = np.asarray(limits, dtype=np.float64)[gap.argmin(axis=1)]
+        self.limits = np.where(np.isnan(new), self.limits, new)   # swapped in one assignment
+
+
+class WeatherGrid:
+
+    def __init__(self, track, fetch_many, spacing_m=2000.0, interval=300.0, bin_m=50.0):
+        # fetch_many([(lat, lon), ...]) -> weather JSON (or None) per point
+        self.track         = track
+        self.fetch_many    = fetch_many
+        self.interval      = interval
+        self.profile       = SpeedProfile(track, bin_m)
+        self.waypoints     = np.arange(0.0, track.length, spacing_m)
+        self.lat, self.lon = track.position(self.waypoints)
+        self.readings      = [None] * len(self.waypoints)
+        self.refreshes     = 0
+        self.failures      = 0
+        self.last_refresh  = None
+        self.last_duration = 0.0
+        self._stop         = threading.Event()
+        self._thread       = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="weather-grid", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        start    = time.perf_counter()
+        readings = self.fetch_many(list(zip(self.lat.tolist(), self.lon.tolist())))
+        limits   = [speed_limit(r) if r else np.nan for r in readings]
+        self.readings = readings
+        self.profile.update(self.waypoints, limits)
+        self.failures     += sum(r is None for r in readings)
+        self.refreshes    += 1
+        self.last_refresh  = time.time()
+        self.last_duration = time.perf_counter() - start
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                self.failures += 1
+            self._stop.wait(self.interval)
@@ -0,0 +1,76 @@
+import importlib
+import sys
+import time
+
+from utils.metrics import REGISTRY
+
+# Page registry. Every page lives in its own module here with a render()
+# function, and app.py imports a module the first time someone navigates
+# to its page, so a cold start only pays for the shell (theme, login,
+# sidebar) and a session only ever loads the dependencies of the pages it
+# opens: folium with the Live Track Map, pyarrow with Pod Comparison, ...
+#
+# (Not named pages/: Streamlit would turn that into its own multipage nav.)
+#
+# The first import and every render of a page are timed against the budgets
+# below; `python scripts/import_budget.py` checks the same import budget
+# from a fresh interpreter with `python -X importtime`.
+
+PAGES = {
+    "Overview":            "views.overview",
+    "Pod Tracker":         "views.pod_tracker",
+    "Performance Metrics": "views.performance",
+    "Weather Monitoring":  "views.weather",
+    "Pod Comparison":      "views.pod_comparison",
+    "Live Track Map":      "views.track_map",
+    "System Alerts":       "views.alerts",
+    "Maintenance Logs":    "views.maintenance",
+    "Did You Know":        "views.facts",
+    "MQTT Live Data":      "views.mqtt",
+    "System Performance":  "views.system_performance",
+}
+
+IMPORT_BUDGET_MS = 750   # first import of a page module, on top of the shell
+RERUN_BUDGET_MS  = 250   # one render() of a page
+
+RENDER_TIME = REGISTRY.histogram("page_render_seconds", "One render() of a dashboard page")
+IMPORT_TIME = REGISTRY.histogram("page_import_seconds", "First import of a page module")
+
+_timings = {}   # page -> {"import_ms", "last_ms", "max_ms", "renders"}
+
+
+def timings(page):
+    return _timings.get(page)
+
+
+def _stats(page):
+    return _timings.setdefault(page, {"import_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0,
+                                      "renders": 0})
+
+
+def load(page):
+    name   = PAGES[page]
+    module = sys.modules.get(name)
+    if module is None:
+        start  = time.perf_counter()
+        module = importlib.import_module(name)
+        elapsed = time.perf_counter() - start
+        IMPORT_TIME.observe(elapsed, page=page)
+        _stats(page)["import_ms"] = elapsed * 1000
+    return module
+
+
+def render(page):
+    module = load(page)
+    start  = time.perf_counter()
+    try:
+        module.render()
+    finally:
+        # Also recorded when the page ends early with st.stop() / st.rerun()
+        elapsed = time.perf_counter() - start
+        RENDER_TIME.observe(elapsed, page=page)
+        ms    = elapsed * 1000
+        stats = _stats(page)
+        stats["last_ms"]  = ms
+        stats["max_ms"]   = max(stats["max_ms"], ms)
+        stats["renders"] += 1
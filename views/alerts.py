@@ -0,0 +1,48 @@
+import pandas as pd
+import streamlit as st
+
+from utils.services import get_alert_engine, get_sim_loop
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ SYSTEM ALERTS</div>", unsafe_allow_html=True)
+
+    # Alerts are raised by the shared engine for every pod as telemetry
+    # arrives; this page only reads its active and resolved tables.
+    alert_engine = get_alert_engine()
+    pod          = get_sim_loop().latest_pod(0)
+    speed, temp, battery, pressure = pod["speed"], pod["temperature"], pod["battery"], pod["pressure"]
+
+    active = alert_engine.active_alerts()
+    if any(a["Level"] == "CRITICAL" for a in active):
+        st.error(f"⚠ {sum(a['Level'] == 'CRITICAL' for a in active)} critical alert(s) active")
+    elif active:
+        st.warning(f"⚠ {len(active)} warning(s) active")
+    else:
+        st.success("✓ All systems operational")
+
+    st.divider()
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Speed",       f"{speed:g} km/h")
+    c2.metric("Temperature", f"{temp} °C")
+    c3.metric("Battery",     f"{battery} %")
+    c4.metric("Pressure",    f"{pressure:g} Pa")
+
+    st.divider()
+    st.subheader("Active Alerts")
+    if active:
+        st.dataframe(pd.DataFrame(active[:500]).drop(columns=["Resolved"]), use_container_width=True)
+    else:
+        st.info("No active alerts.")
+
+    st.subheader("Alert History")
+    resolved = alert_engine.resolved_alerts(50)
+    if resolved:
+        st.dataframe(pd.DataFrame(resolved), use_container_width=True)
+    else:
+        st.info("No resolved alerts recorded.")
+
+    if st.button("Clear Alert History"):
+        alert_engine.clear_resolved()
+        st.rerun()
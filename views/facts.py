@@ -0,0 +1,14 @@
+import requests
+import streamlit as st
+
+from utils.services import FACTS_API, get_http_client
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ DID YOU KNOW</div>", unsafe_allow_html=True)
+
+    if st.button("Generate Hyperloop Fact"):
+        try:
+            st.info(get_http_client().get_json(f"{FACTS_API}/random.json", {"language": "en"})["text"])
+        except (requests.RequestException, ValueError, KeyError):
+            st.error("Failed to fetch fact.")
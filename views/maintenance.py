@@ -0,0 +1,44 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from utils.services import data_path, get_csv_sink
+
+
+@st.cache_data(max_entries=4)
+def load_log_file(path, mtime):
+    # mtime is part of the cache key, so the file is only re-read after it changes
+    return pd.read_csv(path, quoting=1)
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ MAINTENANCE LOGS</div>", unsafe_allow_html=True)
+
+    log_file = data_path("maintenance_logs.csv")
+    if os.path.exists(log_file):
+        try:
+            st.dataframe(load_log_file(log_file, os.path.getmtime(log_file)),
+                         use_container_width=True)
+        except Exception as e:
+            st.warning(f"Could not load log file: {e}")
+
+    with st.form("log_form"):
+        engineer  = st.text_input("Engineer Name")
+        issue     = st.text_area("Issue")
+        severity  = st.selectbox("Severity", ["Low", "Medium", "High", "Critical"])
+        submitted = st.form_submit_button("Submit Log")
+        if submitted:
+            if not engineer.strip() or not issue.strip():
+                st.error("Engineer name and issue cannot be blank.")
+            else:
+                entry = {
+                    "Time":     datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "Engineer": engineer.strip(),
+                    "Issue":    issue.strip(),
+                    "Severity": severity,
+                }
+                get_csv_sink("maintenance_logs.csv").append(entry)
+                st.success("Log saved.")
+                st.rerun()
@@ -0,0 +1,169 @@
+import time
+from datetime import datetime
+from itertools import islice
+
+import pandas as pd
+import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+
+from utils.ingest import BROKER_HOST, BROKER_PORT
+from utils.services import (CHART_BUCKETS, HISTORY_RANGES, LOCAL_TZ, get_csv_writer,
+                            get_fleet_state, get_ingest_service, get_mqtt_history,
+                            get_rollup_store)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_rollups(pod_id, resolution, start, end):
+    frame = get_rollup_store().query(resolution, [pod_id], datetime.fromtimestamp(start),
+                                     datetime.fromtimestamp(end), ["time", "speed", "battery"])
+    return frame[["time", "speed", "battery"]] if len(frame) else None
+
+
+def pod_rollups(pod_id, resolution, seconds):
+    # Recent buckets come from memory; when the window reaches further back
+    # than the in-memory ring, the older part is read from the persisted
+    # rollups (cached per minute, so reruns don't touch Parquet)
+    now    = time.time()
+    rows   = get_mqtt_history().pod(pod_id, seconds, resolution, now)
+    recent = pd.DataFrame({k: rows[k] for k in ("time", "speed", "battery")})
+    start  = now - seconds
+    if resolution is None or (len(recent) and recent["time"].iloc[0] <= start + resolution):
+        return recent
+    step  = max(resolution, 60)
+    older = load_rollups(pod_id, resolution, start // step * step, now // step * step + step)
+    if older is None:
+        return recent
+    if len(recent):
+        older = older[older["time"] < recent["time"].iloc[0]]
+    return pd.concat((older[older["time"] >= start], recent), ignore_index=True)
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ MQTT LIVE CONTROL PANEL</div>", unsafe_allow_html=True)
+
+    st_autorefresh(interval=1000, key="mqtt_refresh")
+
+    ingest      = get_ingest_service()
+    mqtt_writer = get_csv_writer("mqtt_logs.csv")
+
+    # Logging and the CSV are process-wide, shared by every session, so only
+    # Controllers may pause logging or clear the log
+    controller = st.session_state.get("role") == "Controller"
+    locked     = None if controller else "Requires Controller privileges"
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if ingest.logging:
+            if st.button("⏸ Pause Logging", disabled=not controller, help=locked):
+                ingest.logging = False
+        else:
+            if st.button("▶ Resume Logging", disabled=not controller, help=locked):
+                ingest.logging = True
+    with col2:
+        if st.button("🗑 Clear Messages"):
+            st.session_state.mqtt_data.clear()
+            st.rerun()
+    with col3:
+        if st.button("🗑 Clear CSV Log", disabled=not controller, help=locked):
+            if not mqtt_writer.flush():
+                st.warning("CSV writer is backed up; nothing cleared, try again shortly.")
+            elif mqtt_writer.flush_fn.clear():
+                st.success("CSV cleared.")
+            else:
+                st.info("No CSV file found.")
+
+    new_messages, st.session_state.mqtt_cursor, _ = ingest.read_since(st.session_state.mqtt_cursor)
+    if ingest.logging:
+        # Bounded deque (see app.py): the oldest messages fall off the front
+        st.session_state.mqtt_data.extend(new_messages)
+
+    message_count = len(st.session_state.mqtt_data)
+
+    connected = ingest.is_connected() or message_count > 0
+    status_color = "#00ff88" if connected else "#ff4466"
+    status_text  = f"BROKER CONNECTED — {BROKER_HOST}:{BROKER_PORT}" if connected else "BROKER NOT CONNECTED"
+    logging_badge = (
+        "<span style='color:#00ff88;font-size:0.8rem;'> ● LOGGING</span>"
+        if ingest.logging else
+        "<span style='color:#ff4466;font-size:0.8rem;'> ● PAUSED</span>"
+    )
+    st.markdown(
+        f"<p style='color:{status_color};font-family:Share Tech Mono,monospace;'>"
+        f"{'🟢' if connected else '🔴'} {status_text} {logging_badge}</p>",
+        unsafe_allow_html=True
+    )
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("📡 Total Messages", message_count)
+    c2.metric("🕒 Last Update",
+              st.session_state.mqtt_data[-1].timestamp if message_count > 0 else "No Data")
+    c3.metric("💾 Memory Cap", f"{message_count}/{st.session_state.mqtt_data.maxlen}")
+
+    writer_stats = mqtt_writer.stats()
+    w1, w2, w3, w4 = st.columns(4)
+    w1.metric("✍ CSV Rows/sec",  writer_stats["rows_per_sec"])
+    w2.metric("⏳ Write Queue",   writer_stats["queue_depth"])
+    w3.metric("⚠ Dropped Rows",  writer_stats["dropped"] + writer_stats["errors"])
+    w4.metric("🚫 Rejected Msgs", ingest.rejected)
+
+    # Bounded hand-off from the broker thread to the sinks (MQTT_QUEUE_POLICY)
+    queue_stats = ingest.queue.stats()
+    q1, q2, q3, q4 = st.columns(4)
+    q1.metric("📥 Ingest Queue",   f"{queue_stats['depth']}/{queue_stats['capacity']}",
+              f"peak {queue_stats['high_water']}", delta_color="off")
+    q2.metric("🗑 Dropped Msgs",    queue_stats["dropped"])
+    q3.metric("🔀 Coalesced Msgs",  queue_stats["coalesced"])
+    q4.metric("⏱ Blocked",          f"{queue_stats['blocked_s']} s", queue_stats["policy"], delta_color="off")
+
+    st.divider()
+
+    # Records were decoded and validated once on ingestion; nothing here
+    # parses JSON again.
+    if message_count > 0:
+        st.json(st.session_state.mqtt_data[-1].as_dict())
+
+        with st.expander("📋 Message History (last 10)"):
+            for record in islice(reversed(st.session_state.mqtt_data), 10):
+                st.markdown(
+                    f"<code style='color:#00aaff;'>{record.timestamp}</code> — "
+                    f"<code style='color:#a8d8ff;'>{record.id} | {record.speed} km/h | "
+                    f"{record.battery}% | {record.status}</code>",
+                    unsafe_allow_html=True
+                )
+    else:
+        st.warning("Waiting for incoming MQTT telemetry data...")
+
+    # Shared per-pod history, fed by the ingest thread for every message
+    mqtt_history = get_mqtt_history()
+    if mqtt_history.pod_ids:
+        # Newest reading of every MQTT pod: one lookup per pod in the shared
+        # fleet snapshot, the same state Pod Tracker and the map show
+        snap   = get_fleet_state().snapshot()
+        latest = [row for row in map(snap.get, sorted(mqtt_history.pod_ids)) if row]
+        if latest:
+            st.subheader("Latest per Pod")
+            frame = pd.DataFrame(latest)[["id", "status", "speed", "battery", "received"]].round(2)
+            frame["received"] = pd.to_datetime(frame["received"], unit="s", utc=True).dt.floor("ms").dt.tz_convert(LOCAL_TZ)
+            st.dataframe(frame, use_container_width=True, hide_index=True)
+
+        st.subheader("Pod History")
+        h1, h2, h3 = st.columns(3)
+        pod_id  = h1.selectbox("Pod", sorted(mqtt_history.pod_ids))
+        seconds = HISTORY_RANGES[h2.select_slider("Range", list(HISTORY_RANGES), value="5 min")]
+        # Only resolutions that keep the chart under CHART_BUCKETS points;
+        # raw samples only exist for the last hour or so
+        choices = {label: res for label, res in
+                   {"Raw": None, "1 s": 1, "10 s": 10, "1 min": 60, "1 h": 3600}.items()
+                   if seconds / (res or 1) <= CHART_BUCKETS}
+        default = next((i for i, res in enumerate(choices.values())
+                        if res and seconds / res <= 2000), len(choices) - 1)
+        resolution = choices[h3.radio("Resolution", list(choices), index=default, horizontal=True)]
+        frame = pod_rollups(pod_id, resolution, seconds)
+        if len(frame):
+            st.line_chart(frame.set_index(
+                pd.to_datetime(frame["time"], unit="s", utc=True).dt.tz_convert(LOCAL_TZ))[["speed", "battery"]])
+
+        fleet = mqtt_history.fleet(resolution or 1, seconds=seconds)
+        if len(fleet["time"]):
+            st.caption("Fleet mean battery (%)")
+            st.line_chart(pd.Series(fleet["battery"],
+                                    index=pd.to_datetime(fleet["time"], unit="s", utc=True).tz_convert(LOCAL_TZ)))
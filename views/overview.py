@@ -0,0 +1,40 @@
+import time
+
+import numpy as np
+import streamlit as st
+
+from utils.services import get_fleet_state, get_sim_loop
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ SYSTEM OVERVIEW</div>", unsafe_allow_html=True)
+
+    # Fleet at a glance, from the same shared snapshot Pod Tracker and the
+    # Live Track Map read
+    get_sim_loop()
+    fleet = get_fleet_state().snapshot()
+    if len(fleet):
+        counts = fleet.counts()
+        c1, c2, c3, c4, c5 = st.columns(5)
+        c1.metric("🚄 Pods Reporting", len(fleet))
+        for col, (status, n) in zip((c2, c3, c4), counts.items()):
+            col.metric(status, n)
+        c5.metric("📡 Newest Reading", f"{max(time.time() - np.nanmax(fleet.received), 0):.1f} s ago")
+        st.caption(f"Fleet state #{fleet.seq}")
+    st.markdown("""
+    Welcome to the **Avishkar Hyperloop Monitoring Dashboard**.
+
+    This system provides real-time monitoring and control insights
+    for all operational pods across the test track.
+
+    Use the navigation panel to access:
+
+    • **Pod Tracker** — View individual pod details  
+    • **Performance Metrics** — System telemetry & analytics *(Controller only)*  
+    • **Weather Monitoring** — Track conditions along the route  
+    • **Pod Comparison** — Compare pods side-by-side *(Controller only)*  
+    • **Live Track Map** — Real-time GPS visualization  
+    • **System Alerts** — Critical warnings *(Controller only)*  
+    • **Maintenance Logs** — Service history *(Controller only)*  
+    • **System Performance** — Timings, throughput and queues *(Controller only)*  
+    """)
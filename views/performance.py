@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from datetime import datetime
+from streamlit_autorefresh import st_autorefresh
+
+from utils.history import TrendView
+from utils.services import (LOCAL_TZ, get_csv_writer, get_forecaster, get_sim_history,
+                            get_sim_loop)
+
+
+RT_RATE, BASE_RATE = 1000.0, 2.0
+
+
+# The simulation loop is one per process, so its rate and run state are
+# too: the toggles show the loop's current state, and only a change made
+# with a toggle starts, stops or re-rates it, for every session at once.
+def _on_rate_change(sim_loop):
+    sim_loop.set_rate(RT_RATE if st.session_state.rt_mode else BASE_RATE)
+
+
+def _on_auto_change(sim_loop):
+    if st.session_state.auto_mode:
+        sim_loop.start()
+    else:
+        sim_loop.stop()
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ PERFORMANCE METRICS</div>", unsafe_allow_html=True)
+
+    sim_loop = get_sim_loop()
+    pod      = sim_loop.latest_pod(0)
+
+    battery_dead = pod["battery"] <= 0
+    if battery_dead:
+        st.error("⚠ Battery depleted. Simulation stopped.")
+        sim_loop.stop()
+
+    st.session_state.rt_mode   = sim_loop.rate_hz >= RT_RATE
+    st.session_state.auto_mode = sim_loop.running
+    rt_mode   = st.toggle("Enable RT Linux Mode (1ms Latency)", key="rt_mode",
+                          on_change=_on_rate_change, args=(sim_loop,))
+    auto_mode = st.toggle("Auto-Run Simulation Mode", key="auto_mode",
+                          on_change=_on_auto_change, args=(sim_loop,), disabled=battery_dead)
+
+    # The simulator ticks on its own thread; this page only polls its state
+    if auto_mode:
+        st_autorefresh(interval=250 if rt_mode else 500, key="sim_refresh")
+        for key in ["speed", "acceleration", "pressure"]:
+            st.session_state[key] = int(pod[key]) if key != "acceleration" else pod[key]
+
+    st.slider("Speed (km/h)",        0,     1200,   key="speed",        disabled=auto_mode)
+    st.slider("Acceleration (m/s²)", 0.0,   10.0,   key="acceleration", disabled=auto_mode)
+    st.slider("Pressure (Pa)",       90000, 110000, key="pressure",     disabled=auto_mode)
+
+    # Manual stepping only while nobody has the loop running, so one
+    # session's sliders never write into a loop another session auto-runs
+    if not auto_mode:
+        sim_loop.set_inputs(0, speed=st.session_state.speed,
+                            acceleration=st.session_state.acceleration,
+                            pressure=st.session_state.pressure)
+        if not battery_dead:
+            sim_loop.step_once()
+        pod = sim_loop.latest_pod(0)
+
+    speed, acc, pressure = int(pod["speed"]), pod["acceleration"], int(pod["pressure"])
+    temp,  battery       = pod["temperature"], pod["battery"]
+    st.session_state.temperature = temp
+    st.session_state.battery     = battery
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Speed",       f"{speed} km/h")
+    c2.metric("Temperature", f"{temp} °C")
+    c3.metric("Battery",     f"{battery} %")
+    c4.metric("Pressure",    f"{pressure} Pa")
+
+    st.subheader("Performance Trends")
+    tc1, tc2 = st.columns([3, 1])
+    metric_option = tc1.selectbox("Select Parameter",
+                                  ["speed", "acceleration", "temperature", "battery", "pressure"])
+    window = tc2.number_input("Window (samples)", 50, 100_000, 500, step=50)
+
+    # Only samples appended since the last refresh are pulled from the shared
+    # history; the plotted series is min/max downsampled to a fixed budget.
+    trend = st.session_state.get("trend_view")
+    if trend is None or (trend.metric, trend.window) != (metric_option, window):
+        trend = st.session_state.trend_view = TrendView(metric_option, window)
+    t, y = trend.refresh(get_sim_history().view(sim_loop.sim.ids[0]))
+    chart_index = pd.to_datetime(t, unit="s", utc=True).tz_convert(LOCAL_TZ)
+    st.line_chart(pd.DataFrame({metric_option: y}, index=chart_index))
+
+    sim_stats = sim_loop.stats()
+    t1, t2, t3 = st.columns(3)
+    t1.metric("Tick Rate", f"{sim_stats['achieved_hz']} / {sim_stats['target_hz']:g} Hz")
+    t2.metric("Jitter",    f"{sim_stats['jitter_ms']} ms")
+    t3.metric("Overruns",  sim_stats["overruns"])
+
+    # Fitted on the pod's last FORECAST_WINDOW seconds of history
+    forecaster = get_forecaster()
+    forecast   = {k: float(v[0]) for k, v in forecaster.latest.items()}
+    fmt_time   = lambda s: "—" if not np.isfinite(s) else f"{s / 60:.1f} min" if s >= 60 else f"{s:.0f} s"
+    fc_stats   = forecaster.stats()
+    f1, f2, f3 = st.columns(3)
+    f1.metric("Time to Empty",         fmt_time(forecast.get("time_to_empty", np.inf)),
+              f"{forecast.get('drain_rate', 0) * 60:.2f} %/min" if forecast else None, delta_color="off")
+    f2.metric("Time to Thermal Limit", fmt_time(forecast.get("time_to_thermal", np.inf)),
+              f"{forecast.get('heat_rate', 0) * 60:.2f} °C/min" if forecast else None, delta_color="off")
+    f3.metric("Forecast Cost",         f"{fc_stats['last_ms']} ms",
+              f"max {fc_stats['max_ms']} ms", delta_color="off")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Reset Simulation"):
+            sim_loop.reset()
+            get_sim_history().clear()
+            st.session_state.battery     = 100.0
+            st.session_state.temperature = 25.0
+            st.success("Simulation reset.")
+            st.rerun()
+    with col2:
+        if st.button("Log Current Metrics"):
+            get_csv_writer("hyperloop_logs.csv").write(
+                {"Time": datetime.now(), "Speed": speed, "Acceleration": acc,
+                 "Temperature": temp, "Battery": battery, "Pressure": pressure})
+            st.success("Logged to CSV.")
@@ -0,0 +1,61 @@
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from utils.comparison import compare_pods
+from utils.services import HISTORY_RANGES, get_telemetry_store
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def recorded_pod_ids(start, end):
+    frame = get_telemetry_store().query(start=datetime.fromtimestamp(start),
+                                        end=datetime.fromtimestamp(end), columns=["pod_id"])
+    return sorted(frame["pod_id"].unique())
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def pod_comparison(pod_ids, start, end):
+    # Keyed by (pods, window); the window end is whole minutes, so flipping
+    # between pods or pages reuses the result instead of rescanning Parquet
+    frame = get_telemetry_store().query(list(pod_ids), datetime.fromtimestamp(start),
+                                        datetime.fromtimestamp(end), ["speed", "battery"])
+    return compare_pods(frame)
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ POD COMPARISON</div>", unsafe_allow_html=True)
+
+    # Recorded MQTT telemetry (the Parquet store), not freshly generated pods
+    window = st.select_slider("Window", list(HISTORY_RANGES), value="1 h")
+    end    = (time.time() // 60 + 1) * 60
+    start  = end - HISTORY_RANGES[window]
+    ids    = recorded_pod_ids(start, end)
+    if not ids:
+        st.warning("No recorded telemetry in this window. MQTT pods are recorded while logging is on.")
+        st.stop()
+
+    selected = st.multiselect("Pods", ids, default=ids[:2])
+    if not selected:
+        st.info("Select at least one pod.")
+        st.stop()
+    stats = pod_comparison(tuple(sorted(selected)), start, end)
+
+    st.subheader("Statistics")
+    st.dataframe(stats.round(3), use_container_width=True)
+
+    c1, c2 = st.columns(2)
+    c1.subheader("Speed (km/h)")
+    c1.bar_chart(stats[["speed_mean", "speed_p95", "speed_p99"]], stack=False)
+    c2.subheader("Energy per km (% battery)")
+    c2.bar_chart(stats[["energy_per_km"]])
+
+    st.subheader("Head-to-Head")
+    best = {"Mean speed": ("speed_mean", True), "p99 speed": ("speed_p99", True),
+            "Mean battery": ("battery_mean", True), "Energy per km": ("energy_per_km", False)}
+    st.dataframe(pd.DataFrame([
+        {"Metric": label, "Winner": stats[col].idxmax() if high else stats[col].idxmin(),
+         "Value": round(stats[col].max() if high else stats[col].min(), 3)}
+        for label, (col, high) in best.items() if stats[col].notna().any()
+    ]), use_container_width=True, hide_index=True)
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+
+from utils.pods import STATUSES
+from utils.services import get_fleet_state, get_sim_loop
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ POD TRACKER</div>", unsafe_allow_html=True)
+
+    # Shared live fleet (simulated + MQTT pods), read from one snapshot so
+    # the counts, the page and the change highlights agree. Filtering,
+    # sorting and paging happen there; only one page becomes a frame.
+    get_sim_loop()
+    fleet = get_fleet_state().snapshot()
+    if not len(fleet):
+        st.warning("No pods reporting yet.")
+        st.stop()
+
+    if st.toggle("Live refresh", value=True, key="tracker_live"):
+        st_autorefresh(interval=2000, key="tracker_refresh")
+
+    counts = fleet.counts()
+    f1, f2, f3, f4 = st.columns([2, 2, 1, 1])
+    status_filter = f1.selectbox("Filter by Status", ["All", *STATUSES],
+                                 format_func=lambda s: f"{s} ({len(fleet) if s == 'All' else counts[s]})")
+    sort_by    = f2.selectbox("Sort by", ["id", "status", *fleet.columns, "updated"])
+    descending = f3.toggle("Descending", key="tracker_desc")
+    page_size  = f4.selectbox("Per page", [25, 50, 100, 200], index=1)
+
+    status = None if status_filter == "All" else status_filter
+    total    = len(fleet) if status is None else counts[status]
+    pages    = max((total + page_size - 1) // page_size, 1)
+    # Keyed, with a fixed label and no max_value, so a refresh that changes
+    # the page count keeps the reader's page; clamped here instead
+    if st.session_state.get("tracker_page", 1) > pages:
+        st.session_state.tracker_page = pages
+    page_no  = st.number_input("Page", min_value=1, step=1, key="tracker_page")
+    page_no  = min(int(page_no), pages)
+    rows, total = fleet.query(status, sort=sort_by, descending=descending,
+                              offset=(page_no - 1) * page_size, limit=page_size)
+
+    # Rows changed since this session's previous refresh are highlighted
+    last_seq = st.session_state.get("tracker_seq", fleet.seq)
+    df = pd.DataFrame(rows).round(2)
+    changed = df["updated"] > last_seq
+    st.session_state.tracker_seq = fleet.seq
+    st.caption(f"{total} pods · page {page_no} of {pages} · "
+               f"{len(fleet.changed_since(last_seq))} changed since last refresh · "
+               f"fleet state #{fleet.seq} at {datetime.fromtimestamp(fleet.taken):%H:%M:%S}")
+    st.dataframe(df.drop(columns=["updated", "received"]).style.apply(
+                     lambda row: ["background-color: #0b3d2e"] * len(row) if changed[row.name] else [""] * len(row),
+                     axis=1),
+                 use_container_width=True, hide_index=True)
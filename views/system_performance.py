@@ -0,0 +1,81 @@
+import time
+
+import pandas as pd
+import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+
+from utils.metrics import REGISTRY
+from utils.services import METRICS_PORT, get_metrics_server
+
+
+def _label_text(key):
+    return ", ".join(f"{k}={v}" for k, v in key) or "—"
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ SYSTEM PERFORMANCE</div>", unsafe_allow_html=True)
+
+    if st.toggle("Live refresh", value=True, key="sysperf_live"):
+        st_autorefresh(interval=2000, key="sysperf_refresh")
+
+    # Everything below comes from the in-process registry (utils/metrics.py),
+    # the same data the Prometheus endpoint serves
+    collected = {name: (kind, series) for name, kind, _, series in REGISTRY.collect()}
+    total     = lambda name: sum(collected.get(name, (None, {}))[1].values())
+
+    # Rates are counter deltas since this session's previous refresh
+    now    = time.time()
+    counts = {name: total(name) for name, (kind, _) in collected.items() if kind == "counter"}
+    prev_t, prev = st.session_state.get("sysperf_prev", (None, {}))
+    st.session_state.sysperf_prev = (now, counts)
+    rate = lambda name: (f"{(counts.get(name, 0) - prev.get(name, 0)) / (now - prev_t):.1f}"
+                         if prev_t and now > prev_t else "—")
+
+    queued  = total("mqtt_queue_depth") + total("writer_queue_depth")
+    dropped = (total("mqtt_queue_dropped_total") + total("writer_dropped_total")
+               + total("writer_errors_total"))
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("📡 MQTT Msgs/sec",   rate("mqtt_messages_total"))
+    c2.metric("🚫 Rejected Msgs",   f"{total('mqtt_rejected_total'):.0f}")
+    c3.metric("⏳ Queued",          f"{queued:.0f}")
+    c4.metric("⚠ Dropped",         f"{dropped:.0f}")
+
+    st.subheader("Timings")
+    rows = []
+    for name, (kind, series) in collected.items():
+        if kind != "histogram":
+            continue
+        histogram = REGISTRY.histogram(name)
+        for key, s in series.items():
+            rows.append({"Timer": name.removesuffix("_seconds"), "Labels": _label_text(key),
+                         "Count": s["count"], "Mean (ms)": s["sum"] / s["count"] * 1000,
+                         **{f"p{q} (ms)": histogram.quantile(s["buckets"], q / 100, s["max"]) * 1000
+                            for q in (50, 95, 99)},
+                         "Max (ms)": s["max"] * 1000})
+    if rows:
+        timings = pd.DataFrame(rows).sort_values(["Timer", "Labels"])
+        st.dataframe(timings.round(3), use_container_width=True, hide_index=True)
+        st.bar_chart(timings.set_index(timings["Timer"] + " " + timings["Labels"])[["p95 (ms)"]])
+    else:
+        st.info("Nothing timed yet.")
+
+    st.subheader("Writers")
+    writers = {}
+    for name in ("writer_queue_depth", "writer_rows_total", "writer_dropped_total", "writer_errors_total"):
+        for key, value in collected.get(name, (None, {}))[1].items():
+            writers.setdefault(dict(key)["writer"], {})[name.removeprefix("writer_")] = int(value)
+    if writers:
+        st.dataframe(pd.DataFrame.from_dict(writers, orient="index").rename_axis("Writer"),
+                     use_container_width=True)
+
+    st.subheader("Prometheus Endpoint")
+    if not METRICS_PORT:
+        st.info("Disabled (METRICS_PORT=0).")
+    else:
+        try:
+            server = get_metrics_server()
+            st.caption(f"Serving http://{server.server_address[0]}:{server.server_address[1]}/metrics")
+        except OSError as e:
+            st.warning(f"Could not listen on port {METRICS_PORT}: {e}")
+    with st.expander("Exposition text"):
+        st.code(REGISTRY.prometheus(), language="text")
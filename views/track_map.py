@@ -0,0 +1,120 @@
+import random
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+import streamlit as st
+from streamlit_folium import st_folium
+
+from utils.metrics import REGISTRY
+from utils.pods import generate_pods, move_pods
+from utils.services import (SIM_TRACK_CENTER, WEATHER_API, api_key, get_fleet_state, get_geocoder,
+                            get_http_client, get_sim_loop, get_track)
+from utils.track import TrackIndex
+from utils.trackmap import build_base_map, build_pod_layer
+
+FOLIUM_TIME = REGISTRY.histogram("folium_build_seconds", "Folium map / pod layer build")
+
+SOURCES = ["Live fleet", "Demo pods"]
+
+
+def geocode_city(city, api_key):
+    # None only when the API says the city doesn't exist; other failures
+    # (including a reply without coordinates) raise so they aren't cached
+    # as negative lookups
+    response = get_http_client().get(f"{WEATHER_API}/data/2.5/weather", {"q": city, "appid": api_key})
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    data = response.json()
+    return {"latitude": data["coord"]["lat"], "longitude": data["coord"]["lon"], "name": city}
+
+
+def get_pod_data(city, api_key):
+    if not city.strip():
+        return None
+    try:
+        return get_geocoder().lookup(city, lambda name: geocode_city(name, api_key))
+    except (requests.RequestException, KeyError, TypeError, ValueError):
+        return None
+
+
+def fleet_pods(fleet, track):
+    # Pods of a fleet snapshot that have a position on `track` (the
+    # simulated fleet; MQTT pods report no chainage), as map pod dicts
+    rows     = np.flatnonzero(~np.isnan(fleet.values["chainage"]))
+    chainage = fleet.values["chainage"][rows]
+    lat, lon = track.position(chainage)
+    ids      = fleet.ids
+    return [{"id": ids[row], "status": fleet.statuses[code], "speed": round(speed),
+             "battery": battery, "chainage": ch, "latitude": la, "longitude": lo}
+            for row, code, speed, battery, ch, la, lo in zip(
+                rows.tolist(), fleet.status[rows].tolist(), fleet.values["speed"][rows].tolist(),
+                fleet.values["battery"][rows].tolist(), chainage.tolist(), lat.tolist(), lon.tolist())]
+
+
+def show_map(center, track, pods):
+    # The base map hashes the same on every rerun for a city, so st_folium
+    # keeps it mounted and only swaps the pod layer.
+    with FOLIUM_TIME.time(layer="base"):
+        base_map = build_base_map(center, track)
+    with FOLIUM_TIME.time(layer="pods"):
+        pod_layer = build_pod_layer(pods)
+    st_folium(base_map, key="track_map", width=900, height=550,
+              feature_group_to_add=pod_layer, returned_objects=[])
+
+    speed = [pod["speed"] for pod in pods]
+    index = TrackIndex(track).update([pod["chainage"] for pod in pods])
+    ahead = [index.ahead(i)[0] for i in range(len(pods))]
+    st.subheader(f"Headways · {track.length / 1000:.1f} km loop")
+    st.dataframe(pd.DataFrame({
+        "Pod":          [pod["id"] for pod in pods],
+        "Chainage (m)": [round(pod["chainage"]) for pod in pods],
+        "Ahead":        [pods[i]["id"] if i is not None else "—" for i in ahead],
+        "Headway (m)":  index.headways().round(),
+        "Margin (m)":   index.margins(speed).round(),
+    }).sort_values("Chainage (m)"), use_container_width=True, hide_index=True)
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ LIVE TRACK MAP</div>", unsafe_allow_html=True)
+
+    if st.radio("Pods", SOURCES, horizontal=True) == "Live fleet":
+        # The shared fleet snapshot, the same state Overview and Pod Tracker
+        # show; a rerun picks up the newest one
+        get_sim_loop()
+        fleet = get_fleet_state().snapshot()
+        track = get_track(SIM_TRACK_CENTER)
+        pods  = fleet_pods(fleet, track)
+        st.button("⟳ Refresh Fleet")
+        st.caption(f"{len(pods)} simulated pods · fleet state #{fleet.seq} at "
+                   f"{time.strftime('%H:%M:%S', time.localtime(fleet.taken))}")
+        show_map(list(SIM_TRACK_CENTER), track, pods)
+        return
+
+    city     = st.text_input("City", "Chengalpattu")
+    pod_info = get_pod_data(city, api_key)
+
+    if "current_city" not in st.session_state:
+        st.session_state.current_city = city
+
+    if not pod_info:
+        st.error("City not found or API error.")
+        st.stop()
+
+    track = get_track((pod_info["latitude"], pod_info["longitude"]))
+
+    if st.session_state.current_city != city or not st.session_state.pods:
+        st.session_state.pods         = generate_pods(track=track)
+        st.session_state.current_city = city
+        st.session_state.last_update  = time.time()
+
+    if st.button("⟳ Update Pod Positions"):
+        move_pods(st.session_state.pods, track, seconds=random.uniform(1, 3))
+        for pod in st.session_state.pods:
+            pod["battery"] = max(pod["battery"] - random.uniform(1, 3), 0)
+        st.session_state.last_update = time.time()
+
+    show_map([pod_info["latitude"], pod_info["longitude"]], track, st.session_state.pods)
+
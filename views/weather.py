@@ -0,0 +1,55 @@
+import pandas as pd
+import streamlit as st
+from datetime import datetime
+
+from utils.services import (ROUTE_STATIONS, api_key, fetch_route_weather, fetch_weather,
+                            get_weather_grid)
+from utils.weather_grid import MAX_LIMIT, speed_limit
+
+
+def render():
+    st.markdown("<div class='page-title'>◈ WEATHER MONITORING</div>", unsafe_allow_html=True)
+
+    city = st.text_input("City", "Chengalpattu")
+    if st.button("Fetch Weather"):
+        data = fetch_weather(city, api_key)
+        if data:
+            temp    = data["main"]["temp"]
+            weather = data["weather"][0]["description"]
+            st.metric("Temperature (°C)", temp)
+            st.write("Condition:", weather)
+            limit = speed_limit(data)
+            if limit < MAX_LIMIT:
+                st.warning(f"Suggested Speed Limit: {limit} km/h")
+            else:
+                st.success(f"Suggested Speed Limit: {limit} km/h")
+        else:
+            st.error("Weather fetch failed.")
+
+    st.subheader("Route Stations")
+    route = fetch_route_weather(ROUTE_STATIONS, api_key)
+    st.dataframe(pd.DataFrame([
+        {"Station":      city,
+         "Temp (°C)":    data["main"]["temp"] if data else None,
+         "Condition":    data["weather"][0]["description"] if data else "unavailable",
+         "Limit (km/h)": speed_limit(data) if data else None}
+        for (_, city), data in route.items()
+    ]), use_container_width=True, hide_index=True)
+
+    st.subheader("Track Speed Profile")
+    grid    = get_weather_grid()
+    profile = grid.profile
+    if grid.last_refresh is None:
+        st.info("Waiting for the first weather grid refresh…")
+    else:
+        st.caption(f"{len(grid.waypoints)} waypoints every {grid.waypoints[1] / 1000:.1f} km · "
+                   f"refreshed {datetime.fromtimestamp(grid.last_refresh):%H:%M:%S} "
+                   f"in {grid.last_duration * 1000:.0f} ms")
+    st.line_chart(pd.DataFrame({"Chainage (km)": profile.centers / 1000,
+                                "Limit (km/h)":  profile.limits}).set_index("Chainage (km)"))
+    st.dataframe(pd.DataFrame({
+        "Chainage (km)": (grid.waypoints / 1000).round(1),
+        "Condition":     [r["weather"][0]["description"] if r else "unavailable" for r in grid.readings],
+        "Wind (m/s)":    [r.get("wind", {}).get("speed") if r else None for r in grid.readings],
+        "Limit (km/h)":  [speed_limit(r) if r else None for r in grid.readings],
+    }), use_container_width=True, hide_index=True)